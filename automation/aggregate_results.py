@@ -0,0 +1,346 @@
+"""
+Incremental Results Aggregator.
+
+Builds the aggregated datasets from per-run analysis_results.json files:
+    - data/raw_data.csv: one row per experiment run
+    - data/summary_by_config.csv: one row per model/strategy/context configuration
+
+An index (data/.aggregation_index.json) records the mtime, size and content
+hash of every analysis file together with its extracted row. On the next run
+only files whose mtime or size changed are opened; files that were touched but
+whose content hash is unchanged reuse the cached row. Adding N new runs to the
+corpus therefore costs N file reads.
+
+Usage:
+    cd automation
+    python aggregate_results.py --results-dir cli_results --output-dir data
+    python aggregate_results.py --results-dir cli_results --full
+"""
+
+import csv
+import json
+import hashlib
+import logging
+import statistics
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_FILE_NAME = ".aggregation_index.json"
+RAW_DATA_FILE_NAME = "raw_data.csv"
+SUMMARY_FILE_NAME = "summary_by_config.csv"
+
+ID_COLUMNS = ['model', 'strategy', 'context', 'run', 'run_path', 'timestamp']
+
+METRIC_COLUMNS = [
+    'statement_coverage', 'branch_coverage', 'missing_statements', 'total_statements',
+    'mutation_score', 'mutants_killed', 'mutants_survived', 'total_mutants',
+    'compilation_success_rate', 'execution_success_rate',
+    'tests_generated', 'tests_passed', 'tests_failed', 'test_success_rate',
+    'response_time', 'total_test_methods', 'total_assertions', 'avg_assertions_per_test',
+    'methods_tested_count', 'total_methods', 'method_coverage_rate',
+    'duplicate_tests_found', 'assertion_quality_score', 'weak_assertions_count',
+    'strong_assertions_count', 'exception_quality_score', 'exception_tests_count',
+    'independence_score', 'naming_quality_score', 'average_name_length',
+    'smell_score', 'total_smells_found', 'overall_quality_score'
+]
+
+# Metrics reported per configuration in summary_by_config.csv
+SUMMARY_METRICS = [
+    'statement_coverage', 'branch_coverage', 'mutation_score', 'test_success_rate',
+    'tests_generated', 'response_time', 'total_assertions', 'assertion_quality_score',
+    'exception_quality_score', 'naming_quality_score', 'smell_score', 'overall_quality_score'
+]
+
+CONFIG_COLUMNS = ['model', 'strategy', 'context']
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file's content."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def parse_run_path(rel_path: Path) -> Dict[str, str]:
+    """
+    Derive configuration identifiers from a run directory path.
+
+    Supports both the multi-run layout (strategy/context/model/run_NNN)
+    and the legacy layout without run directories (strategy/context/model).
+    """
+    parts = rel_path.parts
+    run = ''
+    if parts and parts[-1].startswith('run_'):
+        run = parts[-1].replace('run_', '')
+        parts = parts[:-1]
+
+    strategy, context, model = parts[-3:] if len(parts) >= 3 else ('', '', '')
+    return {'strategy': strategy, 'context': context, 'model': model, 'run': run}
+
+
+def extract_row(analysis: Dict[str, Any], rel_dir: Path) -> Dict[str, Any]:
+    """Build a raw_data.csv row from a parsed analysis_results.json."""
+    summary = analysis.get('summary') or {}
+    ids = parse_run_path(rel_dir)
+
+    row = {
+        'model': summary.get('model') or ids['model'],
+        'strategy': summary.get('strategy') or ids['strategy'],
+        'context': summary.get('context_type') or ids['context'],
+        'run': ids['run'],
+        'run_path': rel_dir.as_posix(),
+        'timestamp': summary.get('timestamp', ''),
+    }
+    for column in METRIC_COLUMNS:
+        row[column] = summary.get(column, '')
+    return row
+
+
+class ResultsAggregator:
+    """
+    Incrementally aggregates per-run analysis results into CSV datasets.
+
+    Args:
+        results_dir: Root of the results tree (e.g. cli_results)
+        output_dir: Directory receiving the CSV files and the index
+    """
+
+    def __init__(self, results_dir="cli_results", output_dir="data"):
+        self.results_dir = Path(results_dir)
+        self.output_dir = Path(output_dir)
+        self.index_file = self.output_dir / INDEX_FILE_NAME
+        self.raw_data_file = self.output_dir / RAW_DATA_FILE_NAME
+        self.summary_file = self.output_dir / SUMMARY_FILE_NAME
+        self.index: Dict[str, Dict[str, Any]] = {}
+        self.stats = {'total': 0, 'reused': 0, 'rehashed': 0, 'parsed': 0, 'removed': 0, 'errors': 0}
+
+    def load_index(self) -> None:
+        """Load the aggregation index, discarding it if incompatible."""
+        self.index = {}
+        if not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION and data.get('results_dir') == self.results_dir.as_posix():
+                self.index = data.get('runs', {})
+            else:
+                logger.info("Aggregation index is stale - rebuilding from scratch")
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Failed to read aggregation index: %s - rebuilding", e)
+
+    def save_index(self) -> None:
+        """Write the aggregation index atomically."""
+        data = {
+            'version': INDEX_VERSION,
+            'results_dir': self.results_dir.as_posix(),
+            'runs': self.index
+        }
+        tmp_file = self.index_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        tmp_file.replace(self.index_file)
+
+    def _refresh_entry(self, analysis_file: Path, rel_key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Return the up-to-date index entry for one analysis file.
+
+        Returns:
+            Tuple of (entry or None on error, whether the entry changed)
+        """
+        stat = analysis_file.stat()
+        entry = self.index.get(rel_key)
+
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.stats['reused'] += 1
+            return entry, False
+
+        content = analysis_file.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+
+        if entry and entry['sha256'] == digest:
+            self.stats['rehashed'] += 1
+            entry.update({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size})
+            return entry, True
+
+        try:
+            analysis = json.loads(content.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning("Skipping unreadable %s: %s", analysis_file, e)
+            self.stats['errors'] += 1
+            return None, False
+
+        self.stats['parsed'] += 1
+        return {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'row': extract_row(analysis, Path(rel_key).parent)
+        }, True
+
+    def refresh(self) -> bool:
+        """
+        Bring the index in sync with the results tree.
+
+        Returns:
+            True if any run was added, changed or removed
+        """
+        changed = False
+        seen = set()
+
+        for analysis_file in sorted(self.results_dir.rglob("analysis_results.json")):
+            rel_key = analysis_file.relative_to(self.results_dir).as_posix()
+            seen.add(rel_key)
+            self.stats['total'] += 1
+
+            entry, entry_changed = self._refresh_entry(analysis_file, rel_key)
+            if entry is None:
+                if self.index.pop(rel_key, None) is not None:
+                    changed = True
+                continue
+
+            if entry_changed:
+                self.index[rel_key] = entry
+                changed = True
+
+        for rel_key in list(self.index):
+            if rel_key not in seen:
+                del self.index[rel_key]
+                self.stats['removed'] += 1
+                changed = True
+
+        return changed
+
+    def get_rows(self) -> List[Dict[str, Any]]:
+        """Return raw rows sorted by strategy, context, model and run."""
+        rows = [entry['row'] for entry in self.index.values()]
+        return sorted(rows, key=lambda r: (r['strategy'], r['context'], r['model'], r['run']))
+
+    def write_raw_data(self, rows: List[Dict[str, Any]]) -> None:
+        """Write one row per run to raw_data.csv."""
+        with open(self.raw_data_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=ID_COLUMNS + METRIC_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def write_summary(self, rows: List[Dict[str, Any]]) -> None:
+        """Write per-configuration mean/std/median of SUMMARY_METRICS."""
+        summary_rows = summarize_by_config(rows)
+        fieldnames = CONFIG_COLUMNS + ['runs']
+        for metric in SUMMARY_METRICS:
+            fieldnames += [f'{metric}_mean', f'{metric}_std', f'{metric}_median']
+
+        with open(self.summary_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(summary_rows)
+
+    def run(self, full: bool = False) -> Dict[str, int]:
+        """
+        Aggregate results, re-reading only new or changed runs.
+
+        Args:
+            full: Ignore the index and re-read every run
+
+        Returns:
+            Counters describing the work performed
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        if not full:
+            self.load_index()
+
+        changed = self.refresh()
+        outputs_missing = not self.raw_data_file.exists() or not self.summary_file.exists()
+
+        if changed or outputs_missing or full:
+            rows = self.get_rows()
+            self.write_raw_data(rows)
+            self.write_summary(rows)
+            self.save_index()
+            logger.info("Wrote %d rows to %s", len(rows), self.raw_data_file)
+        else:
+            logger.info("No changes detected - aggregated data is up to date")
+
+        logger.info(
+            "Runs: %d total, %d reused, %d rehashed, %d parsed, %d removed, %d errors",
+            self.stats['total'], self.stats['reused'], self.stats['rehashed'],
+            self.stats['parsed'], self.stats['removed'], self.stats['errors']
+        )
+        return dict(self.stats)
+
+
+def _to_float(value) -> Optional[float]:
+    """Convert a CSV/summary value to float, or None if missing."""
+    if value in ('', None):
+        return None
+    if isinstance(value, bool):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def summarize_by_config(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Group rows by model/strategy/context and compute mean, std and median."""
+    groups: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+    for row in rows:
+        key = (row['model'], row['strategy'], row['context'])
+        groups.setdefault(key, []).append(row)
+
+    summary_rows = []
+    for (model, strategy, context), group in sorted(groups.items()):
+        summary = {'model': model, 'strategy': strategy, 'context': context, 'runs': len(group)}
+        for metric in SUMMARY_METRICS:
+            values = [v for v in (_to_float(r.get(metric)) for r in group) if v is not None]
+            if values:
+                summary[f'{metric}_mean'] = round(statistics.fmean(values), 2)
+                summary[f'{metric}_std'] = round(statistics.stdev(values), 2) if len(values) > 1 else 0.0
+                summary[f'{metric}_median'] = round(statistics.median(values), 2)
+            else:
+                summary[f'{metric}_mean'] = ''
+                summary[f'{metric}_std'] = ''
+                summary[f'{metric}_median'] = ''
+        summary_rows.append(summary)
+
+    return summary_rows
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Aggregate per-run analysis results into raw_data.csv and summary_by_config.csv',
+        epilog='''
+Examples:
+  # Incremental update (only new or changed runs are read)
+  python aggregate_results.py --results-dir cli_results --output-dir data
+
+  # Rebuild everything from scratch
+  python aggregate_results.py --results-dir cli_results --full
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--results-dir', default='cli_results',
+                        help='Results directory to aggregate (default: cli_results)')
+    parser.add_argument('--output-dir', default='data',
+                        help='Directory for aggregated CSV files (default: data)')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the index and re-read every run')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    results_dir = Path(args.results_dir)
+    if not results_dir.exists():
+        logger.error("Results directory not found: %s", results_dir)
+        return 1
+
+    ResultsAggregator(results_dir, args.output_dir).run(full=args.full)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,321 @@
+"""
+Content-Addressed Blob Store for Experiment Results.
+
+Every run directory holds its own copy of the class under test, the generated
+test suites and the raw LLM responses. This module deduplicates that content
+into a store kept next to the results tree (<results_dir>/.blobs):
+
+    - files/: uncompressed objects for *.py files (source copy, tests.py,
+      mutmut_test.py). Run directories keep hard links to them, so unittest,
+      coverage and mutmut see ordinary, writable files; writers replace a
+      linked file (detach_file) instead of writing through the shared inode.
+    - objects/: zlib-compressed objects for large strings in
+      experiment_results.json (responses, prompts). The JSON keeps a
+      {"$blob": "<sha256>"} reference that load_experiment_results() resolves.
+
+Packing is optional and fully reversible with the unpack command.
+
+Usage:
+    cd automation
+    python blob_store.py pack --results-dir cli_results
+    python blob_store.py stats --results-dir cli_results
+    python blob_store.py unpack --results-dir cli_results
+"""
+
+import os
+import json
+import zlib
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+STORE_DIR_NAME = ".blobs"
+BLOB_REF_KEY = "$blob"
+EXPERIMENT_FILE_NAME = "experiment_results.json"
+
+# Strings shorter than this stay inline in experiment_results.json
+MIN_BLOB_SIZE = 1024
+
+
+class BlobStore:
+    """
+    Content-addressed storage keyed by SHA-256 of the uncompressed content.
+
+    Args:
+        root: Store directory (created on demand)
+        compression_level: zlib level for compressed objects
+    """
+
+    def __init__(self, root: Path, compression_level: int = 9):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.files_dir = self.root / "files"
+        self.compression_level = compression_level
+
+    @classmethod
+    def for_results_dir(cls, results_dir) -> 'BlobStore':
+        """Return the store that belongs to a results tree."""
+        return cls(Path(results_dir) / STORE_DIR_NAME)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """Return the content address of a byte string."""
+        return hashlib.sha256(data).hexdigest()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _file_path(self, digest: str, suffix: str = "") -> Path:
+        return self.files_dir / digest[:2] / f"{digest[2:]}{suffix}"
+
+    def put(self, data: bytes) -> str:
+        """Store data compressed and return its digest."""
+        digest = self.digest(data)
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_bytes(zlib.compress(data, self.compression_level))
+            tmp_path.replace(path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the uncompressed content of a stored object."""
+        path = self._object_path(digest)
+        if not path.exists():
+            raise KeyError(f"Blob not found: {digest}")
+        return zlib.decompress(path.read_bytes())
+
+    def put_text(self, text: str) -> str:
+        return self.put(text.encode('utf-8'))
+
+    def get_text(self, digest: str) -> str:
+        return self.get(digest).decode('utf-8')
+
+    def link_file(self, path: Path) -> bool:
+        """
+        Replace a file with a hard link to its deduplicated store copy.
+
+        Returns:
+            True if the file was replaced, False if it was already linked
+        """
+        data = path.read_bytes()
+        store_path = self._file_path(self.digest(data), path.suffix)
+
+        if store_path.exists():
+            if os.path.samefile(store_path, path):
+                return False
+        else:
+            store_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = store_path.with_name(store_path.name + '.tmp')
+            shutil.copy2(path, tmp_path)
+            tmp_path.replace(store_path)
+
+        tmp_link = path.with_name(path.name + '.blobtmp')
+        if tmp_link.exists():
+            tmp_link.unlink()
+        os.link(store_path, tmp_link)
+        tmp_link.replace(path)
+        return True
+
+    def collect_garbage(self) -> int:
+        """Remove file objects no longer linked from any run directory."""
+        removed = 0
+        if not self.files_dir.exists():
+            return removed
+        for store_path in self.files_dir.rglob("*"):
+            if store_path.is_file() and store_path.stat().st_nlink == 1:
+                store_path.unlink()
+                removed += 1
+        return removed
+
+
+def detach_file(path: Path) -> None:
+    """
+    Break a hard link to the blob store before a file is rewritten.
+
+    Writing through a shared hard link would silently modify the store copy
+    and every other run linked to it, so writers unlink the path first.
+    """
+    path = Path(path)
+    if path.exists() and path.stat().st_nlink > 1:
+        path.unlink()
+
+
+def _externalize(value: Any, store: BlobStore) -> Any:
+    """Replace large strings in a JSON value with blob references."""
+    if isinstance(value, str) and len(value) >= MIN_BLOB_SIZE:
+        return {BLOB_REF_KEY: store.put_text(value)}
+    if isinstance(value, dict):
+        return {k: _externalize(v, store) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_externalize(v, store) for v in value]
+    return value
+
+
+def _resolve(value: Any, store: BlobStore) -> Any:
+    """Replace blob references in a JSON value with their content."""
+    if isinstance(value, dict):
+        if len(value) == 1 and BLOB_REF_KEY in value:
+            return store.get_text(value[BLOB_REF_KEY])
+        return {k: _resolve(v, store) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve(v, store) for v in value]
+    return value
+
+
+def _find_store(run_dir: Path) -> Optional[BlobStore]:
+    """Locate the blob store of the results tree containing run_dir."""
+    for parent in [run_dir] + list(run_dir.parents):
+        if (parent / STORE_DIR_NAME).is_dir():
+            return BlobStore(parent / STORE_DIR_NAME)
+    return None
+
+
+def load_experiment_results(run_dir, store: Optional[BlobStore] = None) -> Dict[str, Any]:
+    """
+    Load experiment_results.json with blob references resolved.
+
+    Works for both packed and unpacked run directories.
+    """
+    run_dir = Path(run_dir)
+    with open(run_dir / EXPERIMENT_FILE_NAME, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if 'raw_results' not in data:
+        return data
+
+    if store is None:
+        store = _find_store(run_dir.resolve())
+    if store is None:
+        return data
+
+    data['raw_results'] = _resolve(data['raw_results'], store)
+    return data
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp_path.replace(path)
+
+
+def pack_run(run_dir: Path, store: BlobStore) -> Dict[str, int]:
+    """Move the duplicated content of one run directory into the store."""
+    stats = {'linked_files': 0, 'externalized_json': 0}
+
+    for py_file in run_dir.glob("*.py"):
+        if store.link_file(py_file):
+            stats['linked_files'] += 1
+
+    experiment_file = run_dir / EXPERIMENT_FILE_NAME
+    if experiment_file.exists():
+        with open(experiment_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        packed = _externalize(data.get('raw_results'), store)
+        if packed != data.get('raw_results'):
+            data['raw_results'] = packed
+            _write_json(experiment_file, data)
+            stats['externalized_json'] += 1
+
+    return stats
+
+
+def unpack_run(run_dir: Path, store: BlobStore) -> None:
+    """Restore private file copies and inline JSON content for one run."""
+    for py_file in run_dir.glob("*.py"):
+        if py_file.stat().st_nlink > 1:
+            content = py_file.read_bytes()
+            py_file.unlink()
+            py_file.write_bytes(content)
+
+    experiment_file = run_dir / EXPERIMENT_FILE_NAME
+    if experiment_file.exists():
+        _write_json(experiment_file, load_experiment_results(run_dir, store))
+
+
+def _iter_run_dirs(results_dir: Path):
+    for experiment_file in sorted(results_dir.rglob(EXPERIMENT_FILE_NAME)):
+        if STORE_DIR_NAME not in experiment_file.parts:
+            yield experiment_file.parent
+
+
+def _tree_size(path: Path) -> int:
+    """Size of a tree counting each inode once."""
+    seen = set()
+    total = 0
+    for file in path.rglob("*"):
+        if file.is_file():
+            stat = file.stat()
+            if (stat.st_dev, stat.st_ino) not in seen:
+                seen.add((stat.st_dev, stat.st_ino))
+                total += stat.st_size
+    return total
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Deduplicate and compress experiment results into a content-addressed store',
+        epilog='''
+Examples:
+  # Pack all runs (hard links for *.py, compressed blobs for responses)
+  python blob_store.py pack --results-dir cli_results
+
+  # Show disk usage of the results tree
+  python blob_store.py stats --results-dir cli_results
+
+  # Restore plain run directories
+  python blob_store.py unpack --results-dir cli_results
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['pack', 'unpack', 'stats', 'gc'])
+    parser.add_argument('--results-dir', default='cli_results',
+                        help='Results directory (default: cli_results)')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    results_dir = Path(args.results_dir)
+    if not results_dir.exists():
+        logger.error("Results directory not found: %s", results_dir)
+        return 1
+
+    store = BlobStore.for_results_dir(results_dir)
+
+    if args.command == 'pack':
+        totals = {'runs': 0, 'linked_files': 0, 'externalized_json': 0}
+        for run_dir in _iter_run_dirs(results_dir):
+            stats = pack_run(run_dir, store)
+            totals['runs'] += 1
+            totals['linked_files'] += stats['linked_files']
+            totals['externalized_json'] += stats['externalized_json']
+        logger.info("Packed %d runs: %d files linked, %d experiment files externalized",
+                    totals['runs'], totals['linked_files'], totals['externalized_json'])
+
+    elif args.command == 'unpack':
+        count = 0
+        for run_dir in _iter_run_dirs(results_dir):
+            unpack_run(run_dir, store)
+            count += 1
+        logger.info("Unpacked %d runs", count)
+
+    elif args.command == 'gc':
+        logger.info("Removed %d unreferenced file objects", store.collect_garbage())
+
+    print(f"Results tree size (unique inodes): {_tree_size(results_dir) / 1024 / 1024:.1f} MB")
+    if store.root.exists():
+        print(f"Blob store size: {_tree_size(store.root) / 1024 / 1024:.1f} MB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
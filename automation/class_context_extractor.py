@@ -14,13 +14,24 @@ The extractor also handles:
     - Helper type extraction (TypedDict, dataclass, Enum, NamedTuple)
     - Import statement generation
     - Base class detection
+
+Repeated extraction (Streamlit reruns, batches over one module) should go
+through load_class_context(), which caches the parsed tree, class info and
+all context renderings per (path, content hash, class name).
+
+Very large classes can be rendered within a ContextBudget (characters or
+estimated tokens) via extract_context_within_budget(), which drops private
+helper methods, then bodies of long methods, then docstrings.
 """
 
 import ast
 import re
+import hashlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set
-from dataclasses import dataclass
+from typing import Any, List, Dict, Optional, Tuple, Set, FrozenSet
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -55,6 +66,160 @@ class ContextLevel:
     ALL = [INTERFACE, INTERFACE_DOCSTRING, FULL_CONTEXT]
 
 
+# Rough characters-per-token ratio for source code
+CHARS_PER_TOKEN = 4
+
+# Methods longer than this (in lines) may have their bodies elided
+LONG_METHOD_LINES = 8
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+@dataclass
+class ContextBudget:
+    """
+    Size limit for a rendered context.
+
+    Attributes:
+        max_chars: Limit in characters
+        max_tokens: Limit in estimated tokens (CHARS_PER_TOKEN characters each)
+    """
+    max_chars: Optional[int] = None
+    max_tokens: Optional[int] = None
+
+    @property
+    def char_limit(self) -> Optional[int]:
+        limits = [limit for limit in (self.max_chars,
+                                      self.max_tokens * CHARS_PER_TOKEN if self.max_tokens else None)
+                  if limit]
+        return min(limits) if limits else None
+
+    def to_dict(self) -> Dict[str, Optional[int]]:
+        return {'max_chars': self.max_chars, 'max_tokens': self.max_tokens}
+
+
+@dataclass
+class ParsedClassContext:
+    """
+    Precomputed analysis of one class, as returned by load_class_context().
+
+    Attributes:
+        extractor: The extractor the renderings came from
+        tree: Parsed module AST (shared, must not be mutated)
+        info: Class information
+        contexts: Rendering per context level (see ContextLevel.ALL)
+        content_hash: SHA-256 of the source file content
+    """
+    extractor: 'ClassContextExtractor'
+    tree: ast.Module
+    info: ClassInfo
+    contexts: Dict[str, str] = field(default_factory=dict)
+    content_hash: str = ""
+
+
+# Process-wide caches: parsed modules by content hash and analysed classes by
+# (resolved path, content hash, requested class name)
+_CACHE_SIZE = 256
+_tree_cache: 'OrderedDict[str, ast.Module]' = OrderedDict()
+_class_cache: 'OrderedDict[Tuple[str, str, Optional[str]], ParsedClassContext]' = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: OrderedDict, key):
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key, value) -> None:
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _parse_source(content: str, content_hash: Optional[str] = None) -> ast.Module:
+    """Parse source, reusing the tree of identical content parsed before."""
+    content_hash = content_hash or _content_hash(content)
+    tree = _cache_get(_tree_cache, content_hash)
+    if tree is None:
+        tree = ast.parse(content)
+        _cache_put(_tree_cache, content_hash, tree)
+    return tree
+
+
+def load_class_context(source_file: Path, class_name: Optional[str] = None) -> ParsedClassContext:
+    """
+    Analyse a class and render all context levels, using the process-wide cache.
+
+    The file is re-read on every call, so edits are picked up through the
+    content hash; unchanged files never parse or render twice.
+
+    Args:
+        source_file: Path to the Python source file
+        class_name: Name of the class (optional, auto-detected if single class)
+
+    Returns:
+        ParsedClassContext for the class
+
+    Raises:
+        FileNotFoundError: If the source file doesn't exist
+        ValueError: If the file cannot be parsed or the class cannot be found
+    """
+    source_file = Path(source_file)
+    if not source_file.exists():
+        raise FileNotFoundError(f"Source file not found: {source_file}")
+
+    content = source_file.read_text(encoding='utf-8')
+    content_hash = _content_hash(content)
+    key = (str(source_file.resolve()), content_hash, class_name)
+
+    parsed = _cache_get(_class_cache, key)
+    if parsed is None:
+        extractor = ClassContextExtractor(source_file, class_name, source_content=content)
+        parsed = ParsedClassContext(
+            extractor=extractor,
+            tree=extractor.tree,
+            info=extractor.get_class_info(),
+            contexts={level: extractor.extract_context(level) for level in ContextLevel.ALL},
+            content_hash=content_hash,
+        )
+        _cache_put(_class_cache, key, parsed)
+    return parsed
+
+
+def discover_main_classes(source_file: Path) -> List[str]:
+    """
+    List the testable (non-helper) top-level classes of a source file.
+
+    Raises:
+        ValueError: If the file cannot be parsed
+    """
+    content = Path(source_file).read_text(encoding='utf-8')
+    try:
+        tree = _parse_source(content)
+    except SyntaxError as e:
+        raise ValueError(f"Failed to parse Python file: {e}")
+    return ClassContextExtractor.find_main_classes(tree)
+
+
+def clear_context_cache() -> None:
+    """Drop all cached trees and class analyses."""
+    with _cache_lock:
+        _tree_cache.clear()
+        _class_cache.clear()
+
+
 class ClassContextExtractor:
     """
     Extracts context from any Python class at different detail levels.
@@ -72,6 +237,7 @@ class ClassContextExtractor:
     Args:
         source_file: Path to the Python source file
         class_name: Name of the class to extract (optional, auto-detected if single class)
+        source_content: Already-read file content (optional, read from source_file otherwise)
 
     Raises:
         FileNotFoundError: If the source file doesn't exist
@@ -82,7 +248,8 @@ class ClassContextExtractor:
     HELPER_TYPE_DECORATORS = {'dataclass', 'dataclasses.dataclass'}
     HELPER_TYPE_BASES = {'TypedDict', 'NamedTuple', 'Enum', 'IntEnum', 'StrEnum', 'Flag', 'IntFlag'}
 
-    def __init__(self, source_file: Path, class_name: Optional[str] = None):
+    def __init__(self, source_file: Path, class_name: Optional[str] = None,
+                 source_content: Optional[str] = None):
         self.source_file = Path(source_file)
 
         if not self.source_file.exists():
@@ -91,11 +258,13 @@ class ClassContextExtractor:
         if not self.source_file.suffix == '.py':
             raise ValueError(f"Source file must be a Python file (.py): {self.source_file}")
 
-        self.source_content = self.source_file.read_text(encoding='utf-8')
+        if source_content is None:
+            source_content = self.source_file.read_text(encoding='utf-8')
+        self.source_content = source_content
         self.source_lines = self.source_content.split('\n')
 
         try:
-            self.tree = ast.parse(self.source_content)
+            self.tree = _parse_source(self.source_content)
         except SyntaxError as e:
             raise ValueError(f"Failed to parse Python file: {e}")
 
@@ -115,6 +284,9 @@ class ClassContextExtractor:
         self._helper_types: Dict[str, ast.ClassDef] = {}
         self._analyze_helper_types()
 
+        # Rendered contexts by level
+        self._contexts: Dict[str, str] = {}
+
     def _validate_class_exists(self) -> None:
         """Validate that the specified class exists in the file."""
         class_names = self._get_all_class_names()
@@ -140,18 +312,8 @@ class ClassContextExtractor:
         Raises:
             ValueError: If no classes or multiple main classes found
         """
-        all_classes = []
-        helper_classes = set()
-
-        for node in self.tree.body:
-            if isinstance(node, ast.ClassDef):
-                all_classes.append(node.name)
-
-                # Check if it's a helper type
-                if self._is_helper_type(node):
-                    helper_classes.add(node.name)
-
-        main_classes = [c for c in all_classes if c not in helper_classes]
+        all_classes = [node.name for node in self.tree.body if isinstance(node, ast.ClassDef)]
+        main_classes = self.find_main_classes(self.tree)
 
         if not main_classes:
             if all_classes:
@@ -170,33 +332,52 @@ class ClassContextExtractor:
 
         return main_classes[0]
 
-    def _is_helper_type(self, node: ast.ClassDef) -> bool:
+    @classmethod
+    def find_main_classes(cls, tree: ast.Module) -> List[str]:
+        """
+        List the top-level classes of a module that are not helper types.
+
+        Args:
+            tree: Parsed module
+
+        Returns:
+            Class names in definition order
+        """
+        return [
+            node.name for node in tree.body
+            if isinstance(node, ast.ClassDef) and not cls._is_helper_type(node)
+        ]
+
+    @classmethod
+    def _is_helper_type(cls, node: ast.ClassDef) -> bool:
         """Check if a class is a helper type (TypedDict, dataclass, etc.)."""
         # Check decorators
         for decorator in node.decorator_list:
-            dec_name = self._get_decorator_name(decorator)
-            if dec_name in self.HELPER_TYPE_DECORATORS:
+            dec_name = cls._get_decorator_name(decorator)
+            if dec_name in cls.HELPER_TYPE_DECORATORS:
                 return True
 
         # Check base classes
         for base in node.bases:
-            base_name = self._get_base_name(base)
-            if base_name in self.HELPER_TYPE_BASES:
+            base_name = cls._get_base_name(base)
+            if base_name in cls.HELPER_TYPE_BASES:
                 return True
 
         return False
 
-    def _get_decorator_name(self, decorator: ast.expr) -> str:
+    @classmethod
+    def _get_decorator_name(cls, decorator: ast.expr) -> str:
         """Extract decorator name from AST node."""
         if isinstance(decorator, ast.Name):
             return decorator.id
         elif isinstance(decorator, ast.Attribute):
-            return f"{self._get_base_name(decorator.value)}.{decorator.attr}"
+            return f"{cls._get_base_name(decorator.value)}.{decorator.attr}"
         elif isinstance(decorator, ast.Call):
-            return self._get_decorator_name(decorator.func)
+            return cls._get_decorator_name(decorator.func)
         return ""
 
-    def _get_base_name(self, base: ast.expr) -> str:
+    @staticmethod
+    def _get_base_name(base: ast.expr) -> str:
         """Extract base class name from AST node."""
         if isinstance(base, ast.Name):
             return base.id
@@ -204,7 +385,7 @@ class ClassContextExtractor:
             return base.attr
         elif isinstance(base, ast.Subscript):
             # Handle Generic[T], List[X], etc.
-            return self._get_base_name(base.value)
+            return ClassContextExtractor._get_base_name(base.value)
         return ""
 
     def _find_class_node(self, class_name: str) -> ast.ClassDef:
@@ -336,18 +517,173 @@ class ClassContextExtractor:
         Returns:
             Source code at the requested detail level
         """
+        if level in self._contexts:
+            return self._contexts[level]
+
         if level == ContextLevel.INTERFACE:
-            return self.extract_interface()
+            context = self.extract_interface()
         elif level == ContextLevel.INTERFACE_DOCSTRING:
-            return self.extract_interface_with_docstrings()
+            context = self.extract_interface_with_docstrings()
         elif level == ContextLevel.FULL_CONTEXT:
-            return self.extract_full_context()
+            context = self.extract_full_context()
         else:
             raise ValueError(
                 f"Unknown context level: {level}. "
                 f"Must be one of: {', '.join(ContextLevel.ALL)}"
             )
 
+        self._contexts[level] = context
+        return context
+
+    def extract_context_within_budget(self, level: str, budget: ContextBudget) -> Tuple[str, Dict[str, Any]]:
+        """
+        Extract context at the specified level, reduced to fit a budget.
+
+        Reductions are applied cumulatively until the rendering fits:
+            1. drop private helper methods (_name, not dunder)
+            2. elide bodies of long methods, longest first (full_context only)
+            3. strip docstrings
+
+        Args:
+            level: One of 'interface', 'interface_docstring', or 'full_context'
+            budget: Size limit
+
+        Returns:
+            Tuple of (context, report) where report records the budget, the
+            original and final size and the reductions applied
+        """
+        context = self.extract_context(level)
+        limit = budget.char_limit
+        report = {
+            'level': level,
+            'budget': budget.to_dict(),
+            'original_chars': len(context),
+            'reductions': [],
+        }
+
+        def over_budget() -> bool:
+            return limit is not None and len(context) > limit
+
+        drop_methods: FrozenSet[str] = frozenset()
+        stub_methods: Set[str] = set()
+
+        if over_budget():
+            private = self._private_method_names()
+            if private:
+                drop_methods = frozenset(private)
+                context = self._render(level, drop_methods, frozenset(), False)
+                report['reductions'].append({'step': 'drop_private_methods', 'methods': private})
+
+        if over_budget() and level == ContextLevel.FULL_CONTEXT:
+            for name in self._long_method_names(exclude=drop_methods):
+                stub_methods.add(name)
+                context = self._render(level, drop_methods, frozenset(stub_methods), False)
+                if not over_budget():
+                    break
+            if stub_methods:
+                report['reductions'].append({'step': 'elide_long_method_bodies',
+                                             'methods': sorted(stub_methods)})
+
+        if over_budget():
+            stripped = self._render(level, drop_methods, frozenset(stub_methods), True)
+            if stripped != context:
+                context = stripped
+                report['reductions'].append({'step': 'strip_docstrings'})
+
+        report.update({
+            'final_chars': len(context),
+            'estimated_tokens': estimate_tokens(context),
+            'within_budget': not over_budget(),
+        })
+        return context, report
+
+    def _private_method_names(self) -> List[str]:
+        """Names of private helper methods of the main class."""
+        return [
+            node.name for node in self.class_node.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name.startswith('_') and not node.name.endswith('__')
+        ]
+
+    def _long_method_names(self, exclude: FrozenSet[str] = frozenset()) -> List[str]:
+        """Methods longer than LONG_METHOD_LINES, longest first."""
+        methods = [
+            node for node in self.class_node.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name not in exclude
+            and node.end_lineno - node.lineno + 1 > LONG_METHOD_LINES
+        ]
+        methods.sort(key=lambda node: node.end_lineno - node.lineno, reverse=True)
+        return [node.name for node in methods]
+
+    def _render(self, level: str, drop_methods: FrozenSet[str], stub_methods: FrozenSet[str],
+                strip_docstrings: bool) -> str:
+        """Render a context level with methods dropped, bodies elided or docstrings stripped."""
+        parts = []
+
+        imports = self._extract_relevant_imports()
+        if imports:
+            parts.append(imports)
+
+        if level == ContextLevel.FULL_CONTEXT:
+            for name, source in self.get_helper_types():
+                if strip_docstrings:
+                    source = self._simplify_helper_type(self._helper_types[name], 'pass')
+                parts.append(source)
+            parts.append(self._trimmed_class_source(drop_methods, stub_methods, strip_docstrings))
+        else:
+            body_level = 'docstring' if level == ContextLevel.INTERFACE_DOCSTRING and not strip_docstrings else 'pass'
+            for name in self._helper_types:
+                parts.append(self._simplify_helper_type(self._helper_types[name], body_level))
+            parts.append(self._create_interface_class(body_level, drop_methods))
+
+        return '\n\n'.join(parts)
+
+    def _trimmed_class_source(self, drop_methods: FrozenSet[str], stub_methods: FrozenSet[str],
+                              strip_docstrings: bool) -> str:
+        """Original class source with line-level edits, preserving comments elsewhere."""
+        # (first line, last line, replacement lines), 1-based inclusive
+        edits: List[Tuple[int, int, List[str]]] = []
+
+        def docstring_node(node):
+            if node.body and isinstance(node.body[0], ast.Expr) and \
+                    isinstance(node.body[0].value, ast.Constant) and isinstance(node.body[0].value.value, str):
+                return node.body[0]
+            return None
+
+        class_doc = docstring_node(self.class_node)
+        if strip_docstrings and class_doc is not None and class_doc.lineno > self.class_node.lineno:
+            replacement = [] if len(self.class_node.body) > 1 else [' ' * class_doc.col_offset + 'pass']
+            edits.append((class_doc.lineno, class_doc.end_lineno, replacement))
+
+        for node in self.class_node.body:
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if node.name in drop_methods:
+                start = min([d.lineno for d in node.decorator_list] + [node.lineno])
+                edits.append((start, node.end_lineno, []))
+                continue
+
+            if node.body[0].lineno == node.lineno:
+                continue  # one-line method
+            indent = ' ' * node.body[0].col_offset
+            doc = docstring_node(node)
+
+            if node.name in stub_methods:
+                keep_doc = doc is not None and not strip_docstrings
+                body_start = node.body[0].lineno if not keep_doc else (
+                    node.body[1].lineno if len(node.body) > 1 else None)
+                if body_start is not None:
+                    edits.append((body_start, node.end_lineno, [indent + '...']))
+            elif strip_docstrings and doc is not None:
+                replacement = [] if len(node.body) > 1 else [indent + 'pass']
+                edits.append((doc.lineno, doc.end_lineno, replacement))
+
+        lines = self.source_lines[self.class_node.lineno - 1:self.class_node.end_lineno]
+        offset = self.class_node.lineno
+        for start, end, replacement in sorted(edits, reverse=True):
+            lines[start - offset:end - offset + 1] = replacement
+        return '\n'.join(lines)
+
     def extract_interface(self) -> str:
         """
         Extract only method signatures (body replaced with 'pass').
@@ -523,8 +859,8 @@ class ClassContextExtractor:
 
         return '\n'.join(lines)
 
-    def _create_interface_class(self, body_level: str) -> str:
-        """Create the class with interface-level methods."""
+    def _create_interface_class(self, body_level: str, skip_methods: FrozenSet[str] = frozenset()) -> str:
+        """Create the class with interface-level methods (except skip_methods)."""
         lines = []
 
         # Class definition line with decorators
@@ -547,6 +883,8 @@ class ClassContextExtractor:
         has_body = False
         for node in self.class_node.body:
             if isinstance(node, ast.FunctionDef):
+                if node.name in skip_methods:
+                    continue
                 method_code = self._create_interface_method(node, body_level)
                 lines.append('')
                 lines.append(method_code)
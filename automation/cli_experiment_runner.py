@@ -23,8 +23,10 @@ Usage:
 
     python cli_experiment_runner.py --config config.json
     python cli_experiment_runner.py --list-models
+    python cli_experiment_runner.py --model MODEL --strategy STRATEGY --context CONTEXT --events-file run.events.jsonl
 """
 
+import os
 import logging
 import json
 from pathlib import Path
@@ -37,6 +39,7 @@ from cli_automation import (
 
 from experiment_runner import ExperimentRunner
 from prompt_strategies import SimplePrompting, ChainOfThoughtPrompting
+from progress_events import ProgressEmitter, EVENTS_ENV_VAR
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +53,8 @@ class CLIExperimentRunner:
     - Universal mode (extractor provided): Uses any Python class
     """
 
-    def __init__(self, base_results_dir="cli_results", run_id=None, extractor=None):
+    def __init__(self, base_results_dir="cli_results", run_id=None, extractor=None, events_file=None,
+                 context_budget=None):
         """
         Initialize the CLI experiment runner.
 
@@ -58,11 +62,15 @@ class CLIExperimentRunner:
             base_results_dir: Directory for storing results
             run_id: Run identifier (number, "overwrite", or None for auto-increment)
             extractor: ClassContextExtractor for universal mode (None for legacy)
+            events_file: JSON-lines file for structured progress events (None to disable)
+            context_budget: ContextBudget limiting the class context (universal mode, optional)
         """
         self.base_results_dir = Path(base_results_dir)
         self.base_results_dir.mkdir(parents=True, exist_ok=True)
         self.run_id = run_id
         self.extractor = extractor
+        self.context_budget = context_budget
+        self.progress = ProgressEmitter(events_file)
 
         self.cli_clients = {
             # Claude Code models (newest first)
@@ -110,8 +118,16 @@ class CLIExperimentRunner:
             return base_path
 
         if self.run_id is None:
+            # Reserve the directory atomically so concurrent runners never share a run number
             next_run = self._get_next_run_id(base_path)
-            run_dir = base_path / f"run_{next_run:03d}"
+            base_path.mkdir(parents=True, exist_ok=True)
+            while True:
+                run_dir = base_path / f"run_{next_run:03d}"
+                try:
+                    run_dir.mkdir()
+                    break
+                except FileExistsError:
+                    next_run += 1
             logger.info(f"Using auto-incremented run: run_{next_run:03d}")
             return run_dir
 
@@ -137,6 +153,13 @@ class CLIExperimentRunner:
         result_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Results will be saved to: {result_dir}")
 
+        self.progress.emit('experiment_started', model=model_name, strategy=strategy_name,
+                           context=context_type, result_dir=str(result_dir))
+        result = self._execute_experiment(result_dir, model_name, strategy_name, context_type)
+        self.progress.emit('experiment_finished', success=result is not None, result_dir=str(result_dir))
+        return result
+
+    def _execute_experiment(self, result_dir: Path, model_name: str, strategy_name: str, context_type: str):
         try:
             client_factory = self.cli_clients[model_name]
 
@@ -145,21 +168,23 @@ class CLIExperimentRunner:
 
                 # Create strategy with extractor for universal mode
                 if strategy_name == "simple_prompting":
-                    strategy = SimplePrompting(extractor=self.extractor)
+                    strategy = SimplePrompting(extractor=self.extractor, context_budget=self.context_budget)
                 elif strategy_name == "chain_of_thought_prompting":
-                    strategy = ChainOfThoughtPrompting(extractor=self.extractor)
+                    strategy = ChainOfThoughtPrompting(extractor=self.extractor, context_budget=self.context_budget)
                 else:
                     raise ValueError(f"Unknown strategy: {strategy_name}")
 
                 logger.info(f"Executing {strategy_name} strategy...")
+                self.progress.stage_started('generation')
                 strategy_result = strategy.execute(client, context_type)
+                self.progress.stage_finished('generation', bool(strategy_result))
 
                 if not strategy_result:
                     logger.error("Strategy execution failed")
                     return None
 
                 # Create analysis runner with extractor for universal mode
-                analysis_runner = ExperimentRunner(extractor=self.extractor)
+                analysis_runner = ExperimentRunner(extractor=self.extractor, progress=self.progress)
 
                 experiment_data = analysis_runner.save_experiment_results(
                     result_dir,
@@ -276,6 +301,9 @@ Examples:
   # Universal mode - any class
   python cli_experiment_runner.py --source-file my_module.py --model claude-code-sonnet-4.5 --strategy simple_prompting --context full_context
 
+  # Universal mode with the class context limited to ~4000 tokens
+  python cli_experiment_runner.py --source-file big_module.py --context-budget 4000 --budget-unit tokens --model gemini-3-pro --strategy simple_prompting --context full_context
+
   # Universal mode with specific class name
   python cli_experiment_runner.py --source-file my_module.py --class-name MyClass --model claude-code-sonnet-4.5 --strategy simple_prompting --context interface
 
@@ -296,6 +324,9 @@ Examples:
                         help='Run identifier: number (e.g., 1), "overwrite", or omit for auto-increment')
     parser.add_argument('--results-dir', type=str, default='cli_results',
                         help='Directory for storing results (default: cli_results)')
+    parser.add_argument('--events-file', type=str, default=os.environ.get(EVENTS_ENV_VAR),
+                        help=f'Append structured progress events (JSON lines) to this file '
+                             f'(default: ${EVENTS_ENV_VAR} if set)')
 
     # Universal mode arguments
     parser.add_argument('--source-file', type=str, default=None,
@@ -304,6 +335,11 @@ Examples:
                         help='Name of the class to test (auto-detected if single class in file)')
     parser.add_argument('--legacy', action='store_true',
                         help='Force legacy mode even if --source-file is provided')
+    parser.add_argument('--context-budget', type=int, default=None,
+                        help='Maximum class context size (universal mode); larger contexts drop private '
+                             'methods, then long method bodies, then docstrings')
+    parser.add_argument('--budget-unit', choices=['chars', 'tokens'], default='chars',
+                        help='Unit of --context-budget (default: chars)')
 
     args = parser.parse_args()
 
@@ -332,15 +368,20 @@ Examples:
 
     # Create extractor for universal mode
     extractor = None
+    context_budget = None
     if args.source_file and not args.legacy:
         try:
-            from class_context_extractor import ClassContextExtractor
+            from class_context_extractor import ContextBudget, load_class_context
             source_path = Path(args.source_file)
             if not source_path.exists():
                 print(f"Error: Source file not found: {args.source_file}")
                 return
-            extractor = ClassContextExtractor(source_path, args.class_name)
-            info = extractor.get_class_info()
+            parsed = load_class_context(source_path, args.class_name)
+            extractor = parsed.extractor
+            info = parsed.info
+            if args.context_budget:
+                context_budget = (ContextBudget(max_tokens=args.context_budget) if args.budget_unit == 'tokens'
+                                  else ContextBudget(max_chars=args.context_budget))
             print(f"\n{'='*60}")
             print(f"Universal mode: {info.name}")
             print(f"Module: {info.module_name}")
@@ -358,7 +399,9 @@ Examples:
     runner = CLIExperimentRunner(
         base_results_dir=args.results_dir,
         run_id=run_id,
-        extractor=extractor
+        extractor=extractor,
+        events_file=args.events_file,
+        context_budget=context_budget
     )
 
     if args.list_models:
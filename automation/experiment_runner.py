@@ -15,14 +15,29 @@ import difflib
 from pathlib import Path
 from datetime import datetime
 import shutil
+import threading
+import time
+from contextlib import contextmanager
 from typing import Optional, TYPE_CHECKING
 
+from blob_store import detach_file
+from mutation_status import write_run_status
+from progress_events import ProgressEmitter
+
 if TYPE_CHECKING:
     from class_context_extractor import ClassContextExtractor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+MUTMUT_PROGRESS_PATTERN = re.compile(
+    r'(\d+)/(\d+)\s+🎉\s+(\d+)\s+🫥\s+(\d+)\s+⏰\s+(\d+)\s+🤔\s+(\d+)\s+🙁\s+(\d+)\s+🔇\s+(\d+)'
+)
+UNITTEST_RESULT_PATTERN = re.compile(r'^(test\w*) \(.*\) \.\.\. (ok|FAIL|ERROR|skipped|expected failure|unexpected success)')
+
+# Minimum seconds between two mutation progress events
+PROGRESS_EVENT_INTERVAL = 0.5
+
 
 class ExperimentRunner:
     """Runs analysis pipeline on LLM-generated tests."""
@@ -38,11 +53,13 @@ class ExperimentRunner:
     ]
 
     def __init__(self, base_results_dir="prompts_results",
-                 extractor: Optional['ClassContextExtractor'] = None):
+                 extractor: Optional['ClassContextExtractor'] = None,
+                 progress: Optional[ProgressEmitter] = None):
         """Initialize the experiment runner."""
         self.base_results_dir = Path(base_results_dir)
         self.current_experiment = None
         self.extractor = extractor
+        self.progress = progress or ProgressEmitter()
 
         if extractor is not None:
             info = extractor.get_class_info()
@@ -79,8 +96,10 @@ class ExperimentRunner:
             return None
 
         tests_file = result_dir / "tests.py"
+        detach_file(tests_file)
         tests_file.write_text(test_code)
 
+        detach_file(result_dir / f"{self.module_name}.py")
         if self.source_file is not None and self.source_file.exists():
             dest_file = result_dir / f"{self.module_name}.py"
             shutil.copy2(self.source_file, dest_file)
@@ -100,6 +119,7 @@ class ExperimentRunner:
                 logger.error("%s.py not found - tests will fail", self.module_name)
 
         mutmut_test_file = result_dir / "mutmut_test.py"
+        detach_file(mutmut_test_file)
         self.create_filtered_test_file(tests_file, mutmut_test_file)
 
         experiment_data = {
@@ -111,6 +131,8 @@ class ExperimentRunner:
             'test_file': str(tests_file),
             'raw_results': strategy_result
         }
+        if strategy_result.get('context_budget'):
+            experiment_data['context_budget'] = strategy_result['context_budget']
 
         results_file = result_dir / "experiment_results.json"
         with open(results_file, 'w', encoding='utf-8') as f:
@@ -453,24 +475,33 @@ class ExperimentRunner:
 
         analysis_results = {}
 
+        self.progress.stage_started('compilation')
         compilation_result = self.test_compilation_and_execution(tests_file)
         analysis_results['compilation'] = compilation_result
+        self.progress.stage_finished('compilation', compilation_result['compilation_success'])
 
         if not compilation_result['compilation_success']:
             logger.error("Tests do not compile")
 
         if compilation_result['compilation_success']:
+            self.progress.stage_started('coverage')
             coverage_results = self.run_coverage_analysis(result_dir, tests_file)
             analysis_results['coverage'] = coverage_results
+            self.progress.stage_finished('coverage', coverage_results is not None)
         else:
             analysis_results['coverage'] = None
+            self.progress.stage_finished('coverage', False)
 
         if compilation_result['compilation_success']:
+            self.progress.stage_started('mutation')
             mutation_results = self.run_mutation_testing(result_dir)
             analysis_results['mutation'] = mutation_results
+            self.progress.stage_finished('mutation', mutation_results is not None)
         else:
             analysis_results['mutation'] = None
+            self.progress.stage_finished('mutation', False)
 
+        self.progress.stage_started('scenarios')
         scenario_analysis = self.analyze_test_scenarios(tests_file)
         analysis_results['scenarios'] = scenario_analysis
 
@@ -478,6 +509,7 @@ class ExperimentRunner:
         analysis_results['summary'] = summary
 
         self.save_analysis_results(result_dir, analysis_results, experiment_data)
+        self.progress.stage_finished('scenarios')
 
         return analysis_results
 
@@ -586,18 +618,28 @@ class ExperimentRunner:
 
             test_src = result_dir / "mutmut_test.py"
             test_dst = mutants_dir / "tests" / "mutmut_test.py"
-            test_dst.parent.mkdir(exist_ok=True)
-            shutil.copy2(test_src, test_dst)
 
-            result = subprocess.run(
-                ['python', '-m', 'mutmut', 'run'],
-                cwd=mutants_dir, capture_output=True, text=True, timeout=600
-            )
+            # The mutants project is shared, so concurrent experiments take turns
+            with self._mutants_lock(mutants_dir):
+                test_dst.parent.mkdir(exist_ok=True)
+                # Contents only, so the mode of a file linked into a blob store is not carried over
+                shutil.copyfile(test_src, test_dst)
 
-            results_result = subprocess.run(
-                ['python', '-m', 'mutmut', 'results'],
-                cwd=mutants_dir, capture_output=True, text=True
-            )
+                self._run_mutmut(mutants_dir, timeout=600)
+
+                results_result = subprocess.run(
+                    ['python', '-m', 'mutmut', 'results'],
+                    cwd=mutants_dir, capture_output=True, text=True
+                )
+
+                try:
+                    source_name = f"{self.module_name}.py"
+                    write_run_status(
+                        result_dir, mutants_dir / "src" / source_name, results_result.stdout,
+                        meta_file=mutants_dir / "mutants" / "src" / f"{source_name}.meta"
+                    )
+                except Exception as e:
+                    logger.warning("Failed to write mutation status array: %s", e)
 
             mutmut_results_file = result_dir / "mutmut_results.txt"
             mutmut_results_file.write_text(results_result.stdout)
@@ -614,6 +656,72 @@ class ExperimentRunner:
             logger.error("Mutation testing failed: %s", e)
             return None
 
+    @staticmethod
+    @contextmanager
+    def _mutants_lock(mutants_dir):
+        """Hold an exclusive lock on the mutants project (POSIX only, like mutmut)."""
+        import fcntl
+
+        with open(mutants_dir / ".mutmut.lock", 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _run_mutmut(self, mutants_dir, timeout):
+        """
+        Run 'mutmut run', emitting mutation progress events while it runs.
+
+        mutmut redraws its progress line with carriage returns, so the output
+        is read incrementally and each new N/M count becomes one event
+        (throttled to PROGRESS_EVENT_INTERVAL).
+        """
+        cmd = ['python', '-m', 'mutmut', 'run']
+        if not self.progress.enabled:
+            return subprocess.run(cmd, cwd=mutants_dir, capture_output=True, text=True, timeout=timeout)
+
+        process = subprocess.Popen(cmd, cwd=mutants_dir, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, bufsize=0)
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+
+        buffer = b''
+        last_done = -1
+        last_emit = 0.0
+        last_match = None
+        try:
+            while True:
+                chunk = process.stdout.read(4096)
+                if not chunk:
+                    break
+                *segments, buffer = re.split(rb'[\r\n]', buffer + chunk)
+                for segment in segments:
+                    match = MUTMUT_PROGRESS_PATTERN.search(segment.decode('utf-8', errors='replace'))
+                    if match:
+                        last_match = match
+                if last_match and int(last_match.group(1)) != last_done:
+                    now = time.monotonic()
+                    if now - last_emit >= PROGRESS_EVENT_INTERVAL:
+                        self._emit_mutation_progress(last_match)
+                        last_done = int(last_match.group(1))
+                        last_emit = now
+            process.wait()
+        finally:
+            timer.cancel()
+
+        if last_match and int(last_match.group(1)) != last_done:
+            self._emit_mutation_progress(last_match)
+        if process.returncode is not None and process.returncode < 0:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return process.returncode
+
+    def _emit_mutation_progress(self, match):
+        self.progress.mutation_progress(
+            done=int(match.group(1)), total=int(match.group(2)),
+            killed=int(match.group(3)), survived=int(match.group(7))
+        )
+
     def parse_mutmut_results(self, mutmut_output):
         """Parse mutmut results output."""
         stats = {
@@ -621,8 +729,7 @@ class ExperimentRunner:
             'timeout': 0, 'suspicious': 0, 'skipped': 0, 'mutation_score': 0.0
         }
 
-        emoji_pattern = r'(\d+)/(\d+)\s+🎉\s+(\d+)\s+🫥\s+(\d+)\s+⏰\s+(\d+)\s+🤔\s+(\d+)\s+🙁\s+(\d+)\s+🔇\s+(\d+)'
-        match = re.search(emoji_pattern, mutmut_output)
+        match = MUTMUT_PROGRESS_PATTERN.search(mutmut_output)
 
         if match:
             progress_total = int(match.group(2))
@@ -686,6 +793,7 @@ class ExperimentRunner:
                 )
 
                 self.parse_unittest_results(unittest_result.stderr, result)
+                self._emit_test_results(unittest_result.stderr)
             else:
                 result['compilation_errors'] = [compile_result.stderr]
                 logger.error("Compilation failed: %s", compile_result.stderr)
@@ -719,6 +827,15 @@ class ExperimentRunner:
                 result['tests_failed'] = failures + errors
                 result['tests_passed'] = result['tests_run'] - result['tests_failed']
 
+    def _emit_test_results(self, unittest_output):
+        """Emit one test_result event per line of unittest verbose output."""
+        if not self.progress.enabled:
+            return
+        for line in unittest_output.split('\n'):
+            match = UNITTEST_RESULT_PATTERN.match(line)
+            if match:
+                self.progress.test_result(match.group(1), match.group(2))
+
     def extract_number_from_text(self, text, prefix):
         """Extract integer after a prefix string."""
         try:
@@ -0,0 +1,517 @@
+"""
+Background Job Queue for Experiments.
+
+Persists experiment jobs in a local SQLite database and executes them with a
+single worker daemon that runs up to N experiments concurrently, each as a
+cli_experiment_runner.py subprocess. Job records, console logs and progress
+event files outlive the web session, so the Streamlit app can submit many
+experiments and pick up their status after a browser refresh.
+
+Job lifecycle:
+    queued -> running -> succeeded | failed
+    queued | running -> cancelled
+
+Usage:
+    cd automation
+    python job_queue.py submit --model gemini-3-pro --strategy simple_prompting --context interface --repeat 5
+    python job_queue.py worker --workers 4
+    python job_queue.py list
+    python job_queue.py cancel 12
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import sqlite3
+import logging
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from progress_events import EventReader
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = Path(__file__).parent
+DEFAULT_DB_PATH = APP_DIR / "data" / "jobs.db"
+DEFAULT_WORKERS = 2
+
+# A worker whose last heartbeat is older than this is considered dead
+WORKER_TIMEOUT = 30.0
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    status TEXT NOT NULL DEFAULT 'queued',
+    config TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    pid INTEGER,
+    returncode INTEGER,
+    result_dir TEXT,
+    events_file TEXT,
+    log_file TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, id);
+CREATE TABLE IF NOT EXISTS worker (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    pid INTEGER NOT NULL,
+    max_workers INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    heartbeat REAL NOT NULL
+);
+"""
+
+
+def build_command(config: Dict[str, Any], events_file: Optional[Path] = None) -> List[str]:
+    """Build the cli_experiment_runner.py command line for a job config."""
+    cmd = [sys.executable, "cli_experiment_runner.py",
+           "--model", config["model"], "--strategy", config["strategy"], "--context", config["context"]]
+
+    if config.get("source_file"):
+        cmd.extend(["--source-file", config["source_file"]])
+    if config.get("class_name"):
+        cmd.extend(["--class-name", config["class_name"]])
+    if config.get("run_id"):
+        cmd.extend(["--run-id", str(config["run_id"])])
+    if config.get("results_dir"):
+        cmd.extend(["--results-dir", config["results_dir"]])
+    if config.get("context_budget"):
+        cmd.extend(["--context-budget", str(config["context_budget"]),
+                    "--budget-unit", config.get("budget_unit", "chars")])
+    if events_file:
+        cmd.extend(["--events-file", str(events_file)])
+    return cmd
+
+
+class JobQueue:
+    """
+    SQLite-backed job store shared by the worker daemon and its clients.
+
+    Every method opens a short-lived connection, so instances are cheap and
+    safe to use from Streamlit reruns and separate processes.
+
+    Args:
+        db_path: SQLite database file (created on demand)
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self.jobs_dir = self.db_path.parent / "jobs"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a connection that commits on success and is always closed."""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_dict(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job['config'] = json.loads(job['config'])
+        return job
+
+    def submit(self, config: Dict[str, Any]) -> int:
+        """Queue one experiment and return its job ID."""
+        return self.submit_many([config])[0]
+
+    def submit_many(self, configs: List[Dict[str, Any]]) -> List[int]:
+        """Queue several experiments in one transaction."""
+        now = time.time()
+        job_ids = []
+        with self._transaction() as conn:
+            for config in configs:
+                cursor = conn.execute(
+                    "INSERT INTO jobs (config, created_at) VALUES (?, ?)",
+                    (json.dumps(config), now)
+                )
+                job_ids.append(cursor.lastrowid)
+        logger.info("Queued %d job(s): %s", len(job_ids), job_ids)
+        return job_ids
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        with self._transaction() as conn:
+            return self._to_dict(conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 200) -> List[Dict[str, Any]]:
+        """Return the most recent jobs, newest first."""
+        with self._transaction() as conn:
+            if status:
+                rows = conn.execute("SELECT * FROM jobs WHERE status = ? ORDER BY id DESC LIMIT ?",
+                                    (status, limit)).fetchall()
+            else:
+                rows = conn.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """Atomically move the oldest queued job to running and return it."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT * FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1").fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            events_file = self.jobs_dir / f"{row['id']}.events.jsonl"
+            log_file = self.jobs_dir / f"{row['id']}.log"
+            conn.execute(
+                "UPDATE jobs SET status = 'running', started_at = ?, events_file = ?, log_file = ? WHERE id = ?",
+                (time.time(), str(events_file), str(log_file), row['id'])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return self.get(row['id'])
+
+    def set_pid(self, job_id: int, pid: int) -> None:
+        with self._transaction() as conn:
+            conn.execute("UPDATE jobs SET pid = ? WHERE id = ?", (pid, job_id))
+
+    def finish(self, job_id: int, returncode: Optional[int], result_dir: Optional[str] = None,
+               error: Optional[str] = None) -> None:
+        """Record the outcome of a running job (cancelled jobs keep their status)."""
+        status = 'succeeded' if returncode == 0 and error is None else 'failed'
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = CASE WHEN status = 'cancelled' THEN status ELSE ? END, "
+                "finished_at = ?, returncode = ?, result_dir = ?, error = ? WHERE id = ?",
+                (status, time.time(), returncode, result_dir, error, job_id)
+            )
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancel a queued or running job.
+
+        Running jobs are marked cancelled here; the worker terminates their
+        process on its next poll.
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? "
+                "WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id)
+            )
+        return cursor.rowcount > 0
+
+    def fail_orphans(self) -> int:
+        """Mark jobs left running by a dead worker as failed."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, error = 'worker exited' "
+                "WHERE status = 'running'",
+                (time.time(),)
+            )
+        return cursor.rowcount
+
+    def register_worker(self, pid: int, max_workers: int) -> bool:
+        """Register the worker daemon; fails if another live worker exists."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT * FROM worker WHERE id = 1").fetchone()
+            if row is not None and row['pid'] != pid and now - row['heartbeat'] < WORKER_TIMEOUT:
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO worker (id, pid, max_workers, started_at, heartbeat) VALUES (1, ?, ?, ?, ?)",
+                (pid, max_workers, now, now)
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return True
+
+    def heartbeat(self, pid: int) -> int:
+        """Refresh the worker heartbeat and return the configured worker count."""
+        with self._transaction() as conn:
+            conn.execute("UPDATE worker SET heartbeat = ? WHERE id = 1 AND pid = ?", (time.time(), pid))
+            row = conn.execute("SELECT max_workers FROM worker WHERE id = 1").fetchone()
+        return row['max_workers'] if row else DEFAULT_WORKERS
+
+    def unregister_worker(self, pid: int) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM worker WHERE id = 1 AND pid = ?", (pid,))
+
+    def active_worker(self) -> Optional[Dict[str, Any]]:
+        """Return the live worker record, or None if no worker is running."""
+        with self._transaction() as conn:
+            row = conn.execute("SELECT * FROM worker WHERE id = 1").fetchone()
+        if row is None or time.time() - row['heartbeat'] >= WORKER_TIMEOUT:
+            return None
+        return dict(row)
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """Change the concurrency of the running worker (applied on its next poll)."""
+        with self._transaction() as conn:
+            conn.execute("UPDATE worker SET max_workers = ? WHERE id = 1", (max_workers,))
+
+
+def _detach_kwargs() -> Dict[str, Any]:
+    """Popen arguments that start a child in its own process group."""
+    if sys.platform == "win32":
+        return {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {'start_new_session': True}
+
+
+def _terminate(process: subprocess.Popen) -> None:
+    """Terminate a job process together with the CLI tools it spawned."""
+    if sys.platform == "win32":
+        process.terminate()
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+def _outcome_from_events(events_file: Path):
+    """
+    Return (result_dir, success) reported by the runner's progress events.
+
+    cli_experiment_runner.py exits with 0 even when an experiment fails, so
+    the experiment_finished event is the authoritative outcome.
+    """
+    result_dir, success = None, None
+    for event in EventReader(events_file).read_new():
+        if event.get('event') in ('experiment_started', 'experiment_finished'):
+            result_dir = event.get('result_dir', result_dir)
+        if event.get('event') == 'experiment_finished':
+            success = event.get('success')
+    return result_dir, success
+
+
+class Worker:
+    """
+    Executes queued jobs as subprocesses, at most max_workers at a time.
+
+    Args:
+        queue: Job store
+        max_workers: Initial concurrency (can be changed via JobQueue.set_max_workers)
+        poll_interval: Seconds between queue polls
+    """
+
+    def __init__(self, queue: JobQueue, max_workers: int = DEFAULT_WORKERS, poll_interval: float = 2.0):
+        self.queue = queue
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.running: Dict[int, subprocess.Popen] = {}
+        self._stopping = False
+
+    def _start(self, job: Dict[str, Any]) -> None:
+        events_file = Path(job['events_file'])
+        log_file = Path(job['log_file'])
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        cmd = build_command(job['config'], events_file)
+        try:
+            with open(log_file, 'w', encoding='utf-8') as log:
+                process = subprocess.Popen(cmd, cwd=str(APP_DIR), stdout=log, stderr=subprocess.STDOUT,
+                                           **_detach_kwargs())
+        except OSError as e:
+            self.queue.finish(job['id'], None, error=str(e))
+            logger.error("Job %d failed to start: %s", job['id'], e)
+            return
+
+        self.queue.set_pid(job['id'], process.pid)
+        self.running[job['id']] = process
+        logger.info("Job %d started (pid %d)", job['id'], process.pid)
+
+    def _reap(self) -> None:
+        """Collect finished processes and terminate cancelled ones."""
+        for job_id, process in list(self.running.items()):
+            returncode = process.poll()
+            if returncode is None:
+                job = self.queue.get(job_id)
+                if job is not None and job['status'] == 'cancelled':
+                    logger.info("Job %d cancelled, terminating pid %d", job_id, process.pid)
+                    _terminate(process)
+                continue
+
+            result_dir, success = _outcome_from_events(self.queue.jobs_dir / f"{job_id}.events.jsonl")
+            error = None
+            if returncode == 0 and not success:
+                error = 'experiment failed (see log)'
+            self.queue.finish(job_id, returncode, result_dir, error)
+            del self.running[job_id]
+            logger.info("Job %d finished with exit code %d", job_id, returncode)
+
+    def _stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def run(self, exit_when_idle: bool = False) -> int:
+        """Run the worker loop until stopped (or until idle if exit_when_idle)."""
+        pid = os.getpid()
+        if not self.queue.register_worker(pid, self.max_workers):
+            logger.error("Another worker is already running for %s", self.queue.db_path)
+            return 1
+
+        orphans = self.queue.fail_orphans()
+        if orphans:
+            logger.warning("Marked %d job(s) from a previous worker as failed", orphans)
+
+        signal.signal(signal.SIGTERM, self._stop)
+        logger.info("Worker %d started (max %d concurrent jobs)", pid, self.max_workers)
+
+        try:
+            while not self._stopping:
+                self.max_workers = self.queue.heartbeat(pid)
+                self._reap()
+
+                while len(self.running) < self.max_workers:
+                    job = self.queue.claim_next()
+                    if job is None:
+                        break
+                    self._start(job)
+
+                if exit_when_idle and not self.running and not self.queue.counts().get('queued'):
+                    break
+                time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            for job_id, process in self.running.items():
+                _terminate(process)
+                process.wait()
+                self.queue.finish(job_id, process.returncode, error='worker stopped')
+            self.queue.unregister_worker(pid)
+            logger.info("Worker %d stopped", pid)
+
+        return 0
+
+
+def ensure_worker(db_path=DEFAULT_DB_PATH, max_workers: int = DEFAULT_WORKERS) -> bool:
+    """
+    Start a detached worker daemon unless one is already alive.
+
+    Returns:
+        True if a new worker process was started
+    """
+    queue = JobQueue(db_path)
+    if queue.active_worker() is not None:
+        queue.set_max_workers(max_workers)
+        return False
+
+    cmd = [sys.executable, str(APP_DIR / "job_queue.py"), "--db", str(db_path),
+           "worker", "--workers", str(max_workers)]
+    log_file = Path(db_path).parent / "worker.log"
+
+    kwargs = _detach_kwargs()
+    if sys.platform == "win32":
+        kwargs['creationflags'] |= subprocess.DETACHED_PROCESS
+
+    with open(log_file, 'a', encoding='utf-8') as log:
+        subprocess.Popen(cmd, cwd=str(APP_DIR), stdout=log, stderr=subprocess.STDOUT,
+                         stdin=subprocess.DEVNULL, **kwargs)
+    logger.info("Started worker daemon (max %d concurrent jobs)", max_workers)
+    return True
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Local job queue for running experiments in the background',
+        epilog='''
+Examples:
+  # Queue 5 runs of one configuration
+  python job_queue.py submit --model gemini-3-pro --strategy simple_prompting --context interface --repeat 5
+
+  # Process the queue with 4 concurrent experiments
+  python job_queue.py worker --workers 4
+
+  # Show jobs and cancel one
+  python job_queue.py list
+  python job_queue.py cancel 12
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--db', default=str(DEFAULT_DB_PATH),
+                        help='Job database (default: data/jobs.db)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    submit = subparsers.add_parser('submit', help='Queue experiments')
+    submit.add_argument('--model', required=True)
+    submit.add_argument('--strategy', required=True, choices=['simple_prompting', 'chain_of_thought_prompting'])
+    submit.add_argument('--context', required=True, choices=['interface', 'interface_docstring', 'full_context'])
+    submit.add_argument('--source-file', default=None)
+    submit.add_argument('--class-name', default=None)
+    submit.add_argument('--results-dir', default=None)
+    submit.add_argument('--context-budget', type=int, default=None)
+    submit.add_argument('--budget-unit', choices=['chars', 'tokens'], default='chars')
+    submit.add_argument('--repeat', type=int, default=1, help='Number of runs to queue (default: 1)')
+
+    worker = subparsers.add_parser('worker', help='Run the worker daemon')
+    worker.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Maximum concurrent experiments (default: {DEFAULT_WORKERS})')
+    worker.add_argument('--exit-when-idle', action='store_true',
+                        help='Exit once the queue is empty')
+
+    subparsers.add_parser('list', help='Show recent jobs')
+
+    cancel = subparsers.add_parser('cancel', help='Cancel a queued or running job')
+    cancel.add_argument('job_id', type=int)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    queue = JobQueue(args.db)
+
+    if args.command == 'submit':
+        config = {
+            'model': args.model, 'strategy': args.strategy, 'context': args.context,
+            'source_file': args.source_file, 'class_name': args.class_name,
+            'results_dir': args.results_dir,
+            'context_budget': args.context_budget, 'budget_unit': args.budget_unit
+        }
+        queue.submit_many([config] * args.repeat)
+
+    elif args.command == 'worker':
+        return Worker(queue, args.workers).run(exit_when_idle=args.exit_when_idle)
+
+    elif args.command == 'list':
+        for job in queue.list_jobs():
+            config = job['config']
+            print(f"{job['id']:>5}  {job['status']:<10} {config['model']:<24} "
+                  f"{config['strategy']:<28} {config['context']:<20} {job['result_dir'] or ''}")
+
+    elif args.command == 'cancel':
+        if not queue.cancel(args.job_id):
+            logger.error("Job %d is not queued or running", args.job_id)
+            return 1
+        logger.info("Job %d cancelled", args.job_id)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,425 @@
+"""
+Compact Mutation Status Storage.
+
+Stores per-mutant outcomes as a fixed-order status array instead of the
+line-per-mutant text written by `mutmut results`.
+
+    - Mutant table (data/mutant_tables/<source_hash>.json): the ordered list of
+      mutant IDs for one version of the source file. The table is append-only,
+      so arrays written against an older, shorter table stay aligned.
+    - Run status (<run_dir>/mutmut-status.json): the source hash, a string
+      with one status character per mutant, in table order, and the status of
+      mutants added to the table later (killed for runs read from `mutmut
+      results` text, which omits killed mutants; unknown otherwise).
+    - Corpus matrix (data/mutation_status/<source_hash>.bin): a runs x mutants
+      uint8 matrix built from all run status files, loadable with a single
+      numpy.fromfile() call.
+
+Usage:
+    cd automation
+    python mutation_status.py convert --results-dir cli_results
+    python mutation_status.py build --results-dir cli_results --output-dir data
+    python mutation_status.py scores --output-dir data
+"""
+
+import re
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_FILE_NAME = "mutmut-status.json"
+DEFAULT_TABLES_DIR = Path(__file__).parent / "data" / "mutant_tables"
+
+# One character per status; UNKNOWN marks mutants without a recorded outcome
+STATUS_CODES = {
+    'killed': 'K',
+    'survived': 'S',
+    'timeout': 'T',
+    'suspicious': 'Q',
+    'no tests': 'N',
+    'skipped': 'P',
+    'not checked': 'C',
+    'segfault': 'F',
+}
+UNKNOWN = '.'
+# Codes not counted as tested mutants (mutmut-stats.json counts neither)
+NO_OUTCOME = (UNKNOWN, STATUS_CODES['not checked'])
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+# mutmut 3 exit codes stored in <file>.meta
+EXIT_CODE_STATUS = {
+    1: 'killed', 3: 'killed', 0: 'survived', 5: 'no tests', 33: 'no tests',
+    34: 'skipped', 35: 'suspicious', 36: 'timeout', 24: 'timeout', -24: 'timeout',
+    152: 'timeout', 255: 'timeout', -11: 'segfault', -9: 'segfault', None: 'not checked',
+}
+
+RESULT_LINE_PATTERN = re.compile(r'^\s*(\S+__mutmut_\d+):\s*(.+?)\s*$')
+MUTANT_ID_PATTERN = re.compile(r'^(?P<prefix>.*?)__mutmut_(?P<number>\d+)$')
+
+
+def source_hash(source_file: Path) -> str:
+    """Return the SHA-256 of the mutated source file."""
+    return hashlib.sha256(Path(source_file).read_bytes()).hexdigest()
+
+
+def mutant_sort_key(mutant_id: str) -> Tuple[str, int]:
+    """Order mutants by function, then by mutant number."""
+    match = MUTANT_ID_PATTERN.match(mutant_id)
+    if not match:
+        return mutant_id, 0
+    return match.group('prefix'), int(match.group('number'))
+
+
+def mutant_method(mutant_id: str) -> str:
+    """
+    Return the function a mutant belongs to.
+
+    Examples:
+        order_calculator.xǁOrderCalculatorǁadd_item__mutmut_3 -> add_item
+        my_module.x_helper__mutmut_1 -> helper
+    """
+    prefix = mutant_sort_key(mutant_id)[0]
+    if 'ǁ' in prefix:
+        return prefix.rsplit('ǁ', 1)[-1]
+    name = prefix.rsplit('.', 1)[-1]
+    return name[2:] if name.startswith('x_') else name
+
+
+def complete_mutant_ids(mutant_ids) -> List[str]:
+    """
+    Add the mutant IDs implied by a partial list.
+
+    mutmut numbers the mutants of each function from 1, so a listed
+    add_item__mutmut_9 implies add_item__mutmut_1 to _8 exist, even if they
+    are absent from `mutmut results` because they were killed.
+    """
+    highest: Dict[str, int] = {}
+    complete = set(mutant_ids)
+    for mutant_id in complete:
+        match = MUTANT_ID_PATTERN.match(mutant_id)
+        if match:
+            prefix = match.group('prefix')
+            highest[prefix] = max(highest.get(prefix, 0), int(match.group('number')))
+    for prefix, count in highest.items():
+        complete.update(f"{prefix}__mutmut_{number}" for number in range(1, count + 1))
+    return sorted(complete, key=mutant_sort_key)
+
+
+def parse_results_text(mutmut_output: str) -> Dict[str, str]:
+    """Parse `mutmut results` output into {mutant_id: status}."""
+    statuses = {}
+    for line in mutmut_output.split('\n'):
+        match = RESULT_LINE_PATTERN.match(line)
+        if match:
+            statuses[match.group(1)] = match.group(2)
+    return statuses
+
+
+def parse_meta_file(meta_file: Path) -> Dict[str, str]:
+    """Read {mutant_id: status} from a mutmut 3 .meta file."""
+    with open(meta_file, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    return {
+        mutant_id: EXIT_CODE_STATUS.get(exit_code, 'suspicious')
+        for mutant_id, exit_code in meta.get('exit_code_by_key', {}).items()
+    }
+
+
+class MutantTable:
+    """
+    Ordered, append-only list of mutant IDs for one source hash.
+
+    Args:
+        source_hash: SHA-256 of the mutated source
+        mutant_ids: Mutant IDs in table order
+        tables_dir: Directory holding the table files
+    """
+
+    def __init__(self, source_hash: str, mutant_ids: Optional[List[str]] = None,
+                 tables_dir: Path = DEFAULT_TABLES_DIR):
+        self.source_hash = source_hash
+        self.mutant_ids: List[str] = list(mutant_ids or [])
+        self.tables_dir = Path(tables_dir)
+        self._positions = {mutant_id: i for i, mutant_id in enumerate(self.mutant_ids)}
+
+    @property
+    def path(self) -> Path:
+        return self.tables_dir / f"{self.source_hash}.json"
+
+    @classmethod
+    def load(cls, source_hash: str, tables_dir: Path = DEFAULT_TABLES_DIR) -> 'MutantTable':
+        """Load a table, or return an empty one if it does not exist yet."""
+        path = Path(tables_dir) / f"{source_hash}.json"
+        if not path.exists():
+            return cls(source_hash, tables_dir=tables_dir)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(source_hash, data.get('mutants', []), tables_dir)
+
+    def __len__(self) -> int:
+        return len(self.mutant_ids)
+
+    def extend(self, mutant_ids) -> bool:
+        """Append unknown mutant IDs in sorted order. Returns True if the table grew."""
+        new_ids = sorted((m for m in set(mutant_ids) if m not in self._positions), key=mutant_sort_key)
+        for mutant_id in new_ids:
+            self._positions[mutant_id] = len(self.mutant_ids)
+            self.mutant_ids.append(mutant_id)
+        return bool(new_ids)
+
+    def save(self) -> None:
+        self.tables_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'source_hash': self.source_hash, 'mutants': self.mutant_ids}, f,
+                      indent=1, ensure_ascii=False)
+        tmp_path.replace(self.path)
+
+    def encode(self, statuses: Dict[str, str], default: str = UNKNOWN) -> str:
+        """Encode {mutant_id: status} as a status string in table order."""
+        codes = [default] * len(self.mutant_ids)
+        for mutant_id, status in statuses.items():
+            position = self._positions.get(mutant_id)
+            if position is not None:
+                codes[position] = STATUS_CODES.get(status, UNKNOWN)
+        return ''.join(codes)
+
+    def methods(self) -> List[str]:
+        """Return the method name of each table column."""
+        return [mutant_method(m) for m in self.mutant_ids]
+
+
+def write_run_status(run_dir: Path, source_file: Path, mutmut_output: str = "",
+                     meta_file: Optional[Path] = None,
+                     tables_dir: Path = DEFAULT_TABLES_DIR) -> Optional[str]:
+    """
+    Persist the status array for one run.
+
+    Uses the .meta file when available (it lists every mutant); otherwise falls
+    back to the `mutmut results` text, which lists only non-killed mutants, so
+    table entries missing from the text are recorded as killed. The table is
+    first extended with the IDs the text implies (complete_mutant_ids); for
+    a complete table, convert_results_dir also adds the IDs listed by other
+    runs of the same source.
+
+    Returns:
+        The encoded status string, or None if nothing could be parsed
+    """
+    run_dir = Path(run_dir)
+    if meta_file is not None and Path(meta_file).exists():
+        statuses = parse_meta_file(Path(meta_file))
+        default = UNKNOWN
+    else:
+        statuses = parse_results_text(mutmut_output)
+        default = STATUS_CODES['killed']
+
+    if not statuses:
+        return None
+
+    digest = source_hash(source_file)
+    table = MutantTable.load(digest, tables_dir)
+    if table.extend(complete_mutant_ids(statuses)):
+        table.save()
+
+    status = table.encode(statuses, default=default)
+    with open(run_dir / STATUS_FILE_NAME, 'w', encoding='utf-8') as f:
+        json.dump({'source_hash': digest, 'table_size': len(table), 'status': status, 'pad': default}, f)
+    return status
+
+
+def read_run_status(run_dir: Path) -> Optional[Dict[str, object]]:
+    """Read a run's status file, or None if absent."""
+    status_file = Path(run_dir) / STATUS_FILE_NAME
+    if not status_file.exists():
+        return None
+    with open(status_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def stats_from_status(status: str) -> dict:
+    """Compute mutmut-stats.json-compatible counters from a status string."""
+    stats = {
+        'total_mutants': sum(1 for code in status if code not in NO_OUTCOME),
+        'killed': status.count(STATUS_CODES['killed']),
+        'survived': status.count(STATUS_CODES['survived']),
+        'timeout': status.count(STATUS_CODES['timeout']),
+        'suspicious': status.count(STATUS_CODES['suspicious']),
+        'skipped': status.count(STATUS_CODES['skipped']),
+        'mutation_score': 0.0
+    }
+    if stats['total_mutants'] > 0:
+        stats['mutation_score'] = round((stats['killed'] / stats['total_mutants']) * 100, 1)
+    return stats
+
+
+def build_status_matrix(results_dir: Path, output_dir: Path,
+                        tables_dir: Path = DEFAULT_TABLES_DIR) -> Dict[str, int]:
+    """
+    Collect all run status files into one uint8 matrix per source hash.
+
+    Writes <output_dir>/mutation_status/<hash>.bin (row-major, runs x mutants)
+    and <hash>.runs.json (row order and mutant count). Rows written before the
+    table grew are padded with their own status for unlisted mutants.
+
+    Returns:
+        Number of runs per source hash
+    """
+    results_dir = Path(results_dir)
+    rows_by_hash: Dict[str, List[Tuple[str, str, str]]] = {}
+
+    for status_file in sorted(results_dir.rglob(STATUS_FILE_NAME)):
+        data = read_run_status(status_file.parent)
+        rel_path = status_file.parent.relative_to(results_dir).as_posix()
+        rows_by_hash.setdefault(data['source_hash'], []).append(
+            (rel_path, data['status'], data.get('pad', UNKNOWN)))
+
+    matrix_dir = Path(output_dir) / "mutation_status"
+    matrix_dir.mkdir(parents=True, exist_ok=True)
+
+    counts = {}
+    for digest, rows in rows_by_hash.items():
+        width = len(MutantTable.load(digest, tables_dir))
+        with open(matrix_dir / f"{digest}.bin", 'wb') as f:
+            for _, status, pad in rows:
+                f.write(status.ljust(width, pad)[:width].encode('ascii'))
+        with open(matrix_dir / f"{digest}.runs.json", 'w', encoding='utf-8') as f:
+            json.dump({'source_hash': digest, 'mutants': width, 'runs': [r for r, _, _ in rows]}, f, indent=1)
+        counts[digest] = len(rows)
+
+    return counts
+
+
+def load_status_matrix(output_dir: Path, digest: str, tables_dir: Path = DEFAULT_TABLES_DIR):
+    """
+    Load the corpus status matrix for one source hash.
+
+    Returns:
+        Tuple of (uint8 ndarray of shape (runs, mutants), run paths, mutant table)
+    """
+    import numpy as np
+
+    matrix_dir = Path(output_dir) / "mutation_status"
+    with open(matrix_dir / f"{digest}.runs.json", 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+
+    matrix = np.fromfile(matrix_dir / f"{digest}.bin", dtype=np.uint8)
+    matrix = matrix.reshape(len(meta['runs']), meta['mutants'])
+    return matrix, meta['runs'], MutantTable.load(digest, tables_dir)
+
+
+def per_method_scores(matrix, table: MutantTable) -> Dict[str, 'object']:
+    """
+    Compute per-method mutation scores for every run.
+
+    Returns:
+        {method: float ndarray of killed/known percentages, one value per run}
+    """
+    import numpy as np
+
+    methods = np.array(table.methods()[:matrix.shape[1]])
+    killed = matrix == ord(STATUS_CODES['killed'])
+    known = ~np.isin(matrix, [ord(code) for code in NO_OUTCOME])
+
+    scores = {}
+    for method in dict.fromkeys(methods):
+        columns = methods == method
+        total = known[:, columns].sum(axis=1)
+        scores[method] = np.where(total > 0, killed[:, columns].sum(axis=1) / np.maximum(total, 1) * 100, 0.0)
+    return scores
+
+
+def convert_results_dir(results_dir: Path, tables_dir: Path = DEFAULT_TABLES_DIR) -> int:
+    """
+    Create status files for runs that only have mutmut_results.txt.
+
+    Each text lists only the mutants its run did not kill, so the mutant table
+    of every source hash is first extended with the IDs listed by all runs of
+    that source; each run is then encoded against the complete table, with
+    unlisted mutants recorded as killed.
+    """
+    runs = []
+    ids_by_hash: Dict[str, set] = {}
+    for results_file in sorted(Path(results_dir).rglob("mutmut_results.txt")):
+        run_dir = results_file.parent
+        text = results_file.read_text(encoding='utf-8')
+        statuses = parse_results_text(text)
+        if not statuses:
+            continue
+        module_name = next(iter(statuses)).split('.', 1)[0]
+        source_file = run_dir / f"{module_name}.py"
+        if not source_file.exists():
+            logger.warning("Source copy not found in %s - skipping", run_dir)
+            continue
+        runs.append((run_dir, source_file, text))
+        ids_by_hash.setdefault(source_hash(source_file), set()).update(statuses)
+
+    for digest, mutant_ids in ids_by_hash.items():
+        table = MutantTable.load(digest, tables_dir)
+        if table.extend(complete_mutant_ids(mutant_ids)):
+            table.save()
+
+    converted = 0
+    for run_dir, source_file, text in runs:
+        if write_run_status(run_dir, source_file, text, tables_dir=tables_dir):
+            converted += 1
+    return converted
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Convert and query compact mutation status arrays',
+        epilog='''
+Examples:
+  # Write mutmut-status.json for every run with mutmut_results.txt
+  python mutation_status.py convert --results-dir cli_results
+
+  # Build corpus matrices in data/mutation_status/
+  python mutation_status.py build --results-dir cli_results --output-dir data
+
+  # Print mean per-method mutation scores
+  python mutation_status.py scores --output-dir data
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['convert', 'build', 'scores'])
+    parser.add_argument('--results-dir', default='cli_results',
+                        help='Results directory (default: cli_results)')
+    parser.add_argument('--output-dir', default='data',
+                        help='Directory for corpus matrices (default: data)')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == 'convert':
+        count = convert_results_dir(Path(args.results_dir))
+        logger.info("Wrote %d run status files", count)
+        if count:
+            logger.info("Table sizes: %s", {
+                p.stem[:12]: len(MutantTable.load(p.stem)) for p in DEFAULT_TABLES_DIR.glob("*.json")
+            })
+
+    elif args.command == 'build':
+        counts = build_status_matrix(Path(args.results_dir), Path(args.output_dir))
+        for digest, count in counts.items():
+            logger.info("%s: %d runs", digest[:12], count)
+
+    elif args.command == 'scores':
+        matrix_dir = Path(args.output_dir) / "mutation_status"
+        for runs_file in sorted(matrix_dir.glob("*.runs.json")):
+            digest = runs_file.name.split('.')[0]
+            matrix, runs, table = load_status_matrix(Path(args.output_dir), digest)
+            print(f"\nSource {digest[:12]} ({len(runs)} runs, {len(table)} mutants)")
+            for method, scores in per_method_scores(matrix, table).items():
+                print(f"  {method:25s} {scores.mean():6.1f}%")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,299 @@
+"""
+Package-wide Universal Mode.
+
+Points universal mode at a whole package directory instead of a single
+source file: every module is scanned for testable (non-helper) classes,
+contexts are extracted in a process pool, and one background job is queued
+per class x model x strategy x context through the job queue.
+
+Progress is kept in a JSON manifest (one entry per class with its content
+hash, extraction summary and queued job IDs), so re-running the command on a
+package with thousands of classes only queues what is new or changed.
+
+Results of each class are stored under
+    <results-dir>/<package>/<module.path>.<ClassName>/<strategy>/<context>/<model>/run_NNN/
+
+Usage:
+    cd automation
+    python package_runner.py path/to/package --models gemini-3-pro --dry-run
+    python package_runner.py path/to/package --models gemini-3-pro claude-code-sonnet-4.5 --workers 8
+    python package_runner.py path/to/package --models gemini-3-pro --start-worker 4
+"""
+
+import os
+import ast
+import json
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from class_context_extractor import ContextLevel, discover_main_classes, load_class_context
+from job_queue import APP_DIR, DEFAULT_DB_PATH, DEFAULT_WORKERS, JobQueue, ensure_worker
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ['simple_prompting', 'chain_of_thought_prompting']
+MANIFEST_DIR = APP_DIR / "data" / "packages"
+MANIFEST_VERSION = 1
+
+# Directories never scanned for classes
+SKIP_DIRS = {'__pycache__', 'tests', 'test', 'venv', '.venv', 'build', 'dist', 'node_modules'}
+
+
+def find_modules(package_dir: Path) -> List[Path]:
+    """List the Python modules of a package, skipping tests and hidden/build directories."""
+    modules = []
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+        for name in sorted(files):
+            if not name.endswith('.py'):
+                continue
+            if name.startswith('test_') or name.endswith('_test.py') or name == 'conftest.py':
+                continue
+            modules.append(Path(root) / name)
+    return modules
+
+
+def _has_relative_imports(tree: ast.Module) -> bool:
+    return any(isinstance(node, ast.ImportFrom) and node.level for node in ast.walk(tree))
+
+
+def scan_module(source_file: Path) -> List[Dict[str, Any]]:
+    """
+    Extract every testable class of one module (process pool task).
+
+    Returns:
+        One record per class with its content hash, method list, context
+        sizes and whether the module uses relative imports; a single record
+        with class_name None and an error if the module cannot be parsed.
+    """
+    try:
+        class_names = discover_main_classes(source_file)
+    except (ValueError, UnicodeDecodeError, OSError) as e:
+        return [{'source_file': str(source_file), 'class_name': None, 'error': str(e)}]
+
+    records = []
+    for class_name in class_names:
+        record = {'source_file': str(source_file), 'class_name': class_name}
+        try:
+            parsed = load_class_context(source_file, class_name)
+            record.update({
+                'content_hash': parsed.content_hash,
+                'public_methods': parsed.info.public_methods,
+                'context_chars': {level: len(text) for level, text in parsed.contexts.items()},
+                'relative_imports': _has_relative_imports(parsed.tree),
+                'error': None,
+            })
+        except Exception as e:
+            record['error'] = str(e)
+        records.append(record)
+    return records
+
+
+def scan_package(package_dir: Path, workers: int) -> List[Dict[str, Any]]:
+    """Scan all modules of a package in a process pool."""
+    modules = find_modules(package_dir)
+    logger.info("Scanning %d module(s) in %s with %d worker(s)", len(modules), package_dir, workers)
+
+    start = time.perf_counter()
+    records = []
+    if workers > 1 and len(modules) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(modules) // (workers * 4))
+            for module_records in pool.map(scan_module, modules, chunksize=chunksize):
+                records.extend(module_records)
+    else:
+        for module in modules:
+            records.extend(scan_module(module))
+
+    logger.info("Scanned %d module(s) in %.1fs", len(modules), time.perf_counter() - start)
+    return records
+
+
+def class_key(package_dir: Path, record: Dict[str, Any]) -> str:
+    """Manifest key: dotted module path within the package plus class name."""
+    relative = Path(record['source_file']).relative_to(package_dir).with_suffix('')
+    parts = [p for p in relative.parts if p != '__init__'] or [package_dir.name]
+    return '.'.join(parts + [record['class_name']])
+
+
+class PackageManifest:
+    """
+    Per-package record of discovered classes and their queued jobs.
+
+    Entries are keyed by "<module.path>.<ClassName>". A job recorded for a
+    configuration is only re-queued when the class's source changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.data: Dict[str, Any] = {'version': MANIFEST_VERSION, 'classes': {}}
+
+    def load(self) -> 'PackageManifest':
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.data = data
+        return self
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    @property
+    def classes(self) -> Dict[str, Dict[str, Any]]:
+        return self.data['classes']
+
+    def update_class(self, key: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a scan record, dropping queued jobs if the source changed."""
+        entry = self.classes.get(key, {})
+        if entry.get('content_hash') != record.get('content_hash'):
+            entry['jobs'] = {}
+        entry.update(record)
+        entry.setdefault('jobs', {})
+        self.classes[key] = entry
+        return entry
+
+
+def plan_jobs(package_dir: Path, manifest: PackageManifest, records: List[Dict[str, Any]],
+              models: List[str], strategies: List[str], contexts: List[str],
+              results_dir: Path, include_relative_imports: bool = False,
+              context_budget: Optional[int] = None, budget_unit: str = 'chars') -> List[Dict[str, Any]]:
+    """
+    Update the manifest from scan records and return the job configs still to queue.
+
+    Each config carries a private "_key"/"_config" pair so that queued job IDs
+    can be written back to the manifest.
+    """
+    pending = []
+    for record in records:
+        if record['class_name'] is None:
+            logger.warning("Skipping %s: %s", record['source_file'], record['error'])
+            continue
+
+        key = class_key(package_dir, record)
+        entry = manifest.update_class(key, record)
+        if entry['error']:
+            logger.warning("Skipping %s: %s", key, entry['error'])
+            continue
+        if entry['relative_imports'] and not include_relative_imports:
+            continue
+        if not entry['public_methods']:
+            continue
+
+        class_results_dir = results_dir / package_dir.name / key
+        for model in models:
+            for strategy in strategies:
+                for context in contexts:
+                    config_name = f"{model}/{strategy}/{context}"
+                    if config_name in entry['jobs']:
+                        continue
+                    pending.append({
+                        '_key': key,
+                        '_config': config_name,
+                        'model': model,
+                        'strategy': strategy,
+                        'context': context,
+                        'source_file': str(Path(record['source_file']).resolve()),
+                        'class_name': record['class_name'],
+                        'results_dir': str(class_results_dir),
+                        'context_budget': context_budget,
+                        'budget_unit': budget_unit,
+                    })
+    return pending
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Queue universal-mode experiments for every class of a package',
+        epilog='''
+Examples:
+  # Scan a package and show what would be queued
+  python package_runner.py ../my_package --models gemini-3-pro --dry-run
+
+  # Queue all strategies and contexts for two models
+  python package_runner.py ../my_package --models gemini-3-pro claude-code-sonnet-4.5 --workers 8
+
+  # Queue one configuration and start the worker daemon with 4 concurrent jobs
+  python package_runner.py ../my_package --models gemini-3-pro --strategies simple_prompting \\
+      --contexts interface --start-worker 4
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('package_dir', help='Package directory to scan')
+    parser.add_argument('--models', nargs='+', required=True, help='Models to queue')
+    parser.add_argument('--strategies', nargs='+', choices=STRATEGIES, default=STRATEGIES,
+                        help='Prompting strategies (default: all)')
+    parser.add_argument('--contexts', nargs='+', choices=ContextLevel.ALL, default=ContextLevel.ALL,
+                        help='Context levels (default: all)')
+    parser.add_argument('--results-dir', default='cli_results',
+                        help='Base results directory (default: cli_results)')
+    parser.add_argument('--manifest', default=None,
+                        help='Manifest file (default: data/packages/<package>.json)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Processes used for scanning and context extraction (default: CPU count)')
+    parser.add_argument('--include-relative-imports', action='store_true',
+                        help='Also queue classes from modules with relative imports '
+                             '(these usually fail, as only the module file is copied into the run)')
+    parser.add_argument('--context-budget', type=int, default=None,
+                        help='Maximum class context size passed to every experiment')
+    parser.add_argument('--budget-unit', choices=['chars', 'tokens'], default='chars',
+                        help='Unit of --context-budget (default: chars)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Scan and update the manifest without queueing jobs')
+    parser.add_argument('--start-worker', type=int, nargs='?', const=DEFAULT_WORKERS, default=None,
+                        metavar='N', help=f'Start the worker daemon with N concurrent jobs (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--db', default=str(DEFAULT_DB_PATH), help='Job database (default: data/jobs.db)')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    package_dir = Path(args.package_dir).resolve()
+    if not package_dir.is_dir():
+        logger.error("Package directory not found: %s", package_dir)
+        return 1
+
+    manifest_path = Path(args.manifest) if args.manifest else MANIFEST_DIR / f"{package_dir.name}.json"
+    manifest = PackageManifest(manifest_path).load()
+
+    records = scan_package(package_dir, max(1, args.workers))
+    pending = plan_jobs(package_dir, manifest, records, args.models, args.strategies, args.contexts,
+                        Path(args.results_dir), args.include_relative_imports,
+                        args.context_budget, args.budget_unit)
+
+    classes = manifest.classes.values()
+    logger.info("Classes: %d testable, %d with relative imports, %d failed extraction",
+                sum(1 for c in classes if not c.get('error')),
+                sum(1 for c in classes if c.get('relative_imports')),
+                sum(1 for c in classes if c.get('error')))
+
+    if args.dry_run:
+        manifest.save()
+        logger.info("Dry run: %d job(s) would be queued (manifest: %s)", len(pending), manifest_path)
+        return 0
+
+    if pending:
+        queue = JobQueue(args.db)
+        configs = [{k: v for k, v in job.items() if not k.startswith('_')} for job in pending]
+        job_ids = queue.submit_many(configs)
+        for job, job_id in zip(pending, job_ids):
+            manifest.classes[job['_key']]['jobs'][job['_config']] = job_id
+    manifest.save()
+    logger.info("Queued %d job(s) (manifest: %s)", len(pending), manifest_path)
+
+    if args.start_worker is not None and pending:
+        ensure_worker(args.db, args.start_worker)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,160 @@
+"""
+Structured Progress Events.
+
+The experiment runner appends one JSON object per line to an events file so
+that front-ends (the Streamlit app, scripts) can follow an experiment without
+parsing log output.
+
+Event types:
+    experiment_started   model, strategy, context
+    stage_started        stage
+    stage_finished       stage, success
+    test_result          test, outcome
+    mutation_progress    done, total, killed, survived
+    experiment_finished  success, result_dir
+
+Usage:
+    emitter = ProgressEmitter(Path("run.events.jsonl"))
+    emitter.stage_started("coverage")
+    ...
+    reader = EventReader(Path("run.events.jsonl"))
+    new_events = reader.read_new()
+"""
+
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EVENTS_ENV_VAR = "LLM_EXPERIMENT_EVENTS_FILE"
+
+# Pipeline stages in execution order
+STAGES = ['generation', 'compilation', 'coverage', 'mutation', 'scenarios']
+
+STAGE_LABELS = {
+    'generation': 'Test generation (LLM)',
+    'compilation': 'Compilation & execution',
+    'coverage': 'Coverage analysis',
+    'mutation': 'Mutation testing',
+    'scenarios': 'Quality analysis',
+}
+
+
+class ProgressEmitter:
+    """
+    Appends progress events to a JSON-lines file.
+
+    An emitter without a file is a no-op, so pipeline code can emit
+    unconditionally.
+
+    Args:
+        events_file: Target file (None disables emission)
+    """
+
+    def __init__(self, events_file: Optional[Path] = None):
+        self.events_file = Path(events_file) if events_file else None
+        if self.events_file is not None:
+            self.events_file.parent.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.events_file is not None
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Append one event; failures are logged and never interrupt the pipeline."""
+        if self.events_file is None:
+            return
+        record = {'ts': time.time(), 'event': event, **fields}
+        try:
+            with open(self.events_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError as e:
+            logger.warning("Failed to write progress event: %s", e)
+
+    def stage_started(self, stage: str) -> None:
+        self.emit('stage_started', stage=stage)
+
+    def stage_finished(self, stage: str, success: bool = True) -> None:
+        self.emit('stage_finished', stage=stage, success=success)
+
+    def test_result(self, test: str, outcome: str) -> None:
+        self.emit('test_result', test=test, outcome=outcome)
+
+    def mutation_progress(self, done: int, total: int, killed: int = 0, survived: int = 0) -> None:
+        self.emit('mutation_progress', done=done, total=total, killed=killed, survived=survived)
+
+
+class EventReader:
+    """
+    Incrementally reads an events file, returning only events appended since
+    the previous call. Partial trailing lines are kept for the next read.
+    """
+
+    def __init__(self, events_file: Path):
+        self.events_file = Path(events_file)
+        self._offset = 0
+        self._buffer = b''
+
+    def read_new(self) -> List[Dict[str, Any]]:
+        if not self.events_file.exists():
+            return []
+        with open(self.events_file, 'rb') as f:
+            f.seek(self._offset)
+            chunk = f.read()
+        self._offset += len(chunk)
+
+        lines = (self._buffer + chunk).split(b'\n')
+        self._buffer = lines.pop()
+
+        events = []
+        for line in lines:
+            if line.strip():
+                try:
+                    events.append(json.loads(line.decode('utf-8')))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+        return events
+
+
+class ProgressState:
+    """Folds events into per-stage status for display."""
+
+    def __init__(self):
+        self.stages: Dict[str, str] = {stage: 'pending' for stage in STAGES}
+        self.tests_passed = 0
+        self.tests_failed = 0
+        self.mutation_done = 0
+        self.mutation_total = 0
+        self.finished = False
+        self.success = None
+
+    def apply(self, events: List[Dict[str, Any]]) -> None:
+        for event in events:
+            kind = event.get('event')
+            if kind == 'stage_started':
+                self.stages[event['stage']] = 'running'
+            elif kind == 'stage_finished':
+                self.stages[event['stage']] = 'done' if event.get('success', True) else 'failed'
+            elif kind == 'test_result':
+                if event.get('outcome') == 'ok':
+                    self.tests_passed += 1
+                else:
+                    self.tests_failed += 1
+            elif kind == 'mutation_progress':
+                self.mutation_done = event.get('done', 0)
+                self.mutation_total = event.get('total', 0)
+            elif kind == 'experiment_finished':
+                self.finished = True
+                self.success = event.get('success')
+
+    def stage_fraction(self, stage: str) -> float:
+        """Completion of a stage in [0, 1]."""
+        status = self.stages.get(stage)
+        if status in ('done', 'failed'):
+            return 1.0
+        if stage == 'mutation' and status == 'running' and self.mutation_total:
+            return min(1.0, self.mutation_done / self.mutation_total)
+        return 0.0
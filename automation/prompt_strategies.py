@@ -26,7 +26,7 @@ from typing import Dict, Optional, TYPE_CHECKING
 
 # Import for type hints only to avoid circular imports
 if TYPE_CHECKING:
-    from class_context_extractor import ClassContextExtractor
+    from class_context_extractor import ClassContextExtractor, ContextBudget
 
 logger = logging.getLogger(__name__)
 
@@ -47,18 +47,24 @@ class PromptStrategy:
         prompts (Dict): Cached prompt templates
         extractor: ClassContextExtractor for universal mode (or None for legacy)
         template_manager: PromptTemplateManager for universal mode
+        context_budget: Size limit for the class context (universal mode)
+        context_report: Reduction report of the last budgeted context
     """
 
-    def __init__(self, base_path=None, extractor: Optional['ClassContextExtractor'] = None):
+    def __init__(self, base_path=None, extractor: Optional['ClassContextExtractor'] = None,
+                 context_budget: Optional['ContextBudget'] = None):
         """
         Initialize the prompt strategy.
 
         Args:
             base_path: Path to prompts_results directory (legacy mode)
             extractor: ClassContextExtractor instance (universal mode)
+            context_budget: ContextBudget for the class context (universal mode, optional)
         """
         self.extractor = extractor
         self.template_manager = None
+        self.context_budget = context_budget
+        self.context_report = None
 
         # Initialize template manager for universal mode
         if extractor is not None:
@@ -173,6 +179,13 @@ class PromptStrategy:
     def get_context_content(self, context_type):
         """Get context content (universal or legacy mode)."""
         if self.extractor is not None:
+            if self.context_budget is not None:
+                context, self.context_report = self.extractor.extract_context_within_budget(
+                    context_type, self.context_budget)
+                if self.context_report['reductions']:
+                    logger.info(f"Context reduced from {self.context_report['original_chars']} to "
+                                f"{self.context_report['final_chars']} chars to fit budget")
+                return context
             return self.extractor.extract_context(context_type)
 
         # Legacy mode
@@ -224,7 +237,8 @@ class PromptStrategy:
     def _get_placeholders(self, context_type):
         """Create placeholders for template substitution (universal mode)."""
         from prompt_templates import create_placeholders_from_extractor
-        return create_placeholders_from_extractor(self.extractor, context_type)
+        return create_placeholders_from_extractor(self.extractor, context_type,
+                                                  context_code=self.get_context_content(context_type))
 
 
 class SimplePrompting(PromptStrategy):
@@ -268,7 +282,8 @@ class SimplePrompting(PromptStrategy):
                 'response_time': response_time,
                 'strategy': 'simple_prompting',
                 'context_type': context_type,
-                'prompt': final_prompt
+                'prompt': final_prompt,
+                'context_budget': self.context_report
             }
 
         return None
@@ -284,8 +299,9 @@ class ChainOfThoughtPrompting(PromptStrategy):
         3. Generate the test code
     """
 
-    def __init__(self, base_path=None, extractor: Optional['ClassContextExtractor'] = None):
-        super().__init__(base_path, extractor)
+    def __init__(self, base_path=None, extractor: Optional['ClassContextExtractor'] = None,
+                 context_budget: Optional['ContextBudget'] = None):
+        super().__init__(base_path, extractor, context_budget)
         if self.extractor is None:
             self.cot_prompts = self.parse_cot_prompts()
 
@@ -337,9 +353,13 @@ class ChainOfThoughtPrompting(PromptStrategy):
         is_cli_client = hasattr(llm_client, 'command')
 
         if is_cli_client:
-            return self._execute_cli_mode(llm_client, steps, context_type)
+            result = self._execute_cli_mode(llm_client, steps, context_type)
         else:
-            return self._execute_web_mode(llm_client, steps, context_type)
+            result = self._execute_web_mode(llm_client, steps, context_type)
+
+        if result:
+            result['context_budget'] = self.context_report
+        return result
 
     def _execute_cli_mode(self, llm_client, steps, context_type):
         """Execute CoT in CLI mode (sequential prompts)."""
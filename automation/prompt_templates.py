@@ -276,7 +276,8 @@ class PromptTemplateManager:
         return descriptions.get(context_type, context_type)
 
 
-def create_placeholders_from_extractor(extractor, context_type: str) -> PromptPlaceholders:
+def create_placeholders_from_extractor(extractor, context_type: str,
+                                       context_code: Optional[str] = None) -> PromptPlaceholders:
     """
     Create PromptPlaceholders from a ClassContextExtractor.
 
@@ -285,6 +286,7 @@ def create_placeholders_from_extractor(extractor, context_type: str) -> PromptPl
     Args:
         extractor: ClassContextExtractor instance
         context_type: One of 'interface', 'interface_docstring', 'full_context'
+        context_code: Pre-rendered context (e.g. reduced to a budget); extracted if omitted
 
     Returns:
         PromptPlaceholders ready for template substitution
@@ -299,7 +301,7 @@ def create_placeholders_from_extractor(extractor, context_type: str) -> PromptPl
         class_name=info.name,
         module_name=info.module_name,
         import_statement=info.import_statement,
-        context_code=extractor.extract_context(context_type),
+        context_code=context_code if context_code is not None else extractor.extract_context(context_type),
         context_level=PromptTemplateManager.get_context_level_description(context_type),
         helper_types=helper_types_desc,
         public_methods_list=', '.join(info.public_methods)
@@ -0,0 +1,237 @@
+"""
+Lazy Streaming Results API.
+
+Iterates over experiment runs without loading the whole corpus:
+
+    - Filters (model, strategy, context, run) are applied to directory names,
+      so non-matching runs are never opened.
+    - Field projection ("summary.mutation_score", "coverage", ...) returns only
+      the requested values; other sections are dropped right after parsing.
+    - Summary fields are served from the aggregation index written by
+      aggregate_results.py when the run's analysis file is unchanged, so
+      summary-only queries do not open analysis_results.json at all.
+
+Usage:
+    from results_api import iter_experiments
+
+    for record in iter_experiments("cli_results", model="gemini-3-pro",
+                                   fields=["summary.mutation_score"]):
+        print(record["run_path"], record["summary.mutation_score"])
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from aggregate_results import ResultsAggregator
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ('compilation', 'coverage', 'mutation', 'scenarios', 'summary')
+ANALYSIS_FILE_NAME = "analysis_results.json"
+
+# Summary keys whose index column has a different name
+SUMMARY_INDEX_ALIASES = {'context_type': 'context'}
+
+Filter = Optional[Union[str, Iterable[str]]]
+
+
+def _as_set(value: Filter) -> Optional[set]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return {value}
+    return set(value)
+
+
+def _normalize_run(run) -> str:
+    """Accept 1, "1", "001" or "run_001" and return "001"."""
+    run = str(run).replace('run_', '')
+    return f"{int(run):03d}" if run.isdigit() else run
+
+
+class Experiment:
+    """
+    A single experiment run with lazily loaded analysis sections.
+
+    Attributes:
+        run_dir: Path to the run directory
+        model, strategy, context, run: Identifiers taken from the path
+    """
+
+    def __init__(self, run_dir: Path, results_dir: Path, index_entry: Optional[Dict[str, Any]] = None):
+        self.run_dir = run_dir
+        self.results_dir = results_dir
+        rel_parts = run_dir.relative_to(results_dir).parts
+
+        self.run = ''
+        if rel_parts and rel_parts[-1].startswith('run_'):
+            self.run = rel_parts[-1].replace('run_', '')
+            rel_parts = rel_parts[:-1]
+        self.strategy, self.context, self.model = rel_parts[-3:]
+
+        self._index_entry = index_entry
+        self._sections: Dict[str, Any] = {}
+
+    @property
+    def run_path(self) -> str:
+        return self.run_dir.relative_to(self.results_dir).as_posix()
+
+    @property
+    def analysis_file(self) -> Path:
+        return self.run_dir / ANALYSIS_FILE_NAME
+
+    def _index_row(self) -> Optional[Dict[str, Any]]:
+        """Return the cached index row if the analysis file is unchanged."""
+        if self._index_entry is None:
+            return None
+        try:
+            stat = self.analysis_file.stat()
+        except OSError:
+            return None
+        if stat.st_mtime_ns == self._index_entry['mtime_ns'] and stat.st_size == self._index_entry['size']:
+            return self._index_entry['row']
+        return None
+
+    def load_sections(self, names: Iterable[str]) -> None:
+        """Parse the analysis file and keep only the named sections."""
+        wanted = set(names) - set(self._sections)
+        if not wanted:
+            return
+        analysis = {}
+        if self.analysis_file.exists():
+            with open(self.analysis_file, 'r', encoding='utf-8') as f:
+                analysis = json.load(f)
+        for name in wanted:
+            self._sections[name] = analysis.get(name)
+
+    def section(self, name: str) -> Any:
+        """Return one analysis section (compilation, coverage, mutation, scenarios, summary)."""
+        if name not in SECTIONS:
+            raise ValueError(f"Unknown section: {name}. Must be one of: {', '.join(SECTIONS)}")
+        self.load_sections([name])
+        return self._sections.get(name)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """
+        Return a field by dotted path, e.g. "summary.mutation_score" or "coverage".
+        """
+        section_name, _, key = field.partition('.')
+
+        if section_name == 'summary' and key:
+            row = self._index_row()
+            column = SUMMARY_INDEX_ALIASES.get(key, key)
+            if row is not None and column in row and row[column] != '':
+                return row[column]
+
+        value = self.section(section_name)
+        for part in key.split('.') if key else []:
+            if not isinstance(value, dict):
+                return default
+            value = value.get(part)
+        return default if value is None else value
+
+    def project(self, fields: List[str]) -> Dict[str, Any]:
+        """Return identifiers plus the requested fields."""
+        record = {
+            'model': self.model, 'strategy': self.strategy,
+            'context': self.context, 'run': self.run, 'run_path': self.run_path
+        }
+
+        index_row = self._index_row()
+        needed_sections = set()
+        for field in fields:
+            section_name, _, key = field.partition('.')
+            column = SUMMARY_INDEX_ALIASES.get(key, key)
+            if section_name == 'summary' and index_row is not None and index_row.get(column, '') != '':
+                continue
+            needed_sections.add(section_name)
+
+        self.load_sections(needed_sections)
+        for field in fields:
+            record[field] = self.get(field)
+        return record
+
+
+def _discover_run_dirs(results_dir: Path, strategies, contexts, models, runs) -> Iterator[Path]:
+    """Walk strategy/context/model[/run_NNN] directories, pruning by filters."""
+    def children(path: Path, allowed):
+        if not path.is_dir():
+            return []
+        if allowed is not None:
+            return [path / name for name in sorted(allowed) if (path / name).is_dir()]
+        return sorted(p for p in path.iterdir() if p.is_dir() and not p.name.startswith('.'))
+
+    for strategy_dir in children(results_dir, strategies):
+        for context_dir in children(strategy_dir, contexts):
+            for model_dir in children(context_dir, models):
+                run_dirs = sorted(p for p in model_dir.iterdir() if p.is_dir() and p.name.startswith('run_'))
+                if not run_dirs:
+                    if runs is None and (model_dir / ANALYSIS_FILE_NAME).exists():
+                        yield model_dir
+                    continue
+                for run_dir in run_dirs:
+                    if runs is None or _normalize_run(run_dir.name) in runs:
+                        yield run_dir
+
+
+def iter_experiments(results_dir: Union[str, Path] = "cli_results",
+                     model: Filter = None, strategy: Filter = None,
+                     context: Filter = None, run: Filter = None,
+                     fields: Optional[List[str]] = None,
+                     index_dir: Optional[Union[str, Path]] = "data") -> Iterator[Any]:
+    """
+    Iterate over experiment runs matching the given filters.
+
+    Args:
+        results_dir: Root of the results tree
+        model, strategy, context, run: Single value or iterable of allowed values
+        fields: Dotted field paths to project; if omitted, Experiment objects
+                with lazily loaded sections are yielded instead of dicts
+        index_dir: Directory with the aggregation index (None to disable)
+
+    Yields:
+        Dicts with identifiers and projected fields, or Experiment objects
+    """
+    results_dir = Path(results_dir)
+    runs = {_normalize_run(r) for r in _as_set(run)} if run is not None else None
+
+    index = {}
+    if index_dir is not None:
+        aggregator = ResultsAggregator(results_dir, index_dir)
+        aggregator.load_index()
+        index = aggregator.index
+
+    for run_dir in _discover_run_dirs(results_dir, _as_set(strategy), _as_set(context), _as_set(model), runs):
+        rel_key = (run_dir / ANALYSIS_FILE_NAME).relative_to(results_dir).as_posix()
+        experiment = Experiment(run_dir, results_dir, index.get(rel_key))
+        yield experiment.project(fields) if fields is not None else experiment
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Query experiment results with filters and field projection')
+    parser.add_argument('--results-dir', default='cli_results', help='Results directory (default: cli_results)')
+    parser.add_argument('--index-dir', default='data', help='Aggregation index directory (default: data)')
+    parser.add_argument('--model', action='append', help='Filter by model (repeatable)')
+    parser.add_argument('--strategy', action='append', help='Filter by strategy (repeatable)')
+    parser.add_argument('--context', action='append', help='Filter by context (repeatable)')
+    parser.add_argument('--run', action='append', help='Filter by run ID (repeatable)')
+    parser.add_argument('--field', action='append', default=None,
+                        help='Field to project, e.g. summary.mutation_score (repeatable)')
+
+    args = parser.parse_args()
+    fields = args.field or ['summary.mutation_score']
+
+    for record in iter_experiments(args.results_dir, model=args.model, strategy=args.strategy,
+                                   context=args.context, run=args.run, fields=fields,
+                                   index_dir=args.index_dir):
+        print(json.dumps(record, ensure_ascii=False))
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
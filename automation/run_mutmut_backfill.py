@@ -10,17 +10,29 @@ Usage (from WSL):
     python3 -m cli_automation.run_mutmut_backfill --results-dir cli_results --fix-invalid
     python3 -m cli_automation.run_mutmut_backfill --results-dir cli_results --force
     python3 -m cli_automation.run_mutmut_backfill --results-dir cli_results --run-id 001
+    python3 -m cli_automation.run_mutmut_backfill --results-dir cli_results --workers 16
+    python3 -m cli_automation.run_mutmut_backfill --results-dir cli_results --plan --workers 16
 """
 
 import sys
 import os
 import json
+import time
+import hashlib
+import tempfile
 import subprocess
 import logging
 import shutil
+import statistics
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
+
+from aggregate_results import file_sha256
+from mutation_status import write_run_status
 
 logging.basicConfig(
     level=logging.INFO,
@@ -28,6 +40,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+MUTANT_CACHE_DIR_NAME = ".mutant_cache"
+SOURCE_HASH_FILE_NAME = ".source_hash"
+MANIFEST_FILE_NAME = ".backfill_manifest.json"
+MANIFEST_VERSION = 1
+
+# Lock file shared with ExperimentRunner._mutants_lock for exclusive use of the mutants project
+MUTANTS_LOCK_FILE_NAME = ".mutmut.lock"
+
+# Assumed mutmut duration per experiment (seconds) until the manifest has history
+DEFAULT_RUN_DURATION = 450.0
+
+# Invalid results that --fix-invalid re-runs
+FIXABLE_REASONS = ["no_test_results", "no_mutants", "no_results_file", "empty_results_file", "stale_test",
+                   "stale_source"]
+
+# Generated mutmut state that is not copied into a worker's private mutants project
+WORKER_COPY_IGNORE = shutil.ignore_patterns(
+    'mutants', MUTANT_CACHE_DIR_NAME, '.mutmut-cache*', '*.meta', '.coverage', 'mutmut-stats.json', '__pycache__',
+    MUTANTS_LOCK_FILE_NAME
+)
+LOCK_DIR = Path(tempfile.gettempdir()) / "mutmut_backfill_locks"
+
+# Private mutants project of the current pool worker
+_worker_mutants_dir: Optional[Path] = None
+
 
 def check_platform():
     """Exit if running on Windows (mutmut requires fork())."""
@@ -51,6 +88,165 @@ def find_mutants_directory() -> Optional[Path]:
     return None
 
 
+@contextmanager
+def experiment_lock(experiment_dir: Path):
+    """Serialize read-modify-write updates of one experiment's result files across processes."""
+    import fcntl
+
+    LOCK_DIR.mkdir(exist_ok=True)
+    key = hashlib.sha1(str(experiment_dir.resolve()).encode()).hexdigest()
+    with open(LOCK_DIR / f"{key}.lock", 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def mutants_lock(mutants_dir: Path):
+    """Hold the exclusive lock on a shared mutants project that queued experiments also take."""
+    import fcntl
+
+    with open(mutants_dir / MUTANTS_LOCK_FILE_NAME, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def write_text_atomic(path: Path, content: str):
+    """Write a file via a temporary file and rename, so readers never see partial content."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def create_private_mutants_dir(mutants_dir: Path, parent_dir: Path) -> Path:
+    """Copy the mutants project (sources, tests, config) without generated mutmut state."""
+    private_dir = Path(tempfile.mkdtemp(prefix="mutants_", dir=parent_dir))
+    shutil.copytree(mutants_dir, private_dir, ignore=WORKER_COPY_IGNORE, dirs_exist_ok=True)
+    return private_dir
+
+
+def source_tree_hash(src_dir: Path) -> str:
+    """SHA-256 over the relative paths and contents of all files under src_dir."""
+    digest = hashlib.sha256()
+    for path in sorted(p for p in src_dir.rglob("*") if p.is_file() and '__pycache__' not in p.parts):
+        digest.update(path.relative_to(src_dir).as_posix().encode())
+        digest.update(b'\0')
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _reset_meta_results(meta_file: Path):
+    """Drop per-mutant results from a mutmut 3 .meta file, keeping mutant names and function hashes."""
+    with open(meta_file, 'r') as f:
+        meta = json.load(f)
+    meta['exit_code_by_key'] = {key: None for key in meta.get('exit_code_by_key', {})}
+    meta['durations_by_key'] = {}
+    meta['estimated_durations_by_key'] = {}
+    write_text_atomic(meta_file, json.dumps(meta, indent=4))
+
+
+def reset_test_state(mutants_dir: Path):
+    """
+    Remove everything that depends on the test suite, keeping generated mutants.
+
+    This covers mutmut caches, coverage data, test stats, the copied test suite
+    and the per-mutant exit codes stored in .meta files.
+    """
+    paths = list(mutants_dir.glob(".mutmut-cache*")) + [
+        mutants_dir / "pyproject.toml",
+        mutants_dir / ".coverage",
+        mutants_dir / "mutants" / "mutmut-stats.json",
+        mutants_dir / "mutants" / ".coverage",
+    ]
+    for path in paths:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not remove {path}: {e}")
+
+    copied_tests = mutants_dir / "mutants" / "tests"
+    if copied_tests.exists():
+        shutil.rmtree(copied_tests, ignore_errors=True)
+
+    for meta_file in (mutants_dir / "mutants").rglob("*.meta"):
+        try:
+            _reset_meta_results(meta_file)
+        except Exception:
+            meta_file.unlink()
+
+
+def prepare_generated_mutants(mutants_dir: Path, cache_dir: Path) -> str:
+    """
+    Make mutants/mutants match the current source, reusing generated mutants when possible.
+
+    Generated mutants are kept in place while the source hash is unchanged and are
+    otherwise restored from cache_dir/<source hash>. mutmut regenerates a file only
+    when its source is newer than the mutated copy, so restored files are stamped
+    just after their source.
+
+    Returns:
+        "reused", "restored" or "generate"
+    """
+    digest = source_tree_hash(mutants_dir / "src")
+    generated_dir = mutants_dir / "mutants"
+    hash_file = generated_dir / SOURCE_HASH_FILE_NAME
+
+    if hash_file.exists() and hash_file.read_text().strip() == digest:
+        reset_test_state(mutants_dir)
+        return "reused"
+
+    if generated_dir.exists():
+        shutil.rmtree(generated_dir, ignore_errors=True)
+    reset_test_state(mutants_dir)
+
+    cached = cache_dir / digest
+    if not cached.is_dir():
+        return "generate"
+
+    shutil.copytree(cached, generated_dir)
+    for mutated_file in generated_dir.rglob("*.py"):
+        source_file = mutants_dir / mutated_file.relative_to(generated_dir)
+        if source_file.exists():
+            stamp = source_file.stat().st_mtime + 1
+            os.utime(mutated_file, (stamp, stamp))
+    reset_test_state(mutants_dir)
+    hash_file.write_text(digest)
+    return "restored"
+
+
+def save_generated_mutants(mutants_dir: Path, cache_dir: Path):
+    """Store the generated mutants for the current source hash (first writer wins)."""
+    generated_dir = mutants_dir / "mutants"
+    src_generated = generated_dir / "src"
+    if not src_generated.is_dir():
+        return
+
+    digest = source_tree_hash(mutants_dir / "src")
+    (generated_dir / SOURCE_HASH_FILE_NAME).write_text(digest)
+
+    cached = cache_dir / digest
+    if cached.exists():
+        return
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f".{digest[:12]}_", dir=cache_dir))
+    shutil.copytree(src_generated, tmp_dir / "src", ignore=shutil.ignore_patterns('__pycache__'))
+    for meta_file in tmp_dir.rglob("*.meta"):
+        _reset_meta_results(meta_file)
+    try:
+        os.rename(tmp_dir, cached)
+        logger.info(f"Cached generated mutants for source {digest[:12]}")
+    except OSError:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
 def check_existing_results(experiment_dir: Path) -> Tuple[bool, str]:
     """Check if experiment has valid mutation results. Returns (is_valid, reason)."""
     analysis_file = experiment_dir / "analysis_results.json"
@@ -85,7 +281,114 @@ def check_existing_results(experiment_dir: Path) -> Tuple[bool, str]:
         return False, f"json_error: {e}"
 
 
-def run_mutmut_for_experiment(experiment_dir: Path, mutants_dir: Path, force: bool = False):
+class BackfillManifest:
+    """
+    Persistent mutation status of every run in a results tree.
+
+    Stored in <results_dir>/.backfill_manifest.json and keyed by run path
+    relative to the results directory. Each entry holds the status reason from
+    check_existing_results, the SHA-256 of the mutmut test suite and source,
+    the stat signature of the files the status was derived from, the last
+    mutmut duration and an update timestamp. While the signature matches,
+    the status is served without opening analysis_results.json.
+
+    Valid results are reported as "stale_test" when mutmut_test.py changed
+    since they were computed, and as "stale_source" when they were computed
+    for a different mutants/src than source_hash (the current one).
+    """
+
+    TRACKED_FILES = ("analysis_results.json", "mutmut_results.txt", "mutmut_test.py")
+
+    def __init__(self, results_dir: Path, source_hash: Optional[str] = None):
+        self.results_dir = Path(results_dir)
+        self.path = self.results_dir / MANIFEST_FILE_NAME
+        self.source_hash = source_hash
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            return
+        if data.get('version') == MANIFEST_VERSION:
+            self.entries = data.get('runs', {})
+
+    def save(self):
+        data = {'version': MANIFEST_VERSION, 'runs': self.entries}
+        write_text_atomic(self.path, json.dumps(data, indent=1, sort_keys=True))
+
+    def _key(self, experiment_dir: Path) -> str:
+        return experiment_dir.resolve().relative_to(self.results_dir.resolve()).as_posix()
+
+    def _signature(self, experiment_dir: Path) -> Dict[str, Optional[List[int]]]:
+        signature = {}
+        for name in self.TRACKED_FILES:
+            try:
+                stat = (experiment_dir / name).stat()
+                signature[name] = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                signature[name] = None
+        return signature
+
+    def _stale_source(self, entry: Dict[str, Any]) -> bool:
+        """True if the entry's results were computed for a different mutants/src than the current one."""
+        return self.source_hash is not None and entry.get('source_hash') not in (None, self.source_hash)
+
+    def check(self, experiment_dir: Path) -> Tuple[bool, str]:
+        """Return (is_valid, reason) like check_existing_results, using the manifest when fresh."""
+        entry = self.entries.get(self._key(experiment_dir))
+        signature = self._signature(experiment_dir)
+        if entry is not None and entry.get('signature') == signature:
+            if entry['status'] == 'valid' and self._stale_source(entry):
+                return False, "stale_source"
+            return entry['status'] == 'valid', entry['status']
+        return self.refresh(experiment_dir, signature=signature)
+
+    def refresh(self, experiment_dir: Path, duration: Optional[float] = None,
+                source_hash: Optional[str] = None, signature=None) -> Tuple[bool, str]:
+        """Re-derive and record the status of one run."""
+        key = self._key(experiment_dir)
+        entry = self.entries.get(key, {})
+        test_file = experiment_dir / "mutmut_test.py"
+        test_hash = file_sha256(test_file) if test_file.exists() else None
+
+        is_valid, reason = check_existing_results(experiment_dir)
+        if duration is None and is_valid and entry.get('test_hash') not in (None, test_hash):
+            # Results were computed for a different test suite
+            is_valid, reason = False, "stale_test"
+
+        entry_status = reason
+        if source_hash is None and is_valid and self._stale_source(entry):
+            # Results were computed for a different mutated source (derived on every
+            # check from the recorded hash, so the stored status stays "valid")
+            is_valid, reason = False, "stale_source"
+
+        entry.update({
+            'status': entry_status,
+            'signature': signature or self._signature(experiment_dir),
+            'updated': datetime.now().isoformat(),
+        })
+        if duration is not None or 'test_hash' not in entry:
+            entry['test_hash'] = test_hash
+        if duration is not None:
+            entry['duration'] = round(duration, 1)
+        if source_hash is not None:
+            entry['source_hash'] = source_hash
+        self.entries[key] = entry
+        return is_valid, reason
+
+    def estimated_duration(self) -> float:
+        """Median of recorded mutmut durations, or DEFAULT_RUN_DURATION without history."""
+        durations = [e['duration'] for e in self.entries.values() if e.get('duration')]
+        return statistics.median(durations) if durations else DEFAULT_RUN_DURATION
+
+
+def run_mutmut_for_experiment(experiment_dir: Path, mutants_dir: Path, force: bool = False,
+                              cache_dir: Optional[Path] = None):
     logger.info(f"\n{'='*60}")
     try:
         rel_path = experiment_dir.relative_to(Path.cwd())
@@ -140,39 +443,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
         test_dst.write_text(test_content)
         logger.info(f"Copied test to {test_dst} (fixed imports for src-layout)")
 
-        logger.info("Cleaning mutmut cache and temp files...")
-        for cache_file in mutants_dir.glob(".mutmut-cache*"):
-            try:
-                cache_file.unlink()
-            except Exception:
-                pass
-
-        for meta_file in mutants_dir.rglob("*.meta"):
-            try:
-                meta_file.unlink()
-            except Exception:
-                pass
-
-        pyproject_file = mutants_dir / "pyproject.toml"
-        if pyproject_file.exists():
-            try:
-                pyproject_file.unlink()
-            except Exception:
-                pass
-
-        coverage_file = mutants_dir / ".coverage"
-        if coverage_file.exists():
-            try:
-                coverage_file.unlink()
-            except Exception:
-                pass
-
-        mutants_output_dir = mutants_dir / "mutants"
-        if mutants_output_dir.exists():
-            try:
-                shutil.rmtree(mutants_output_dir)
-            except Exception:
-                pass
+        logger.info("Cleaning test-dependent mutmut state...")
+        cache_dir = cache_dir or mutants_dir / MUTANT_CACHE_DIR_NAME
+        mutants_state = prepare_generated_mutants(mutants_dir, cache_dir)
+        logger.info(f"Generated mutants: {mutants_state}")
 
         logger.info("Running mutmut... (this may take 5-10 minutes)")
         run_result = subprocess.run(
@@ -188,6 +462,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
         if run_result.returncode != 0:
             logger.warning(f"Mutmut run returned code {run_result.returncode}")
+        elif mutants_state == "generate":
+            save_generated_mutants(mutants_dir, cache_dir)
 
         results_result = subprocess.run(
             ['mutmut', 'results'], env={**os.environ, 'PATH': os.environ.get('PATH', '') + ':' + str(Path.home() / '.local' / 'bin')},
@@ -196,9 +472,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
             text=True
         )
 
-        mutmut_results_file.write_text(results_result.stdout)
+        write_text_atomic(mutmut_results_file, results_result.stdout)
         logger.info(f"Saved mutation results to {mutmut_results_file}")
 
+        try:
+            write_run_status(
+                experiment_dir, mutants_dir / "src" / "order_calculator.py", results_result.stdout,
+                meta_file=mutants_dir / "mutants" / "src" / "order_calculator.py.meta"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write mutation status array: {e}")
+
         combined_output = run_result.stdout + "\n" + run_result.stderr
         stats = parse_mutmut_results(combined_output)
 
@@ -211,13 +495,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
             else:
                 logger.warning("Could not parse mutation stats - results may be incomplete")
         stats_file = experiment_dir / "mutmut-stats.json"
-        with open(stats_file, 'w') as f:
-            json.dump(stats, f, indent=2)
+        write_text_atomic(stats_file, json.dumps(stats, indent=2))
         logger.info(f"Saved stats: {stats}")
 
-        update_analysis_results(experiment_dir, stats)
-
-        regenerate_markdown_summary(experiment_dir)
+        with experiment_lock(experiment_dir):
+            update_analysis_results(experiment_dir, stats)
+            regenerate_markdown_summary(experiment_dir)
 
         logger.info("Mutation testing completed")
         logger.info(f"  Mutation score: {stats['mutation_score']}%")
@@ -358,8 +641,7 @@ def update_analysis_results(experiment_dir: Path, mutmut_stats: dict):
         analysis['summary']['mutants_survived'] = mutmut_stats.get('survived', 0)
         analysis['summary']['total_mutants'] = mutmut_stats.get('total_mutants', 0)
 
-    with open(analysis_file, 'w') as f:
-        json.dump(analysis, f, indent=2, ensure_ascii=False)
+    write_text_atomic(analysis_file, json.dumps(analysis, indent=2, ensure_ascii=False))
 
     logger.info(f"Updated {analysis_file}")
 
@@ -459,19 +741,79 @@ def regenerate_markdown_summary(experiment_dir: Path):
 
 """
 
-    md_file.write_text(content, encoding='utf-8')
+    write_text_atomic(md_file, content)
     logger.info(f"Regenerated {md_file}")
 
 
-def process_results_directory(results_dir: Path, run_id_filter: str = None, force: bool = False, fix_invalid: bool = False):
-    check_platform()
-
+def _init_worker(mutants_dirs):
+    """Pool initializer: claim one private mutants project for this worker process."""
+    global _worker_mutants_dir
+    _worker_mutants_dir = Path(mutants_dirs.get())
+
+
+def _backfill_task(exp_dir: Path, force: bool, cache_dir: Path):
+    """Pool task: run mutmut for one experiment in the worker's private mutants project."""
+    start = time.perf_counter()
+    success = run_mutmut_for_experiment(exp_dir, _worker_mutants_dir, force=force, cache_dir=cache_dir)
+    return success, time.perf_counter() - start
+
+
+def _run_parallel(experiment_dirs, mutants_dir: Path, force: Dict[Path, bool], workers: int,
+                  on_result=None):
+    """
+    Run experiments on a process pool; each worker owns a copy of the mutants project.
+
+    force maps each experiment directory to the force flag of its run.
+    """
+    counts = {'processed': 0, 'skipped': 0, 'failed': 0}
+    total = len(experiment_dirs)
+    start = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(prefix="mutmut_backfill_") as work_dir:
+        mutants_dirs = multiprocessing.Queue()
+        with mutants_lock(mutants_dir):
+            for _ in range(workers):
+                mutants_dirs.put(str(create_private_mutants_dir(mutants_dir, Path(work_dir))))
+        logger.info(f"Created {workers} private mutants projects in {work_dir}")
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(mutants_dirs,)) as pool:
+            cache_dir = mutants_dir / MUTANT_CACHE_DIR_NAME
+            futures = {pool.submit(_backfill_task, exp_dir, force[exp_dir], cache_dir): exp_dir
+                       for exp_dir in experiment_dirs}
+
+            for done, future in enumerate(as_completed(futures), 1):
+                exp_dir = futures[future]
+                try:
+                    success, duration = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed on {exp_dir}: {e}")
+                    success, duration = None, 0.0
+
+                if success:
+                    counts['processed'] += 1
+                elif success is False:
+                    counts['skipped'] += 1
+                else:
+                    counts['failed'] += 1
+                if on_result is not None:
+                    on_result(exp_dir, success, duration)
+
+                elapsed = time.perf_counter() - start
+                eta = elapsed / done * (total - done)
+                logger.info(f"[{done}/{total}] {exp_dir.parent.name}/{exp_dir.name} finished in {duration:.0f}s - "
+                            f"processed: {counts['processed']}, skipped: {counts['skipped']}, "
+                            f"failed: {counts['failed']}, ETA: {eta / 60:.1f} min")
+
+    return counts
+
+
+def process_results_directory(results_dir: Path, run_id_filter: str = None, force: bool = False,
+                              fix_invalid: bool = False, workers: int = 1, plan: bool = False):
     mutants_dir = find_mutants_directory()
-    if not mutants_dir:
-        logger.error("Cannot proceed without mutants directory")
-        sys.exit(1)
-
-    logger.info(f"Using mutants directory: {mutants_dir}")
+    source_hash = source_tree_hash(mutants_dir / "src") if mutants_dir else None
+    manifest = BackfillManifest(results_dir, source_hash)
+    manifest.load()
 
     if run_id_filter:
         logger.info(f"Filtering for run ID: run_{run_id_filter}")
@@ -483,43 +825,83 @@ def process_results_directory(results_dir: Path, run_id_filter: str = None, forc
         logger.info(f"Force mode: will re-run mutmut even for valid results")
 
     experiment_dirs = []
-    for test_file in results_dir.rglob("mutmut_test.py"):
+    reasons = {}
+    valid_count = 0
+    for test_file in sorted(results_dir.rglob("mutmut_test.py")):
         exp_dir = test_file.parent
 
         if run_id_filter:
             if f"run_{run_id_filter}" not in str(exp_dir):
                 continue
 
+        is_valid, reason = manifest.check(exp_dir)
+
         if fix_invalid:
-            is_valid, reason = check_existing_results(exp_dir)
             if is_valid:
                 continue  # Skip valid experiments
-            if reason not in ["no_test_results", "no_mutants", "no_results_file", "empty_results_file"]:
+            if reason not in FIXABLE_REASONS:
                 continue  # Skip experiments with other issues (like no analysis file)
+        elif is_valid and not force:
+            valid_count += 1
+            continue
 
         experiment_dirs.append(exp_dir)
+        reasons[exp_dir] = reason
+
+    manifest.save()
+
+    if valid_count:
+        logger.info(f"Skipping {valid_count} experiments with valid results (per manifest)")
+
+    if plan:
+        print_plan(results_dir, experiment_dirs, reasons, manifest.estimated_duration(), workers)
+        return
 
     if not experiment_dirs:
         if run_id_filter:
-            logger.warning(f"No experiments found in {results_dir} for run_{run_id_filter}")
+            logger.warning(f"No experiments to process in {results_dir} for run_{run_id_filter}")
         else:
-            logger.warning(f"No experiments found in {results_dir}")
+            logger.warning(f"No experiments to process in {results_dir}")
         return
 
+    check_platform()
+
+    if not mutants_dir:
+        logger.error("Cannot proceed without mutants directory")
+        sys.exit(1)
+
+    logger.info(f"Using mutants directory: {mutants_dir}")
     logger.info(f"Found {len(experiment_dirs)} experiments to process")
 
+    # Stale results look valid to run_mutmut_for_experiment, so fixable runs are forced
+    force_by_dir = {exp_dir: force or reasons[exp_dir] in FIXABLE_REASONS for exp_dir in experiment_dirs}
+
+    def record_result(exp_dir: Path, success, duration: float):
+        manifest.refresh(exp_dir, duration=duration if success else None,
+                         source_hash=source_hash if success else None)
+        manifest.save()
+
     processed_count = 0
     skipped_count = 0
     failed_count = 0
 
-    for exp_dir in experiment_dirs:
-        success = run_mutmut_for_experiment(exp_dir, mutants_dir, force=force)
-        if success:
-            processed_count += 1
-        elif success is False:
-            skipped_count += 1
-        else:
-            failed_count += 1
+    if workers > 1 and len(experiment_dirs) > 1:
+        counts = _run_parallel(experiment_dirs, mutants_dir, force_by_dir, min(workers, len(experiment_dirs)),
+                               on_result=record_result)
+        processed_count, skipped_count, failed_count = counts['processed'], counts['skipped'], counts['failed']
+    else:
+        for exp_dir in experiment_dirs:
+            start = time.perf_counter()
+            # The shared mutants project is used in place, so take turns with queued experiments
+            with mutants_lock(mutants_dir):
+                success = run_mutmut_for_experiment(exp_dir, mutants_dir, force=force_by_dir[exp_dir])
+            record_result(exp_dir, success, time.perf_counter() - start)
+            if success:
+                processed_count += 1
+            elif success is False:
+                skipped_count += 1
+            else:
+                failed_count += 1
 
     logger.info(f"\n{'='*60}")
     logger.info(f"Backfill Summary:")
@@ -529,6 +911,30 @@ def process_results_directory(results_dir: Path, run_id_filter: str = None, forc
     logger.info(f"{'='*60}")
 
 
+def print_plan(results_dir: Path, experiment_dirs: List[Path], reasons: Dict[Path, str],
+               run_duration: float, workers: int):
+    """Print the experiments a backfill would process and its estimated wall time."""
+    print(f"\n{'='*60}")
+    print(f"Backfill plan for {results_dir}")
+    print(f"{'='*60}")
+    for exp_dir in experiment_dirs:
+        print(f"  {exp_dir.relative_to(results_dir).as_posix():<70} {reasons[exp_dir]}")
+
+    by_reason = {}
+    for reason in reasons.values():
+        by_reason[reason] = by_reason.get(reason, 0) + 1
+
+    workers = max(1, min(workers, len(experiment_dirs) or 1))
+    rounds = -(-len(experiment_dirs) // workers)
+    wall_time = rounds * run_duration
+
+    print(f"\nExperiments to process: {len(experiment_dirs)}")
+    for reason, count in sorted(by_reason.items()):
+        print(f"  {reason}: {count}")
+    print(f"Estimated wall time: {wall_time / 3600:.1f} h "
+          f"({run_duration / 60:.1f} min per experiment, {workers} worker(s))")
+
+
 def main():
     import argparse
 
@@ -546,6 +952,12 @@ Examples:
   python3 run_mutmut_backfill.py --results-dir cli_results --run-id 002
   python3 run_mutmut_backfill.py --results-dir cli_results --run-id 003
 
+  # Process all experiments on 16 parallel workers
+  python3 run_mutmut_backfill.py --results-dir cli_results --workers 16
+
+  # Show what would be processed and the estimated wall time
+  python3 run_mutmut_backfill.py --results-dir cli_results --fix-invalid --plan --workers 16
+
   # Process single experiment directory
   python3 run_mutmut_backfill.py --experiment-dir cli_results/simple_prompting/interface/claude-code-sonnet-4.5/run_001
         ''',
@@ -560,7 +972,12 @@ Examples:
     parser.add_argument('--force', action='store_true',
                         help='Re-run mutmut even for experiments with valid results')
     parser.add_argument('--fix-invalid', action='store_true',
-                        help='Only process experiments with invalid results (no_test_results, no_mutants)')
+                        help='Only process experiments with invalid or stale results '
+                             '(no_test_results, no_mutants, stale_test, stale_source, ...)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parallel mutmut workers, each with a private copy of mutants/ (default: 1)')
+    parser.add_argument('--plan', action='store_true',
+                        help='Only print which experiments would be processed and the estimated wall time')
 
     args = parser.parse_args()
 
@@ -576,14 +993,16 @@ Examples:
             logger.error(f"Experiment directory not found: {exp_dir}")
             sys.exit(1)
 
-        run_mutmut_for_experiment(exp_dir, mutants_dir, force=args.force)
+        with mutants_lock(mutants_dir):
+            run_mutmut_for_experiment(exp_dir, mutants_dir, force=args.force)
     else:
         results_dir = Path(args.results_dir)
         if not results_dir.exists():
             logger.error(f"Results directory not found: {results_dir}")
             sys.exit(1)
 
-        process_results_directory(results_dir, run_id_filter=args.run_id, force=args.force, fix_invalid=args.fix_invalid)
+        process_results_directory(results_dir, run_id_filter=args.run_id, force=args.force,
+                                  fix_invalid=args.fix_invalid, workers=args.workers, plan=args.plan)
 
 
 if __name__ == "__main__":
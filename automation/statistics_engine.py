@@ -0,0 +1,266 @@
+"""
+Statistics Engine for Configuration Comparisons.
+
+Computes descriptive statistics and significance tests over the aggregated
+per-run dataset (data/raw_data.csv written by aggregate_results.py):
+
+    - Per-configuration mean, median, std and run count
+    - Bootstrap confidence intervals of the mean (vectorized per configuration,
+      parallelized across configurations with a process pool)
+    - Kruskal-Wallis tests with epsilon-squared effect size across models,
+      strategies and contexts
+    - Pairwise Mann-Whitney U tests with rank-biserial effect size and
+      Holm-corrected p-values
+
+Usage:
+    cd automation
+    python statistics_engine.py --raw-data data/raw_data.csv --output-dir data/stats
+    python statistics_engine.py --resamples 20000 --workers 8
+"""
+
+import os
+import logging
+from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from aggregate_results import SUMMARY_METRICS, CONFIG_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+FACTORS = ['model', 'strategy', 'context']
+
+
+def load_raw_data(raw_data_file="data/raw_data.csv", metrics: Sequence[str] = SUMMARY_METRICS) -> pd.DataFrame:
+    """Load raw_data.csv with metric columns converted to floats."""
+    df = pd.read_csv(raw_data_file, dtype={'run': str})
+    for metric in metrics:
+        df[metric] = pd.to_numeric(df[metric], errors='coerce')
+    return df
+
+
+def describe_configs(df: pd.DataFrame, metrics: Sequence[str] = SUMMARY_METRICS) -> pd.DataFrame:
+    """Return mean, median, std and count of every metric per configuration."""
+    summary = df.groupby(CONFIG_COLUMNS)[list(metrics)].agg(['mean', 'median', 'std', 'count'])
+    summary.columns = [f"{metric}_{stat}" for metric, stat in summary.columns]
+    return summary.reset_index()
+
+
+def bootstrap_means(values: np.ndarray, n_resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Bootstrap the column means of a (runs x metrics) matrix in one vectorized pass.
+
+    All metrics of a configuration share the same resampling indices, so a
+    single (n_resamples x runs) index array drives every metric.
+
+    Returns:
+        Array of shape (n_resamples, metrics); NaN-aware
+    """
+    n_runs = values.shape[0]
+    indices = rng.integers(0, n_runs, size=(n_resamples, n_runs))
+    resampled = values[indices]
+    with np.errstate(invalid='ignore'):
+        return np.nanmean(resampled, axis=1)
+
+
+def _bootstrap_config(task):
+    """Worker: bootstrap CIs for all metrics of one configuration."""
+    config, values, n_resamples, confidence, seed = task
+    rng = np.random.default_rng(seed)
+    alpha = (1 - confidence) / 2
+
+    means = bootstrap_means(values, n_resamples, rng)
+    lower = np.nanquantile(means, alpha, axis=0)
+    upper = np.nanquantile(means, 1 - alpha, axis=0)
+    point = np.nanmean(values, axis=0)
+    return config, point, lower, upper
+
+
+def bootstrap_confidence_intervals(df: pd.DataFrame, metrics: Sequence[str] = SUMMARY_METRICS,
+                                   n_resamples: int = 10000, confidence: float = 0.95,
+                                   workers: Optional[int] = None, seed: int = 0) -> pd.DataFrame:
+    """
+    Compute bootstrap confidence intervals of the mean per configuration and metric.
+
+    Args:
+        df: Raw per-run data
+        metrics: Metric columns to bootstrap
+        n_resamples: Number of bootstrap resamples
+        confidence: Confidence level of the interval
+        workers: Process count (default: all cores; 1 runs in-process)
+        seed: Base seed; each configuration gets an independent child seed
+
+    Returns:
+        Long-format DataFrame with model, strategy, context, metric, mean, ci_lower, ci_upper
+    """
+    metrics = list(metrics)
+    groups = list(df.groupby(CONFIG_COLUMNS))
+    seeds = np.random.SeedSequence(seed).spawn(len(groups))
+
+    tasks = [
+        (config, group[metrics].to_numpy(dtype=float), n_resamples, confidence, child_seed)
+        for (config, group), child_seed in zip(groups, seeds)
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(_bootstrap_config, tasks))
+    else:
+        results = [_bootstrap_config(task) for task in tasks]
+
+    rows = []
+    for config, point, lower, upper in results:
+        for i, metric in enumerate(metrics):
+            rows.append(dict(zip(CONFIG_COLUMNS, config), metric=metric,
+                             mean=point[i], ci_lower=lower[i], ci_upper=upper[i]))
+    return pd.DataFrame(rows)
+
+
+def kruskal_wallis(df: pd.DataFrame, factor: str, metrics: Sequence[str] = SUMMARY_METRICS) -> pd.DataFrame:
+    """
+    Kruskal-Wallis H test of each metric across the levels of one factor.
+
+    Effect size is epsilon-squared: H / (n - 1).
+    """
+    rows = []
+    for metric in metrics:
+        samples = [g[metric].dropna().to_numpy() for _, g in df.groupby(factor)]
+        samples = [s for s in samples if len(s) > 0]
+        n = sum(len(s) for s in samples)
+        k = len(samples)
+
+        if k < 2 or n <= k:
+            continue
+        try:
+            h_stat, p_value = stats.kruskal(*samples)
+        except ValueError:
+            # All values identical
+            h_stat, p_value = 0.0, 1.0
+
+        rows.append({
+            'factor': factor, 'metric': metric, 'groups': k, 'n': n,
+            'h_statistic': h_stat, 'p_value': p_value,
+            'epsilon_squared': h_stat / (n - 1)
+        })
+    return pd.DataFrame(rows)
+
+
+def holm_correction(p_values: np.ndarray) -> np.ndarray:
+    """Return Holm-Bonferroni adjusted p-values."""
+    p_values = np.asarray(p_values, dtype=float)
+    m = len(p_values)
+    if m == 0:
+        return p_values
+    order = np.argsort(p_values)
+    adjusted = np.maximum.accumulate(p_values[order] * (m - np.arange(m)))
+    result = np.empty(m)
+    result[order] = np.minimum(adjusted, 1.0)
+    return result
+
+
+def mann_whitney_pairwise(df: pd.DataFrame, factor: str, metrics: Sequence[str] = SUMMARY_METRICS) -> pd.DataFrame:
+    """
+    Pairwise two-sided Mann-Whitney U tests between the levels of one factor.
+
+    Effect size is the rank-biserial correlation 2*U1/(n1*n2) - 1, positive
+    when level_a tends to be larger. P-values are Holm-corrected per metric.
+    """
+    levels = sorted(df[factor].dropna().unique())
+    rows = []
+
+    for metric in metrics:
+        samples = {level: df.loc[df[factor] == level, metric].dropna().to_numpy() for level in levels}
+        metric_rows = []
+        for level_a, level_b in combinations(levels, 2):
+            a, b = samples[level_a], samples[level_b]
+            if len(a) == 0 or len(b) == 0:
+                continue
+            u_stat, p_value = stats.mannwhitneyu(a, b, alternative='two-sided')
+            metric_rows.append({
+                'factor': factor, 'metric': metric, 'level_a': level_a, 'level_b': level_b,
+                'n_a': len(a), 'n_b': len(b), 'u_statistic': u_stat, 'p_value': p_value,
+                'rank_biserial': 2 * u_stat / (len(a) * len(b)) - 1
+            })
+
+        adjusted = holm_correction([r['p_value'] for r in metric_rows])
+        for row, p_adj in zip(metric_rows, adjusted):
+            row['p_value_holm'] = p_adj
+        rows.extend(metric_rows)
+
+    return pd.DataFrame(rows)
+
+
+def run_report(raw_data_file="data/raw_data.csv", output_dir="data/stats",
+               metrics: Sequence[str] = SUMMARY_METRICS, n_resamples: int = 10000,
+               confidence: float = 0.95, workers: Optional[int] = None,
+               seed: int = 0) -> Dict[str, pd.DataFrame]:
+    """Compute the full statistics report and write one CSV per table."""
+    df = load_raw_data(raw_data_file, metrics)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    report = {
+        'config_summary': describe_configs(df, metrics),
+        'bootstrap_ci': bootstrap_confidence_intervals(df, metrics, n_resamples, confidence, workers, seed),
+        'kruskal_wallis': pd.concat([kruskal_wallis(df, f, metrics) for f in FACTORS], ignore_index=True),
+        'mann_whitney': pd.concat([mann_whitney_pairwise(df, f, metrics) for f in FACTORS], ignore_index=True),
+    }
+
+    for name, table in report.items():
+        table.to_csv(output_dir / f"{name}.csv", index=False)
+        logger.info("Wrote %s (%d rows)", output_dir / f"{name}.csv", len(table))
+
+    return report
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(
+        description='Compute per-configuration statistics, bootstrap CIs and significance tests',
+        epilog='''
+Examples:
+  # Full report with defaults (10000 resamples, all cores)
+  python statistics_engine.py --raw-data data/raw_data.csv --output-dir data/stats
+
+  # Reproducible report with more resamples on 8 workers
+  python statistics_engine.py --resamples 20000 --workers 8 --seed 42
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--raw-data', default='data/raw_data.csv',
+                        help='Per-run CSV from aggregate_results.py (default: data/raw_data.csv)')
+    parser.add_argument('--output-dir', default='data/stats',
+                        help='Directory for report CSV files (default: data/stats)')
+    parser.add_argument('--resamples', type=int, default=10000,
+                        help='Bootstrap resamples (default: 10000)')
+    parser.add_argument('--confidence', type=float, default=0.95,
+                        help='Confidence level (default: 0.95)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for bootstrap (default: all cores)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed (default: 0)')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if not Path(args.raw_data).exists():
+        logger.error("Raw data not found: %s (run aggregate_results.py first)", args.raw_data)
+        return 1
+
+    start = time.perf_counter()
+    run_report(args.raw_data, args.output_dir, n_resamples=args.resamples,
+               confidence=args.confidence, workers=args.workers, seed=args.seed)
+    logger.info("Report completed in %.2fs", time.perf_counter() - start)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
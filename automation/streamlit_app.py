@@ -9,15 +9,27 @@ Usage:
 """
 
 import streamlit as st
-import subprocess
-import sys
+import altair as alt
+import pandas as pd
 import json
 import platform
 import html
+import hashlib
+import time
 from pathlib import Path
 from datetime import datetime
 
+from aggregate_results import ResultsAggregator, SUMMARY_METRICS
+from job_queue import JobQueue, ensure_worker, DEFAULT_WORKERS, ACTIVE_STATUSES
+from progress_events import EventReader, ProgressState, STAGES, STAGE_LABELS
+
 IS_WINDOWS = platform.system() == "Windows"
+APP_DIR = Path(__file__).parent
+DATA_DIR = APP_DIR / "data"
+UPLOADS_DIR = DATA_DIR / "uploads"
+
+# Seconds between two redraws of the jobs view while jobs are active
+REFRESH_INTERVAL = 2.0
 
 st.set_page_config(
     page_title="LLM Test Generator",
@@ -273,11 +285,10 @@ def get_model_display_name(model_id: str) -> str:
 
 
 def get_class_info(file_path: Path, class_name: str = None):
-    """Extract class info using ClassContextExtractor."""
+    """Extract class info using the cached ClassContextExtractor analysis."""
     try:
-        from class_context_extractor import ClassContextExtractor
-        extractor = ClassContextExtractor(file_path, class_name)
-        return extractor.get_class_info()
+        from class_context_extractor import load_class_context
+        return load_class_context(file_path, class_name).info
     except Exception:
         return None
 
@@ -285,13 +296,66 @@ def get_class_info(file_path: Path, class_name: str = None):
 def get_context_preview(file_path: Path, context_level: str, class_name: str = None):
     """Extract context at specified level for preview."""
     try:
-        from class_context_extractor import ClassContextExtractor
-        extractor = ClassContextExtractor(file_path, class_name)
-        return extractor.extract_context(context_level)
+        from class_context_extractor import load_class_context
+        parsed = load_class_context(file_path, class_name)
+        return parsed.contexts.get(context_level) or parsed.extractor.extract_context(context_level)
     except Exception as e:
         return f"Error: {e}"
 
 
+def resolve_results_dir(results_dir: str) -> Path:
+    """Resolve a results directory relative to the app directory."""
+    path = Path(results_dir)
+    return path if path.is_absolute() else APP_DIR / path
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _load_run_metrics(run_dir: str, analysis_mtime_ns: int, experiment_mtime_ns: int) -> dict:
+    """Read metrics of one run; cached until either JSON file changes."""
+    run_dir = Path(run_dir)
+    analysis_file = run_dir / "analysis_results.json"
+    if not analysis_file.exists():
+        exp_file = run_dir / "experiment_results.json"
+        if exp_file.exists():
+            with open(exp_file) as f:
+                data = json.load(f)
+            return {
+                "statement_coverage": 0,
+                "branch_coverage": 0,
+                "mutation_score": 0,
+                "tests_passed": 0,
+                "tests_failed": 0,
+                "total_tests": 0,
+                "quality_score": 0,
+                "response_time": data.get("response_time", 0),
+                "run_dir": str(run_dir),
+            }
+        return None
+
+    with open(analysis_file) as f:
+        data = json.load(f)
+
+    summary = data.get("summary", {})
+    return {
+        "statement_coverage": summary.get("statement_coverage", 0),
+        "branch_coverage": summary.get("branch_coverage", 0),
+        "mutation_score": summary.get("mutation_score", 0),
+        "tests_passed": summary.get("tests_passed", 0),
+        "tests_failed": summary.get("tests_failed", 0),
+        "total_tests": summary.get("tests_generated", 0),
+        "quality_score": summary.get("overall_quality_score", 0),
+        "response_time": summary.get("response_time", 0),
+        "run_dir": str(run_dir),
+    }
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
 def parse_experiment_results(results_dir: str, strategy: str, context: str, model: str) -> dict:
     """Parse experiment results from most recent run."""
     try:
@@ -305,63 +369,40 @@ def parse_experiment_results(results_dir: str, strategy: str, context: str, mode
         )
         run_dir = runs[0] if runs else base_path
 
-        analysis_file = run_dir / "analysis_results.json"
-        if not analysis_file.exists():
-            exp_file = run_dir / "experiment_results.json"
-            if exp_file.exists():
-                with open(exp_file) as f:
-                    data = json.load(f)
-                return {
-                    "statement_coverage": 0,
-                    "branch_coverage": 0,
-                    "mutation_score": 0,
-                    "tests_passed": 0,
-                    "tests_failed": 0,
-                    "total_tests": 0,
-                    "quality_score": 0,
-                    "response_time": data.get("response_time", 0),
-                    "run_dir": str(run_dir),
-                }
-            return None
-
-        with open(analysis_file) as f:
-            data = json.load(f)
-
-        summary = data.get("summary", {})
-        return {
-            "statement_coverage": summary.get("statement_coverage", 0),
-            "branch_coverage": summary.get("branch_coverage", 0),
-            "mutation_score": summary.get("mutation_score", 0),
-            "tests_passed": summary.get("tests_passed", 0),
-            "tests_failed": summary.get("tests_failed", 0),
-            "total_tests": summary.get("tests_generated", 0),
-            "quality_score": summary.get("overall_quality_score", 0),
-            "response_time": summary.get("response_time", 0),
-            "run_dir": str(run_dir),
-        }
+        return _load_run_metrics(
+            str(run_dir),
+            _mtime_ns(run_dir / "analysis_results.json"),
+            _mtime_ns(run_dir / "experiment_results.json")
+        )
     except Exception:
         return None
 
 
-def run_experiment(source_file: str, model: str, strategy: str, context: str,
-                   class_name: str = None, run_id: int = None, results_dir: str = None):
-    """Run experiment using CLI runner."""
-    cmd = [sys.executable, "cli_experiment_runner.py",
-           "--model", model, "--strategy", strategy, "--context", context]
+@st.cache_data(show_spinner=False, ttl=5)
+def get_results_signature(results_dir: str) -> tuple:
+    """Cheap fingerprint of a results tree: analysis file count and latest mtime."""
+    mtimes = [_mtime_ns(p) for p in Path(results_dir).rglob("analysis_results.json")]
+    return len(mtimes), max(mtimes, default=0)
 
-    if source_file:
-        cmd.extend(["--source-file", source_file])
-    if class_name:
-        cmd.extend(["--class-name", class_name])
-    if run_id:
-        cmd.extend(["--run-id", str(run_id)])
-    if results_dir:
-        cmd.extend(["--results-dir", results_dir])
 
-    return subprocess.Popen(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-        text=True, cwd=str(Path(__file__).parent), bufsize=1
-    )
+@st.cache_data(show_spinner="Loading results corpus...", max_entries=4)
+def load_corpus(results_dir: str, signature: tuple) -> pd.DataFrame:
+    """
+    Load one row per run via the incremental aggregator.
+
+    Cached per results tree signature, so a new or updated run invalidates
+    the cache and only the changed files are re-read by the aggregator.
+    """
+    aggregator = ResultsAggregator(results_dir, DATA_DIR / Path(results_dir).name)
+    aggregator.load_index()
+    if aggregator.refresh():
+        aggregator.output_dir.mkdir(parents=True, exist_ok=True)
+        aggregator.save_index()
+
+    df = pd.DataFrame(aggregator.get_rows())
+    for metric in df.columns.difference(["model", "strategy", "context", "run", "run_path", "timestamp"]):
+        df[metric] = pd.to_numeric(df[metric], errors="coerce")
+    return df
 
 
 def render_config_view():
@@ -392,9 +433,12 @@ def render_config_view():
             with input_col2:
                 uploaded = st.file_uploader("or upload", type=["py"], label_visibility="collapsed")
                 if uploaded:
-                    temp = Path(__file__).parent / "temp_upload.py"
-                    temp.write_bytes(uploaded.getvalue())
-                    source_file = str(temp)
+                    # Keyed by content so queued jobs keep their own copy of the upload
+                    content = uploaded.getvalue()
+                    upload_path = UPLOADS_DIR / hashlib.sha256(content).hexdigest()[:16] / uploaded.name
+                    upload_path.parent.mkdir(parents=True, exist_ok=True)
+                    upload_path.write_bytes(content)
+                    source_file = str(upload_path)
 
             if source_file and Path(source_file).exists():
                 class_info = get_class_info(Path(source_file))
@@ -444,19 +488,19 @@ def render_config_view():
 
         st.markdown("---")
         st.markdown('<div class="section-header">Advanced Options</div>', unsafe_allow_html=True)
-        adv_col1, adv_col2 = st.columns(2)
+        adv_col1, adv_col2, adv_col3 = st.columns(3)
         with adv_col1:
             run_id = st.number_input("Run ID (0 = auto)", min_value=0, value=0)
         with adv_col2:
             results_dir = st.text_input("Results directory", value="cli_results")
+        with adv_col3:
+            repeat = st.number_input("Runs to queue", min_value=1, value=1, disabled=run_id > 0)
 
         st.markdown("---")
         can_run = mode == "Legacy (OrderCalculator)" or (source_file and Path(source_file).exists() and class_info)
 
-        if st.button("Run Experiment", disabled=not can_run, use_container_width=True, type="primary"):
-            st.session_state.running = True
-            st.session_state.output = []
-            st.session_state.config = {
+        if st.button("Queue Experiment", disabled=not can_run, use_container_width=True, type="primary"):
+            config = {
                 "mode": mode,
                 "source_file": source_file if mode == "Universal (Any Class)" else None,
                 "class_name": class_name,
@@ -464,8 +508,11 @@ def render_config_view():
                 "strategy": strategy,
                 "context": context,
                 "run_id": run_id if run_id > 0 else None,
-                "results_dir": results_dir
+                "results_dir": results_dir if results_dir != "cli_results" else None
             }
+            JobQueue().submit_many([config] * (1 if run_id > 0 else int(repeat)))
+            ensure_worker(max_workers=st.session_state.max_workers)
+            st.session_state.next_view = "Jobs"
             st.rerun()
 
         if IS_WINDOWS:
@@ -501,44 +548,189 @@ def render_config_view():
     return selected_model, strategy, context
 
 
-def render_running_view():
-    """Render the running experiment view."""
-    config = st.session_state.config
-    model_name = get_model_display_name(config["model"])
+def render_corpus_view():
+    """Render sortable tables and distribution charts for all runs."""
+    st.markdown('<h1 class="main-title">Results Corpus</h1>', unsafe_allow_html=True)
 
-    st.markdown(f'<h1 class="main-title">Processing with {model_name}...</h1>', unsafe_allow_html=True)
+    results_dir = st.text_input("Results directory", value="cli_results", key="corpus_results_dir")
+    resolved_dir = resolve_results_dir(results_dir)
+    if not resolved_dir.exists():
+        st.info("Results directory not found.")
+        return
 
-    console = st.empty()
+    df = load_corpus(str(resolved_dir), get_results_signature(str(resolved_dir)))
+    if df.empty:
+        st.info("No analysis results found.")
+        return
 
-    process = run_experiment(
-        config["source_file"],
-        config["model"],
-        config["strategy"],
-        config["context"],
-        config["class_name"],
-        config["run_id"],
-        config["results_dir"] if config["results_dir"] != "cli_results" else None
-    )
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        models = st.multiselect("Model", sorted(df["model"].unique()), format_func=get_model_display_name)
+    with col2:
+        strategies = st.multiselect("Strategy", sorted(df["strategy"].unique()))
+    with col3:
+        contexts = st.multiselect("Context", sorted(df["context"].unique()))
 
-    lines = []
-    for line in process.stdout:
-        lines.append(line.strip())
-        console.code("\n".join(lines[-30:]), language="")
+    mask = pd.Series(True, index=df.index)
+    if models:
+        mask &= df["model"].isin(models)
+    if strategies:
+        mask &= df["strategy"].isin(strategies)
+    if contexts:
+        mask &= df["context"].isin(contexts)
+    filtered = df[mask]
 
-    process.wait()
-    success = process.returncode == 0
+    st.caption(f"{len(filtered)} of {len(df)} runs")
 
-    actual_dir = config["results_dir"] or "cli_results"
-    metrics = parse_experiment_results(actual_dir, config["strategy"], config["context"], config["model"])
+    metric_col, group_col = st.columns(2)
+    with metric_col:
+        metric = st.selectbox("Metric", SUMMARY_METRICS, index=SUMMARY_METRICS.index("mutation_score"))
+    with group_col:
+        group_by = st.selectbox("Group by", ["model", "strategy", "context"])
 
-    st.session_state.running = False
-    st.session_state.output = lines
+    st.markdown("---")
+    st.markdown('<div class="section-header">Distribution</div>', unsafe_allow_html=True)
+    chart = alt.Chart(filtered).mark_boxplot(extent="min-max").encode(
+        x=alt.X(f"{group_by}:N", title=None),
+        y=alt.Y(f"{metric}:Q", title=metric.replace("_", " ").title()),
+        color=alt.Color(f"{group_by}:N", legend=None)
+    ).properties(height=320)
+    st.altair_chart(chart, use_container_width=True)
+
+    st.markdown('<div class="section-header">Per-configuration Summary</div>', unsafe_allow_html=True)
+    summary = filtered.groupby(["model", "strategy", "context"])[SUMMARY_METRICS].mean().round(1).reset_index()
+    st.dataframe(summary, use_container_width=True, hide_index=True)
+
+    st.markdown('<div class="section-header">All Runs</div>', unsafe_allow_html=True)
+    columns = ["model", "strategy", "context", "run"] + SUMMARY_METRICS
+    st.dataframe(filtered[columns], use_container_width=True, hide_index=True, height=420)
+
+
+def open_job_results(job: dict):
+    """Switch to the results view for a finished job."""
+    run_dir = resolve_results_dir(job["result_dir"]) if job["result_dir"] else None
+    metrics = None
+    if run_dir is not None:
+        metrics = _load_run_metrics(
+            str(run_dir),
+            _mtime_ns(run_dir / "analysis_results.json"),
+            _mtime_ns(run_dir / "experiment_results.json")
+        )
+
+    output = []
+    if job["log_file"] and Path(job["log_file"]).exists():
+        output = Path(job["log_file"]).read_text(encoding="utf-8", errors="replace").splitlines()
+
+    st.session_state.config = job["config"]
     st.session_state.metrics = metrics
+    st.session_state.output = output
     st.session_state.result = {
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "success": success
+        "timestamp": datetime.fromtimestamp(job["finished_at"] or time.time()).strftime("%Y-%m-%d %H:%M:%S"),
+        "success": job["status"] == "succeeded"
     }
-    st.rerun()
+
+
+def job_progress(job: dict) -> ProgressState:
+    """Return the progress of a job, reading only events appended since the last rerun."""
+    trackers = st.session_state.job_progress
+    if job["id"] not in trackers:
+        trackers[job["id"]] = (EventReader(Path(job["events_file"])), ProgressState())
+    reader, progress = trackers[job["id"]]
+    progress.apply(reader.read_new())
+    return progress
+
+
+def render_active_job(queue: JobQueue, job: dict):
+    """Render status and stage progress bars of a queued or running job."""
+    config = job["config"]
+    with st.container():
+        head_col, button_col = st.columns([5, 1])
+        with head_col:
+            st.markdown(f"**#{job['id']}** {get_model_display_name(config['model'])} - "
+                        f"{config['strategy']} - {config['context']} ({job['status']})")
+        with button_col:
+            if st.button("Cancel", key=f"cancel_{job['id']}", use_container_width=True):
+                queue.cancel(job["id"])
+                st.rerun()
+
+        if job["status"] != "running" or not job["events_file"]:
+            return
+
+        progress = job_progress(job)
+        for stage in STAGES:
+            label = f"{STAGE_LABELS[stage]} - {progress.stages[stage]}"
+            if stage == "mutation" and progress.mutation_total:
+                label += f" ({progress.mutation_done}/{progress.mutation_total})"
+            st.progress(progress.stage_fraction(stage), text=label)
+        if progress.tests_passed or progress.tests_failed:
+            st.caption(f"Tests: {progress.tests_passed} passed, {progress.tests_failed} failed")
+
+
+def render_jobs_view():
+    """Render the background job queue: worker status, active jobs and history."""
+    st.markdown('<h1 class="main-title">Experiment Jobs</h1>', unsafe_allow_html=True)
+    queue = JobQueue()
+
+    worker = queue.active_worker()
+    status_col, workers_col = st.columns([3, 1])
+    with workers_col:
+        max_workers = st.number_input("Concurrent experiments", min_value=1, max_value=32,
+                                      value=st.session_state.max_workers)
+        if max_workers != st.session_state.max_workers:
+            st.session_state.max_workers = int(max_workers)
+            if worker is not None:
+                queue.set_max_workers(st.session_state.max_workers)
+    with status_col:
+        counts = queue.counts()
+        st.caption(" | ".join(f"{status}: {counts.get(status, 0)}"
+                              for status in ("queued", "running", "succeeded", "failed", "cancelled")))
+        if worker is not None:
+            st.caption(f"Worker running (pid {worker['pid']}, up to {worker['max_workers']} concurrent)")
+        elif counts.get("queued"):
+            st.warning("Jobs are queued but no worker is running.")
+            if st.button("Start Worker"):
+                ensure_worker(max_workers=st.session_state.max_workers)
+                st.rerun()
+        else:
+            st.caption("Worker idle")
+
+    jobs = queue.list_jobs()
+    active = [job for job in jobs if job["status"] in ACTIVE_STATUSES]
+    finished = [job for job in jobs if job["status"] not in ACTIVE_STATUSES]
+
+    if active:
+        st.markdown('<div class="section-header">Active</div>', unsafe_allow_html=True)
+        for job in reversed(active):
+            render_active_job(queue, job)
+
+    if finished:
+        st.markdown('<div class="section-header">Finished</div>', unsafe_allow_html=True)
+        history = pd.DataFrame([{
+            "id": job["id"],
+            "status": job["status"],
+            "model": job["config"]["model"],
+            "strategy": job["config"]["strategy"],
+            "context": job["config"]["context"],
+            "duration_s": round(job["finished_at"] - job["started_at"]) if job["started_at"] and job["finished_at"] else None,
+            "result_dir": job["result_dir"] or "",
+        } for job in finished])
+        st.dataframe(history, use_container_width=True, hide_index=True)
+
+        open_col, button_col = st.columns([3, 1])
+        with open_col:
+            selected = st.selectbox("Open results of job", [job["id"] for job in finished],
+                                    label_visibility="collapsed")
+        with button_col:
+            if st.button("Open Results", use_container_width=True):
+                open_job_results(next(job for job in finished if job["id"] == selected))
+                st.rerun()
+
+    if not jobs:
+        st.info("No jobs yet. Queue an experiment from the Run Experiment view.")
+
+    if active:
+        time.sleep(REFRESH_INTERVAL)
+        st.rerun()
 
 
 def render_results_view():
@@ -642,8 +834,8 @@ def render_results_view():
             st.code("\n".join(st.session_state.output[-100:]), language="")
 
     st.markdown("---")
-    if st.button("Run Another Experiment", use_container_width=True):
-        st.session_state.running = False
+    if st.button("Back", use_container_width=True):
+        st.session_state.next_view = "Jobs"
         st.session_state.result = None
         st.session_state.metrics = None
         st.session_state.output = []
@@ -651,8 +843,6 @@ def render_results_view():
 
 
 def main():
-    if "running" not in st.session_state:
-        st.session_state.running = False
     if "output" not in st.session_state:
         st.session_state.output = []
     if "result" not in st.session_state:
@@ -661,16 +851,27 @@ def main():
         st.session_state.metrics = None
     if "config" not in st.session_state:
         st.session_state.config = None
+    if "max_workers" not in st.session_state:
+        st.session_state.max_workers = DEFAULT_WORKERS
+    if "job_progress" not in st.session_state:
+        st.session_state.job_progress = {}
+    if "next_view" in st.session_state:
+        st.session_state.view = st.session_state.pop("next_view")
 
     main_container = st.empty()
 
     with main_container.container():
-        if st.session_state.running:
-            render_running_view()
-        elif st.session_state.result is not None:
+        if st.session_state.result is not None:
             render_results_view()
         else:
-            render_config_view()
+            view = st.radio("View", ["Run Experiment", "Jobs", "Results Corpus"], key="view",
+                            horizontal=True, label_visibility="collapsed")
+            if view == "Results Corpus":
+                render_corpus_view()
+            elif view == "Jobs":
+                render_jobs_view()
+            else:
+                render_config_view()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,323 @@
+"""
+Vectorized batch pricing for many orders at once.
+
+Orders are passed in columnar form: the item prices and quantities of all
+orders concatenated into two arrays, plus an offsets array where order i
+spans lines offsets[i]:offsets[i + 1]. Subtotals, discounts, shipping, tax and
+totals follow OrderCalculator.calculate_total step by step, using NumPy
+operations over all orders instead of Python code per order and per item.
+
+Per-line products and all per-order steps are the same IEEE operations as the
+scalar path. Subtotals are summed line by line in insertion order, vectorized
+across orders, with the same additions as the sum() in get_subtotal (the
+compensated summation of Python 3.12+ included), so results are
+bit-identical to calculate_total of default orders. With exact=True every
+subtotal is summed exactly (correctly rounded, like get_subtotal of an order
+created with exact_subtotal=True) and results are bit-identical to
+calculate_total of such orders.
+
+price_orders_minor is the fixed-point counterpart: integer minor-unit prices
+in, int64 minor-unit results out, with the rounding rule of
+fixed_point.FixedPointOrderCalculator, so results equal calculate_total_minor.
+
+price_discounts evaluates one order for a whole grid of discount rates: the
+subtotal is computed once and every discount goes through the same
+apply_discount / calculate_shipping / calculate_tax steps, so each result is
+bit-identical to calculate_total(discount).
+
+Usage:
+    prices, quantities, offsets = columns_from_orders(orders)
+    result = price_orders(prices, quantities, offsets, discounts=0.1)
+    result.total  # one total per order
+
+    grid = price_discounts(order, np.linspace(0.0, 0.5, 51))
+    grid.total  # one total per discount
+
+    result = price_orders_minor(to_minor_columns(prices), quantities, offsets, discounts=0.1)
+    result.total  # one total per order, in cents
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+from compact_order import CompactOrderCalculator
+from fixed_point import FixedPointOrderCalculator, decimal_ratio, to_minor_units
+from order_calculator import _SEQUENTIAL_SUM, OrderCalculator
+
+# Orders with more lines than this are summed with sum() one by one instead of in the vectorized pass
+_MAX_VECTORIZED_LINES = 256
+
+
+@dataclass
+class BatchTotals:
+    """
+    Pricing results, one array element per order (or per discount for price_discounts).
+
+    :ivar subtotal: Sum of price * quantity over the order's items.
+    :ivar discounted_subtotal: Subtotal after the order's discount.
+    :ivar shipping: Shipping cost (0.0 at or above the free shipping threshold).
+    :ivar tax: Tax on discounted subtotal + shipping.
+    :ivar total: Discounted subtotal + shipping + tax.
+    """
+    subtotal: np.ndarray
+    discounted_subtotal: np.ndarray
+    shipping: np.ndarray
+    tax: np.ndarray
+    total: np.ndarray
+
+
+def columns_from_orders(orders: Iterable[OrderCalculator]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts OrderCalculator instances to columnar form.
+
+    The storage columns of CompactOrderCalculator instances are read through the
+    buffer protocol, without building per-item dicts.
+
+    :param orders: The orders to convert.
+    :return: Tuple of (prices, quantities, offsets) arrays.
+    """
+    prices, quantities, offsets = [], [], [0]
+    for order in orders:
+        if isinstance(order, CompactOrderCalculator):
+            _, order_prices, order_quantities = order.columns()
+        else:
+            items = order.items
+            order_prices = [item["price"] for item in items]
+            order_quantities = [item["quantity"] for item in items]
+        prices.append(np.asarray(order_prices, dtype=np.float64))
+        quantities.append(np.asarray(order_quantities, dtype=np.int64))
+        offsets.append(offsets[-1] + len(order_prices))
+    if not prices:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    return np.concatenate(prices), np.concatenate(quantities), np.asarray(offsets, dtype=np.int64)
+
+
+def _validate_columns(prices: np.ndarray, quantities: np.ndarray, offsets: np.ndarray):
+    """
+    Validates columnar orders with the errors of OrderCalculator.add_item and get_subtotal.
+
+    :raises ValueError: If a price <= 0, a quantity < 1, an order is empty or the offsets are inconsistent.
+    :raises TypeError: If quantities are not integers.
+    """
+    if prices.ndim != 1 or quantities.shape != prices.shape:
+        raise ValueError("Prices and quantities must be 1-D arrays of equal length.")
+    if not np.issubdtype(quantities.dtype, np.integer):
+        raise TypeError("Quantity must be an integer.")
+    if offsets.ndim != 1 or len(offsets) < 1 or offsets[0] != 0 or offsets[-1] != len(prices):
+        raise ValueError("Offsets must start at 0 and end at the number of lines.")
+    if len(prices) and not (prices > 0).all():
+        raise ValueError("Price must be greater than 0.")
+    if len(quantities) and quantities.min() < 1:
+        raise ValueError("Quantity must be at least 1.")
+
+    lengths = np.diff(offsets)
+    if (lengths < 0).any():
+        raise ValueError("Offsets must be non-decreasing.")
+    if (lengths == 0).any():
+        empty = np.flatnonzero(lengths == 0)
+        raise ValueError(f"Cannot calculate subtotal on empty order (orders {empty[:10].tolist()}).")
+
+
+def _as_discounts(discounts, shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Converts discounts to a float array with the errors of OrderCalculator.apply_discount.
+
+    :param discounts: A discount rate, or an array of rates.
+    :param shape: The required shape of an array of rates.
+    :raises TypeError: If a discount is not a number.
+    :raises ValueError: If a discount is outside the [0.0, 1.0] range or the shape does not match.
+    """
+    discounts = np.asarray(discounts)
+    if not (np.issubdtype(discounts.dtype, np.number) or discounts.dtype == np.bool_) \
+            or np.issubdtype(discounts.dtype, np.complexfloating):
+        raise TypeError("Discount must be a number.")
+    discounts = discounts.astype(np.float64)
+    if discounts.ndim and discounts.shape != shape:
+        raise ValueError("Discounts must be a scalar or one value per order.")
+    if not ((discounts >= 0.0) & (discounts <= 1.0)).all():
+        raise ValueError("Discount must be between 0.0 and 1.0.")
+    return discounts
+
+
+def _sequential_subtotals(line_totals: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Sums the line totals of each order as sum() does, adding one line position of all orders at a time.
+    """
+    starts = offsets[:-1]
+    lengths = np.diff(offsets)
+    subtotal = np.zeros(len(lengths))
+    compensation = np.zeros(len(lengths))
+    orders = np.flatnonzero(lengths <= _MAX_VECTORIZED_LINES)
+    position = 0
+    with np.errstate(over='ignore', invalid='ignore'):
+        while len(orders):
+            orders = orders[lengths[orders] > position]
+            line_total = line_totals[starts[orders] + position]
+            partial = subtotal[orders]
+            total = partial + line_total
+            if not _SEQUENTIAL_SUM:
+                # Neumaier's compensated summation, as in sum() of Python 3.12+
+                compensation[orders] += np.where(np.abs(partial) >= np.abs(line_total),
+                                                 (partial - total) + line_total, (line_total - total) + partial)
+            subtotal[orders] = total
+            position += 1
+        if not _SEQUENTIAL_SUM:
+            compensated = (compensation != 0) & np.isfinite(compensation)
+            subtotal[compensated] += compensation[compensated]
+    for i in np.flatnonzero(lengths > _MAX_VECTORIZED_LINES):
+        subtotal[i] = sum(line_totals[offsets[i]:offsets[i + 1]].tolist())
+    return subtotal
+
+
+def _price_subtotals(subtotal: np.ndarray, discounts: np.ndarray, tax_rate, free_shipping_threshold,
+                     shipping_cost) -> BatchTotals:
+    """Applies the discount, shipping and tax steps of calculate_total elementwise."""
+    discounted_subtotal = subtotal * (1 - discounts)
+    shipping = np.where(discounted_subtotal >= free_shipping_threshold, 0.0, float(shipping_cost))
+    tax = (discounted_subtotal + shipping) * tax_rate
+    total = discounted_subtotal + shipping + tax
+    return BatchTotals(np.broadcast_to(subtotal, total.shape), discounted_subtotal, shipping, tax, total)
+
+
+def price_orders(prices, quantities, offsets, discounts: Union[float, np.ndarray] = 0.0,
+                 tax_rate=0.23, free_shipping_threshold=100.0, shipping_cost=10.0,
+                 exact: bool = False) -> BatchTotals:
+    """
+    Prices many orders at once, equivalent to calculate_total on each order.
+
+    :param prices: Item prices of all orders, concatenated.
+    :param quantities: Item quantities of all orders, concatenated (integers).
+    :param offsets: Start index of each order's lines, followed by the total number of lines.
+    :param discounts: A discount rate for all orders, or one rate per order, each in [0.0, 1.0].
+    :param tax_rate: As for OrderCalculator.
+    :param free_shipping_threshold: As for OrderCalculator.
+    :param shipping_cost: As for OrderCalculator.
+    :param exact: Sum every subtotal exactly, for results bit-identical to calculate_total of orders
+        created with exact_subtotal=True (by default, results are bit-identical to default orders).
+    :return: Per-order subtotal, discounted subtotal, shipping, tax and total.
+    :raises ValueError: For invalid configuration, lines, discounts or empty orders (OrderCalculator messages).
+    :raises TypeError: For parameters of incorrect type.
+    """
+    # Validates the configuration exactly as the scalar path does
+    OrderCalculator(tax_rate, free_shipping_threshold, shipping_cost)
+
+    prices = np.asarray(prices, dtype=np.float64)
+    quantities = np.asarray(quantities)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    _validate_columns(prices, quantities, offsets)
+
+    n_orders = len(offsets) - 1
+    discounts = _as_discounts(discounts, (n_orders,))
+
+    if n_orders == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return BatchTotals(empty, empty, empty, empty, empty)
+
+    line_totals = prices * quantities
+    if exact:
+        subtotal = np.array([math.fsum(line_totals[offsets[i]:offsets[i + 1]]) for i in range(n_orders)])
+    else:
+        subtotal = _sequential_subtotals(line_totals, offsets)
+
+    return _price_subtotals(subtotal, discounts, tax_rate, free_shipping_threshold, shipping_cost)
+
+
+def price_discounts(order: OrderCalculator, discounts) -> BatchTotals:
+    """
+    Evaluates calculate_total of one order for many discount rates at once.
+
+    The subtotal is computed once; the discount, shipping threshold and tax steps
+    are applied to all rates in one vectorized pass, with the same float operations
+    as apply_discount, calculate_shipping and calculate_tax.
+
+    :param order: The order to price.
+    :param discounts: Discount rates, each between 0.0 and 1.0.
+    :return: Subtotal, discounted subtotal, shipping, tax and total for each discount.
+    :raises ValueError: If the order is empty or a discount is outside the [0.0, 1.0] range.
+    :raises TypeError: If a discount is not a number.
+    """
+    discounts = np.asarray(discounts)
+    discounts = _as_discounts(discounts, discounts.shape)
+    subtotal = np.float64(order.get_subtotal())
+    if subtotal < 0.0:
+        raise ValueError("Cannot calculate total on negative subtotal.")
+    return _price_subtotals(subtotal, discounts, order.tax_rate, order.free_shipping_threshold,
+                            order.shipping_cost)
+
+
+def to_minor_columns(prices, minor_units: int = 100) -> np.ndarray:
+    """
+    Converts prices in major units to whole minor units, as fixed_point.to_minor_units does.
+
+    :param prices: Prices in major units, e.g. 19.99.
+    :param minor_units: Minor units per major unit (default is 100).
+    :return: The prices as an int64 array of minor units, e.g. 1999.
+    :raises ValueError: If a price is not a whole number of minor units.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    minor = np.rint(prices * minor_units)
+    if not np.array_equal(minor / minor_units, prices):
+        raise ValueError(f"Price must be a whole number of minor units (1/{minor_units}).")
+    return minor.astype(np.int64)
+
+
+def price_orders_minor(prices_minor, quantities, offsets, discounts: Union[float, np.ndarray] = 0.0,
+                       tax_rate=0.23, free_shipping_threshold=100.0, shipping_cost=10.0,
+                       minor_units: int = 100) -> BatchTotals:
+    """
+    Prices many orders at once in integer minor units, equivalent to
+    FixedPointOrderCalculator.calculate_total_minor on each order.
+
+    :param prices_minor: Item prices of all orders in minor units, concatenated (integers).
+    :param quantities: Item quantities of all orders, concatenated (integers).
+    :param offsets: Start index of each order's lines, followed by the total number of lines.
+    :param discounts: A discount rate for all orders, or one rate per order, each in [0.0, 1.0].
+    :param tax_rate: As for FixedPointOrderCalculator.
+    :param free_shipping_threshold: As for FixedPointOrderCalculator (in major units).
+    :param shipping_cost: As for FixedPointOrderCalculator (in major units).
+    :param minor_units: Minor units per major unit (default is 100).
+    :return: Per-order subtotal, discounted subtotal, shipping, tax and total as int64 minor units.
+    :raises ValueError: For invalid configuration, lines, discounts or empty orders.
+    :raises TypeError: For parameters of incorrect type.
+    :raises OverflowError: If the totals could exceed 64-bit integers.
+    """
+    FixedPointOrderCalculator(tax_rate, free_shipping_threshold, shipping_cost, minor_units)
+
+    prices_minor = np.asarray(prices_minor)
+    if not np.issubdtype(prices_minor.dtype, np.integer):
+        raise TypeError("Prices must be integer minor units.")
+    prices_minor = prices_minor.astype(np.int64)
+    quantities = np.asarray(quantities)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    _validate_columns(prices_minor, quantities, offsets)
+
+    n_orders = len(offsets) - 1
+    discounts = _as_discounts(discounts, (n_orders,))
+    if n_orders == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return BatchTotals(empty, empty, empty, empty, empty)
+
+    # Exact decimal fractions of the distinct discount rates
+    rates, inverse = np.unique(discounts, return_inverse=True)
+    ratios = np.array([decimal_ratio(float(rate)) for rate in rates], dtype=np.int64).reshape(-1, 2)
+    discount_numerator = ratios[:, 0][inverse].reshape(discounts.shape)
+    discount_denominator = ratios[:, 1][inverse].reshape(discounts.shape)
+    tax_numerator, tax_denominator = decimal_ratio(tax_rate)
+    threshold_minor = to_minor_units(free_shipping_threshold, minor_units)
+    shipping_minor = to_minor_units(shipping_cost, minor_units)
+
+    # Intermediate products are at most 2 * amount * denominator
+    largest = np.add.reduceat(prices_minor.astype(np.float64) * quantities, offsets[:-1]).max() + shipping_minor
+    if 2.0 * largest * max(int(ratios[:, 1].max()), tax_denominator) >= 2.0 ** 62:
+        raise OverflowError("Order totals are too large for 64-bit minor units.")
+
+    subtotal = np.add.reduceat(prices_minor * quantities.astype(np.int64), offsets[:-1])
+    discounted_subtotal = ((2 * subtotal * (discount_denominator - discount_numerator) + discount_denominator)
+                           // (2 * discount_denominator))
+    shipping = np.where(discounted_subtotal >= threshold_minor, 0, shipping_minor).astype(np.int64)
+    tax = (2 * (discounted_subtotal + shipping) * tax_numerator + tax_denominator) // (2 * tax_denominator)
+    total = discounted_subtotal + shipping + tax
+    return BatchTotals(subtotal, discounted_subtotal, shipping, tax, total)
@@ -0,0 +1,98 @@
+"""
+Benchmark: vectorized batch pricing vs calculate_total per order.
+
+Generates a nightly-repricing style workload (many orders of varying size
+with per-order discounts), prices it once with OrderCalculator.calculate_total
+per order and once with batch_pricing.price_orders over columnar arrays,
+checks that the totals are bit-identical and reports throughput. Also times a what-if
+discount grid on a single order (price_discounts vs calculate_total per rate).
+
+Usage:
+    python benchmarks/bench_batch_pricing.py
+    python benchmarks/bench_batch_pricing.py --orders 50000 --max-lines 40
+    python benchmarks/bench_batch_pricing.py --grid 100000
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from batch_pricing import columns_from_orders, price_discounts, price_orders
+from order_calculator import OrderCalculator
+
+
+def generate_orders(n_orders: int, max_lines: int, seed: int):
+    rng = np.random.default_rng(seed)
+    orders = []
+    for _ in range(n_orders):
+        calc = OrderCalculator()
+        for line in range(int(rng.integers(1, max_lines + 1))):
+            calc.add_item(f"sku-{line}", round(float(rng.uniform(0.5, 80.0)), 2), int(rng.integers(1, 6)))
+        orders.append(calc)
+    discounts = rng.choice([0.0, 0.05, 0.1, 0.25], size=n_orders)
+    return orders, discounts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vectorized batch pricing')
+    parser.add_argument('--orders', type=int, default=20000, help='Number of orders (default: 20000)')
+    parser.add_argument('--max-lines', type=int, default=20, help='Maximum lines per order (default: 20)')
+    parser.add_argument('--repeats', type=int, default=5, help='Timing repeats, best is reported (default: 5)')
+    parser.add_argument('--grid', type=int, default=10000, help='Discount rates in the what-if grid (default: 10000)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    orders, discounts = generate_orders(args.orders, args.max_lines, args.seed)
+    prices, quantities, offsets = columns_from_orders(orders)
+    print(f"{args.orders} orders, {len(prices)} lines")
+
+    scalar_times, batch_times, exact_times = [], [], []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        scalar = [order.calculate_total(float(discount)) for order, discount in zip(orders, discounts)]
+        scalar_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        batch = price_orders(prices, quantities, offsets, discounts)
+        batch_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        exact = price_orders(prices, quantities, offsets, discounts, exact=True)
+        exact_times.append(time.perf_counter() - start)
+
+    scalar = np.asarray(scalar)
+    assert np.array_equal(batch.total, scalar)
+
+    scalar_time, batch_time, exact_time = min(scalar_times), min(batch_times), min(exact_times)
+    print(f"{'calculate_total per order':<28}{scalar_time * 1e3:>10.1f} ms{args.orders / scalar_time:>14,.0f} orders/s")
+    print(f"{'price_orders (vectorized)':<28}{batch_time * 1e3:>10.1f} ms{args.orders / batch_time:>14,.0f} orders/s")
+    print(f"{'price_orders (exact=True)':<28}{exact_time * 1e3:>10.1f} ms{args.orders / exact_time:>14,.0f} orders/s")
+    print(f"speedup: {scalar_time / batch_time:.0f}x (bit-identical totals)")
+
+    order = max(orders, key=lambda o: len(o.items))
+    grid = np.linspace(0.0, 1.0, args.grid)
+    scalar_times, grid_times = [], []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        scalar = [order.calculate_total(float(discount)) for discount in grid]
+        scalar_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result = price_discounts(order, grid)
+        grid_times.append(time.perf_counter() - start)
+    assert np.array_equal(result.total, np.asarray(scalar))
+
+    scalar_time, grid_time = min(scalar_times), min(grid_times)
+    print(f"\nDiscount grid: {args.grid} rates on one order ({len(order.items)} lines)")
+    print(f"{'calculate_total per rate':<28}{scalar_time * 1e3:>10.1f} ms")
+    print(f"{'price_discounts':<28}{grid_time * 1e3:>10.1f} ms")
+    print(f"speedup: {scalar_time / grid_time:.0f}x (bit-identical totals)")
+
+
+if __name__ == "__main__":
+    main()
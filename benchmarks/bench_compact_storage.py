@@ -0,0 +1,71 @@
+"""
+Benchmark: compact array-backed storage vs dict-per-item storage.
+
+Builds one large bulk order with OrderCalculator and CompactOrderCalculator
+and reports the memory retained by the order and the peak during the build
+(tracemalloc), build time (measured without tracing), a full recount of the
+totals (check_consistency) and calculate_total.
+
+Usage:
+    python benchmarks/bench_compact_storage.py
+    python benchmarks/bench_compact_storage.py --lines 1000000
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from compact_order import CompactOrderCalculator
+from order_calculator import OrderCalculator
+
+
+def order_lines(lines: int):
+    return [(f"sku-{i}", 1.0 + (i % 97) * 0.25, 1 + i % 5) for i in range(lines)]
+
+
+def measure(cls, rows):
+    start = time.perf_counter()
+    cls().add_items(rows)
+    build_time = time.perf_counter() - start
+
+    tracemalloc.start()
+    calc = cls()
+    calc.add_items(rows)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    calc.check_consistency()
+    recount_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    total = calc.calculate_total(0.1)
+    total_time = time.perf_counter() - start
+    return calc, total, retained, peak, build_time, recount_time, total_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compact order storage')
+    parser.add_argument('--lines', type=int, default=200000, help='Order lines (default: 200000)')
+    args = parser.parse_args()
+
+    rows = order_lines(args.lines)
+    print(f"Bulk order with {args.lines} lines (names shared with the input rows)")
+    print(f"{'storage':<12}{'retained':>12}{'peak':>12}{'bytes/line':>12}{'build':>10}{'recount':>10}{'total':>10}")
+
+    totals = []
+    for name, cls in (("dict", OrderCalculator), ("compact", CompactOrderCalculator)):
+        calc, total, retained, peak, build_time, recount_time, total_time = measure(cls, rows)
+        totals.append(total)
+        print(f"{name:<12}{retained / 2 ** 20:>10.1f}MB{peak / 2 ** 20:>10.1f}MB{retained / args.lines:>12.0f}"
+              f"{build_time:>9.2f}s{recount_time:>9.2f}s{total_time * 1e6:>8.1f}us")
+        del calc
+    assert totals[0] == totals[1], totals
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Stress benchmark: quote throughput under concurrent writes.
+
+Shares one order between writer threads (adding and removing lines in a
+loop) and reader threads (quoting calculate_total), for a fixed duration.
+Compares ConcurrentOrderCalculator (serialized writers, lock-free snapshot
+readers) with a plain OrderCalculator guarded by one lock for reads and
+writes. Readers periodically verify that what they read is consistent: the
+quoted subtotal and quantity match a fresh summation over the same view.
+Both orders sum subtotals exactly (exact_subtotal=True), so that updates and
+removals do not re-sum the lines.
+
+Usage:
+    python benchmarks/bench_concurrent_order.py
+    python benchmarks/bench_concurrent_order.py --readers 8 --writers 2 --lines 5000 --duration 5
+"""
+
+import sys
+import math
+import time
+import argparse
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from concurrent_order import ConcurrentOrderCalculator
+from order_calculator import OrderCalculator
+
+CHECK_EVERY = 200
+
+
+class LockedOrder:
+    """A plain OrderCalculator with one lock around every read and write."""
+
+    def __init__(self):
+        self.order = OrderCalculator(exact_subtotal=True)
+        self.lock = threading.Lock()
+
+    def add_item(self, name, price, quantity=1):
+        with self.lock:
+            self.order.add_item(name, price, quantity)
+
+    def remove_item(self, name):
+        with self.lock:
+            self.order.remove_item(name)
+
+    def quote(self, check: bool) -> bool:
+        with self.lock:
+            self.order.calculate_total(0.1)
+            return not check or consistent(self.order.get_subtotal(), self.order.total_items(), self.order.items)
+
+
+class SnapshotOrder:
+    """ConcurrentOrderCalculator, quoting from lock-free snapshots."""
+
+    def __init__(self):
+        self.order = ConcurrentOrderCalculator(exact_subtotal=True)
+
+    def add_item(self, name, price, quantity=1):
+        self.order.add_item(name, price, quantity)
+
+    def remove_item(self, name):
+        self.order.remove_item(name)
+
+    def quote(self, check: bool) -> bool:
+        snapshot = self.order.snapshot()
+        snapshot.calculate_total(0.1)
+        return not check or consistent(snapshot.get_subtotal(), snapshot.total_items(), snapshot.items)
+
+
+def consistent(subtotal, quantity, items) -> bool:
+    expected = math.fsum(item["price"] * item["quantity"] for item in items)
+    return quantity == sum(item["quantity"] for item in items) and subtotal == expected
+
+
+def run(shared, readers: int, writers: int, lines: int, duration: float):
+    for i in range(lines):
+        shared.add_item(f"base-{i}", 1.0 + (i % 97) * 0.25, 1 + i % 5)
+
+    stop = threading.Event()
+    quotes, writes, errors = [0] * readers, [0] * writers, [0] * readers
+
+    def reader(slot):
+        count = 0
+        while not stop.is_set():
+            if not shared.quote(count % CHECK_EVERY == 0):
+                errors[slot] += 1
+            count += 1
+        quotes[slot] = count
+
+    def writer(slot):
+        count = 0
+        while not stop.is_set():
+            name = f"w{slot}-{count}"
+            shared.add_item(name, 2.5, 1 + count % 3)
+            shared.add_item(f"base-{count % lines}", 1.0 + (count % lines % 97) * 0.25, 1)
+            shared.remove_item(name)
+            count += 3
+        writes[slot] = count
+
+    threads = ([threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+               + [threading.Thread(target=writer, args=(i,)) for i in range(writers)])
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(quotes) / duration, sum(writes) / duration, sum(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stress benchmark for concurrent order quoting')
+    parser.add_argument('--readers', type=int, default=4, help='Quoting threads (default: 4)')
+    parser.add_argument('--writers', type=int, default=2, help='Writing threads (default: 2)')
+    parser.add_argument('--lines', type=int, default=1000, help='Initial order lines (default: 1000)')
+    parser.add_argument('--duration', type=float, default=3.0, help='Seconds per variant (default: 3)')
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.lines} initial lines, {args.duration:g}s each")
+    print(f"{'variant':<28}{'quotes/s':>14}{'writes/s':>14}{'inconsistent':>14}")
+    for name, shared in (("single lock", LockedOrder()), ("copy-on-write snapshots", SnapshotOrder())):
+        quote_rate, write_rate, errors = run(shared, args.readers, args.writers, args.lines, args.duration)
+        print(f"{name:<28}{quote_rate:>14,.0f}{write_rate:>14,.0f}{errors:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: integer minor-unit pricing vs Decimal.
+
+Quotes the same orders with a Decimal implementation of the fixed-point
+rounding rule (ROUND_HALF_UP to cents) and with integer minor units, both
+summing the order lines (prices converted once, up front) on every quote,
+then with the maintained totals of FixedPointOrderCalculator and with the
+vectorized price_orders_minor.
+Checks that all four give identical totals and reports the time per order.
+
+Usage:
+    python benchmarks/bench_fixed_point.py
+    python benchmarks/bench_fixed_point.py --orders 50000 --max-lines 40
+"""
+
+import sys
+import time
+import argparse
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from batch_pricing import columns_from_orders, price_orders_minor, to_minor_columns
+from fixed_point import FixedPointOrderCalculator, decimal_ratio, round_half_up, to_minor_units
+
+CENT = Decimal("0.01")
+
+
+THRESHOLD, SHIPPING, TAX_RATE = Decimal("100"), Decimal("10"), Decimal("0.23")
+
+
+def decimal_total(lines, discount: float) -> int:
+    subtotal = sum(price * quantity for price, quantity in lines)
+    discounted_subtotal = (subtotal * (1 - Decimal(repr(discount)))).quantize(CENT, ROUND_HALF_UP)
+    shipping_cost = Decimal(0) if discounted_subtotal >= THRESHOLD else SHIPPING
+    tax = ((discounted_subtotal + shipping_cost) * TAX_RATE).quantize(CENT, ROUND_HALF_UP)
+    return int((discounted_subtotal + shipping_cost + tax) / CENT)
+
+
+def minor_total(lines, discount: float) -> int:
+    subtotal = sum(price * quantity for price, quantity in lines)
+    numerator, denominator = decimal_ratio(discount)
+    discounted_subtotal = round_half_up(subtotal * (denominator - numerator), denominator)
+    shipping_cost = 0 if discounted_subtotal >= 10000 else 1000
+    return discounted_subtotal + shipping_cost + round_half_up((discounted_subtotal + shipping_cost) * 23, 100)
+
+
+def generate_orders(n_orders: int, max_lines: int, seed: int):
+    rng = np.random.default_rng(seed)
+    orders = []
+    for _ in range(n_orders):
+        calc = FixedPointOrderCalculator()
+        for line in range(int(rng.integers(1, max_lines + 1))):
+            calc.add_item(f"sku-{line}", int(rng.integers(50, 8000)) / 100, int(rng.integers(1, 6)))
+        orders.append(calc)
+    discounts = rng.choice([0.0, 0.05, 0.1, 0.15, 0.25], size=n_orders)
+    return orders, discounts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark integer minor-unit pricing against Decimal')
+    parser.add_argument('--orders', type=int, default=20000, help='Number of orders (default: 20000)')
+    parser.add_argument('--max-lines', type=int, default=20, help='Maximum lines per order (default: 20)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    orders, discounts = generate_orders(args.orders, args.max_lines, args.seed)
+    prices, quantities, offsets = columns_from_orders(orders)
+    discounts = [float(discount) for discount in discounts]
+    decimal_lines = [[(Decimal(repr(item["price"])), item["quantity"]) for item in order.items] for order in orders]
+    minor_lines = [[(to_minor_units(item["price"]), item["quantity"]) for item in order.items] for order in orders]
+    print(f"{args.orders} orders, {len(prices)} lines")
+
+    def quote_all(quote, subjects):
+        return [quote(subject, discount) for subject, discount in zip(subjects, discounts)]
+
+    rows = [
+        ("Decimal, summing lines", lambda: quote_all(decimal_total, decimal_lines)),
+        ("minor units, summing lines", lambda: quote_all(minor_total, minor_lines)),
+        ("calculate_total_minor", lambda: quote_all(lambda order, discount: order.calculate_total_minor(discount),
+                                                    orders)),
+        ("price_orders_minor", lambda: price_orders_minor(to_minor_columns(prices), quantities, offsets,
+                                                          discounts).total.tolist()),
+    ]
+    reference, reference_time = None, None
+    for name, run in rows:
+        start = time.perf_counter()
+        totals = run()
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference, reference_time = totals, elapsed
+        assert totals == reference, name
+        print(f"{name:<28}{elapsed / args.orders * 1e6:>10.2f}us/order{reference_time / elapsed:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
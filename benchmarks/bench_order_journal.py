@@ -0,0 +1,102 @@
+"""
+Benchmark: journaled persistence vs re-serializing the whole order.
+
+Builds a large order, then applies a stream of cart changes and persists
+after each one, either by rewriting the items as JSON (the straightforward
+approach) or by appending a journal record (JournaledOrderCalculator).
+Also reports checkpoint (binary snapshot) and restore (snapshot + journal
+tail replay) times and file sizes, and checks that the restored order
+matches the original.
+
+Usage:
+    python benchmarks/bench_order_journal.py
+    python benchmarks/bench_order_journal.py --lines 200000 --changes 2000
+"""
+
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from order_calculator import OrderCalculator
+from order_journal import JournaledOrderCalculator, JOURNAL_FILE, SNAPSHOT_FILE
+
+
+def order_lines(lines: int):
+    return [(f"sku-{i}", 1.0 + (i % 97) * 0.25, 1 + i % 5) for i in range(lines)]
+
+
+def apply_change(calc, i: int, lines: int):
+    if i % 3 == 0:
+        calc.add_item(f"extra-{i}", 2.5, 1)
+    elif i % 3 == 1:
+        calc.add_item(f"sku-{i % lines}", 1.0 + (i % lines % 97) * 0.25, 2)
+    else:
+        calc.remove_item(f"extra-{i - 2}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark journaled order persistence')
+    parser.add_argument('--lines', type=int, default=50000, help='Order lines (default: 50000)')
+    parser.add_argument('--changes', type=int, default=300, help='Persisted cart changes (default: 300)')
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="order-journal-"))
+    try:
+        rows = order_lines(args.lines)
+
+        calc = OrderCalculator()
+        calc.add_items(rows)
+        json_path = work_dir / "order.json"
+        start = time.perf_counter()
+        for i in range(args.changes):
+            apply_change(calc, i, args.lines)
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(calc.items, f)
+        json_time = (time.perf_counter() - start) / args.changes
+
+        order_dir = work_dir / "order"
+        journaled = JournaledOrderCalculator.open(order_dir)
+        journaled.add_items(rows)
+        start = time.perf_counter()
+        journaled.checkpoint()
+        checkpoint_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(args.changes):
+            apply_change(journaled, i, args.lines)
+        journal_time = (time.perf_counter() - start) / args.changes
+        journaled.close()
+
+        start = time.perf_counter()
+        restored = JournaledOrderCalculator.open(order_dir)
+        restore_time = time.perf_counter() - start
+        assert restored.items == calc.items and restored.get_subtotal() == calc.get_subtotal()
+        restored.close()
+
+        start = time.perf_counter()
+        with open(json_path, 'r', encoding='utf-8') as f:
+            OrderCalculator().items = json.load(f)
+        json_load_time = time.perf_counter() - start
+
+        print(f"Order with {args.lines} lines, {args.changes} persisted changes")
+        print(f"{'persist per change (JSON rewrite)':<38}{json_time * 1e3:>10.2f} ms")
+        print(f"{'persist per change (journal append)':<38}{journal_time * 1e3:>10.3f} ms"
+              f"{json_time / journal_time:>10.0f}x")
+        print(f"{'checkpoint (binary snapshot)':<38}{checkpoint_time * 1e3:>10.1f} ms")
+        print(f"{'restore (snapshot + journal tail)':<38}{restore_time * 1e3:>10.1f} ms")
+        print(f"{'restore (JSON load)':<38}{json_load_time * 1e3:>10.1f} ms")
+        print(f"{'snapshot / JSON size':<38}{(order_dir / SNAPSHOT_FILE).stat().st_size / 2 ** 20:>8.2f}MB"
+              f"{json_path.stat().st_size / 2 ** 20:>8.2f}MB")
+        print(f"{'journal size':<38}{(order_dir / JOURNAL_FILE).stat().st_size / 1024:>8.1f}KB")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: incrementally maintained order totals.
+
+Compares O(1) reads of the maintained subtotal/quantity totals (and of the
+memoized list_items result) with a fresh O(n) pass over the items (the
+previous implementation) on large orders, both for repeated quotes and for a
+checkout flow that re-quotes after every cart change. The orders sum
+subtotals exactly (exact_subtotal=True), which keeps the subtotal maintained
+across updates and removals as well as additions.
+
+Usage:
+    python benchmarks/bench_order_totals.py
+    python benchmarks/bench_order_totals.py --lines 10000 --changes 2000
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from order_calculator import OrderCalculator
+
+
+def resummed_subtotal(calc: OrderCalculator) -> float:
+    """Subtotal by fresh summation, as computed before totals were maintained."""
+    return sum(item["price"] * item["quantity"] for item in calc.items)
+
+
+def resummed_total(calc: OrderCalculator, discount: float = 0.0) -> float:
+    discounted_subtotal = calc.apply_discount(resummed_subtotal(calc), discount)
+    shipping_cost = calc.calculate_shipping(discounted_subtotal)
+    return discounted_subtotal + shipping_cost + calc.calculate_tax(discounted_subtotal + shipping_cost)
+
+
+def build_order(lines: int) -> OrderCalculator:
+    calc = OrderCalculator(exact_subtotal=True)
+    for i in range(lines):
+        calc.add_item(f"item-{i}", 1.0 + (i % 97) * 0.25, 1 + i % 5)
+    return calc
+
+
+def time_quotes(quote, calc: OrderCalculator, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        quote(calc)
+    return (time.perf_counter() - start) / repeats
+
+
+def time_checkout(quote, lines: int, changes: int) -> float:
+    """Apply cart changes (add, update, remove) and re-quote after each one."""
+    calc = build_order(lines)
+    start = time.perf_counter()
+    for i in range(changes):
+        if i % 3 == 0:
+            calc.add_item(f"extra-{i}", 2.5, 1)
+        elif i % 3 == 1:
+            calc.add_item(f"item-{i}", 1.0 + (i % 97) * 0.25, 2)
+        else:
+            calc.remove_item(f"extra-{i - 2}")
+        quote(calc)
+    return (time.perf_counter() - start) / changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark maintained order totals')
+    parser.add_argument('--lines', type=int, default=10000, help='Order lines (default: 10000)')
+    parser.add_argument('--repeats', type=int, default=200, help='Quotes per measurement (default: 200)')
+    parser.add_argument('--changes', type=int, default=1000, help='Cart changes in the checkout flow (default: 1000)')
+    args = parser.parse_args()
+
+    calc = build_order(args.lines)
+    assert abs(calc.calculate_total() - resummed_total(calc)) <= 1e-9 * resummed_total(calc)
+
+    rows = [
+        ("get_subtotal", lambda c: c.get_subtotal(), resummed_subtotal),
+        ("calculate_total", lambda c: c.calculate_total(0.1), lambda c: resummed_total(c, 0.1)),
+        ("total_items", lambda c: c.total_items(), lambda c: sum(item["quantity"] for item in c.items)),
+        ("list_items", lambda c: c.list_items(), lambda c: list(set(item["name"] for item in c.items))),
+    ]
+
+    print(f"Order with {args.lines} lines ({args.repeats} quotes per measurement)")
+    print(f"{'operation':<24}{'maintained':>14}{'re-summed':>14}{'speedup':>10}")
+    for name, maintained, resummed in rows:
+        fast = time_quotes(maintained, calc, args.repeats)
+        slow = time_quotes(resummed, calc, args.repeats)
+        print(f"{name:<24}{fast * 1e6:>12.2f}us{slow * 1e6:>12.2f}us{slow / fast:>9.0f}x")
+
+    fast = time_checkout(lambda c: c.calculate_total(), args.lines, args.changes)
+    slow = time_checkout(resummed_total, args.lines, args.changes)
+    print(f"{'checkout (change+quote)':<24}{fast * 1e6:>12.2f}us{slow * 1e6:>12.2f}us{slow / fast:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Benchmark suite: OrderCalculator hot paths across order sizes.
+
+Times add_item (new and existing names), remove_item, get_subtotal,
+calculate_total and list_items on orders of 10 to 1M lines. The read
+operations are timed twice: memoized, repeating the call on an unchanged
+order, and cold, with the order's memo invalidated before every call as by a
+change to the order (the version increment is included in the time).
+
+Each operation is run in batches sized so that one batch takes at least
+--min-time seconds; after --warmup unrecorded batches, --repeats batches are
+timed and the minimum and median time per call are reported, with the
+tracemalloc peak of one extra batch (timed region only). Mutating operations
+add or remove their own lines outside the timed region, so every batch runs
+on an order with the same lines (only quantities grow), and make at most
+max(lines, 100) calls per batch so that the order stays close to its nominal
+size.
+
+Results can be saved as a JSON baseline and compared with a later run, e.g.
+before and after a commit. Baselines go to benchmarks/baselines/ (git-ignored)
+unless a path is given. With --compare, operations whose minimum time grew by
+more than --threshold are flagged and the exit status is 1.
+
+Usage:
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --sizes 10 1000 100000 --repeats 9 --save
+    python benchmarks/bench_suite.py --compare benchmarks/baselines/<commit>.json
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from order_calculator import OrderCalculator
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+DEFAULT_SIZES = [10, 1000, 100000, 1000000]
+MAX_NUMBER = 100000
+MIN_MUTATING_BATCH = 100
+
+
+def build_order(lines: int) -> OrderCalculator:
+    calc = OrderCalculator()
+    calc.add_items((f"item-{i}", 1.0 + (i % 97) * 0.25, 1 + i % 5) for i in range(lines))
+    return calc
+
+
+def add_new(calc: OrderCalculator, number: int):
+    names = [f"new-{i}" for i in range(number)]
+
+    def run():
+        for name in names:
+            calc.add_item(name, 2.5, 1)
+
+    return run, lambda: calc.remove_items(names)
+
+
+def add_existing(calc: OrderCalculator, number: int):
+    lines = len(calc.list_items())
+    rows = [(f"item-{i % lines}", 1.0 + (i % lines % 97) * 0.25) for i in range(number)]
+
+    def run():
+        for name, price in rows:
+            calc.add_item(name, price, 1)
+
+    return run, None
+
+
+def remove(calc: OrderCalculator, number: int):
+    names = [f"gone-{i}" for i in range(number)]
+    calc.add_items((name, 2.5, 1) for name in names)
+
+    def run():
+        for name in names:
+            calc.remove_item(name)
+
+    return run, None
+
+
+def repeat_call(method_name: str, *args, cold: bool = False):
+    def prepare(calc: OrderCalculator, number: int):
+        method = getattr(calc, method_name)
+
+        def run():
+            for _ in range(number):
+                method(*args)
+
+        def run_cold():
+            for _ in range(number):
+                # Invalidates the memoized values, as every change to the order does
+                calc._version += 1
+                method(*args)
+
+        return (run_cold if cold else run), None
+
+    return prepare
+
+
+# Operation name -> prepare(calc, number), returning (run, undo): run() makes number calls
+# and is what gets timed, undo (or None) restores the order's lines afterwards
+OPERATIONS = {
+    "add_item (new name)": add_new,
+    "add_item (existing name)": add_existing,
+    "remove_item": remove,
+    "get_subtotal (memoized)": repeat_call("get_subtotal"),
+    "get_subtotal (cold)": repeat_call("get_subtotal", cold=True),
+    "calculate_total (memoized)": repeat_call("calculate_total", 0.1),
+    "calculate_total (cold)": repeat_call("calculate_total", 0.1, cold=True),
+    "list_items (memoized)": repeat_call("list_items"),
+    "list_items (cold)": repeat_call("list_items", cold=True),
+}
+MUTATING = {"add_item (new name)", "add_item (existing name)", "remove_item"}
+
+
+def run_batch(prepare, calc: OrderCalculator, number: int, trace_memory: bool = False) -> float:
+    """Runs one batch of number calls; returns its time, or its tracemalloc peak in bytes."""
+    run, undo = prepare(calc, number)
+    if trace_memory:
+        tracemalloc.start()
+        run()
+        result = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    else:
+        start = time.perf_counter()
+        run()
+        result = time.perf_counter() - start
+    if undo is not None:
+        undo()
+    return result
+
+
+def calibrate(prepare, calc: OrderCalculator, min_time: float, max_number: int) -> int:
+    """Returns the number of calls per batch for one batch to take at least min_time."""
+    number = 1
+    while number < max_number and run_batch(prepare, calc, number) < min_time:
+        number *= 10
+    return min(number, max_number)
+
+
+def measure(operation: str, calc: OrderCalculator, size: int, warmup: int, repeats: int,
+            min_time: float) -> dict:
+    prepare = OPERATIONS[operation]
+    # Keep mutating batches small relative to the order, so that they measure an order of about that size
+    max_number = max(size, MIN_MUTATING_BATCH) if operation in MUTATING else MAX_NUMBER
+    number = calibrate(prepare, calc, min_time, max_number)
+    for _ in range(warmup):
+        run_batch(prepare, calc, number)
+    times = [run_batch(prepare, calc, number) / number for _ in range(repeats)]
+    peak = run_batch(prepare, calc, number, trace_memory=True)
+    return {"number": number, "min": min(times), "median": statistics.median(times), "peak_bytes": peak}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def format_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f}us"
+    return f"{seconds * 1e3:.2f}ms"
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> int:
+    """Prints current vs baseline minimum times and returns the number of regressions."""
+    print(f"\nCompared with {baseline['commit']} ({baseline['timestamp']}), threshold {threshold:.2f}x")
+    print(f"{'operation':<28}{'lines':>9}{'baseline':>12}{'current':>12}{'ratio':>9}")
+    regressions = 0
+    for operation, by_size in results.items():
+        for size, stats in by_size.items():
+            old = baseline["results"].get(operation, {}).get(size)
+            if old is None:
+                continue
+            ratio = stats["min"] / old["min"]
+            flag = ""
+            if ratio > threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(f"{operation:<28}{size:>9}{format_time(old['min']):>12}{format_time(stats['min']):>12}"
+                  f"{ratio:>8.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark suite for OrderCalculator hot paths')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f'Order sizes in lines (default: {" ".join(map(str, DEFAULT_SIZES))})')
+    parser.add_argument('--operations', nargs='+', choices=list(OPERATIONS), default=list(OPERATIONS),
+                        metavar='OP', help='Operations to run (default: all)')
+    parser.add_argument('--warmup', type=int, default=2, help='Unrecorded batches per measurement (default: 2)')
+    parser.add_argument('--repeats', type=int, default=7, help='Timed batches per measurement (default: 7)')
+    parser.add_argument('--min-time', type=float, default=0.02,
+                        help='Minimum seconds per batch (default: 0.02)')
+    parser.add_argument('--save', nargs='?', const='', default=None, metavar='PATH',
+                        help='Save results as a JSON baseline (default path: benchmarks/baselines/<commit>.json)')
+    parser.add_argument('--compare', metavar='PATH', help='Compare with a saved JSON baseline')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Slowdown ratio flagged as a regression (default: 1.25)')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {operation: {} for operation in args.operations}
+    print(f"{args.warmup} warmup + {args.repeats} timed batches per measurement, >= {args.min_time:g}s each")
+    print(f"{'operation':<28}{'lines':>9}{'calls':>8}{'min':>12}{'median':>12}{'peak':>12}")
+    for size in args.sizes:
+        calc = build_order(size)
+        for operation in args.operations:
+            stats = measure(operation, calc, size, args.warmup, args.repeats, args.min_time)
+            results[operation][str(size)] = stats
+            print(f"{operation:<28}{size:>9}{stats['number']:>8}{format_time(stats['min']):>12}"
+                  f"{format_time(stats['median']):>12}{stats['peak_bytes'] / 1024:>10.1f}KB")
+        calc.check_consistency()
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": args.warmup,
+        "repeats": args.repeats,
+        "min_time": args.min_time,
+        "results": results,
+    }
+    if args.save is not None:
+        path = Path(args.save) if args.save else BASELINE_DIR / f"{report['commit']}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved baseline to {path}")
+
+    if baseline is not None and compare(results, baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
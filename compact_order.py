@@ -0,0 +1,276 @@
+"""
+Compact, array-backed storage for very large orders.
+
+CompactOrderCalculator is a drop-in OrderCalculator that keeps its items in
+parallel columns instead of one dict per line: prices in an array('d'),
+quantities in an array('q') and names in a list of interned strings (so the
+same product name shared by many orders is stored once). A million-line
+order needs a fraction of the memory of the dict-per-item representation,
+and the price/quantity columns can be handed to NumPy without copying
+(see columns()).
+
+All public methods behave as in OrderCalculator, with these differences
+inherent to the storage:
+    - prices are stored as floats, so integer prices come back as floats
+      (exact up to 2 ** 53) and subtotals are always floats;
+    - quantities are limited to signed 64-bit integers (OverflowError above);
+    - items returns a snapshot list; edit the order through its methods, or
+      assign a new list to items to replace the contents.
+
+Usage:
+    order = CompactOrderCalculator()
+    order.add_items((f"sku-{i}", 9.99, 1) for i in range(1_000_000))
+    order.calculate_total(0.1)
+"""
+
+import sys
+from array import array
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+from order_calculator import Item, OrderCalculator
+
+_MAX_QUANTITY = 2 ** 63 - 1
+
+# Removed rows are left as tombstones and compacted once they make up half of the columns
+_MIN_COMPACT_ROWS = 1024
+
+
+def _intern(name: str) -> str:
+    # sys.intern only accepts exact str instances
+    return sys.intern(name) if type(name) is str else name
+
+
+class CompactOrderCalculator(OrderCalculator):
+    def __init__(self, tax_rate=0.23, free_shipping_threshold=100.0, shipping_cost=10.0,
+                 exact_subtotal: bool = False):
+        """
+        Initializes a new, empty CompactOrderCalculator instance.
+
+        :param tax_rate: As for OrderCalculator.
+        :param free_shipping_threshold: As for OrderCalculator.
+        :param shipping_cost: As for OrderCalculator.
+        :param exact_subtotal: As for OrderCalculator.
+        :raises ValueError: As for OrderCalculator.
+        :raises TypeError: As for OrderCalculator.
+        """
+        super().__init__(tax_rate, free_shipping_threshold, shipping_cost, exact_subtotal)
+        # _index maps each name to its row; removed rows have the name None
+        self._names: List[Optional[str]] = []
+        self._prices = array('d')
+        self._quantities = array('q')
+        self._removed = 0
+
+    @property
+    def items(self) -> List[Item]:
+        """
+        A snapshot of the items in the order, in insertion order.
+
+        Changes to the returned list do not affect the order.
+
+        :return: The list of items.
+        """
+        return [{"name": name, "price": price, "quantity": quantity}
+                for name, price, quantity in zip(self._names, self._prices, self._quantities)
+                if name is not None]
+
+    @items.setter
+    def items(self, items: List[Item]):
+        """
+        Replaces the contents of the order, adding the items as add_items does.
+        The order is left unchanged if an item is invalid.
+        """
+        index, self._index = self._index, {}
+        try:
+            pending = self._pending_items(*self._item_columns(items))
+        finally:
+            self._index = index
+        lines = list(pending.values())
+        quantities = [line["quantity"] for line in lines]
+        prices = self._check_columns([line["price"] for line in lines], quantities)
+        self.clear_order()
+        self._append_rows([line["name"] for line in lines], prices, quantities)
+
+    def _load_items(self, items: Iterable[Item]):
+        self.items = items
+
+    def columns(self) -> Tuple[List[str], array, array]:
+        """
+        Returns the storage columns, without removed rows.
+
+        The arrays support the buffer protocol, e.g. numpy.frombuffer(prices) gives
+        a zero-copy view. They are the live storage and must not be modified.
+
+        :return: Tuple of (names, prices, quantities).
+        """
+        if self._removed:
+            self._compact()
+        return self._names, self._prices, self._quantities
+
+    def _rows(self) -> List[Item]:
+        return self.items
+
+    def _line_totals(self) -> Iterable[float]:
+        return (price * quantity for name, price, quantity in zip(self._names, self._prices, self._quantities)
+                if name is not None)
+
+    def _recount(self):
+        """
+        Recomputes the maintained quantity and subtotal totals from the columns.
+        """
+        self._reset_totals()
+        for name, price, quantity in zip(self._names, self._prices, self._quantities):
+            if name is not None:
+                self._add_to_totals(price, quantity)
+
+    def _price_of(self, name: str):
+        row = self._index.get(name)
+        return None if row is None else self._prices[row]
+
+    def add_item(self, name: str, price: float, quantity: int = 1):
+        """
+        Add an item to the order.
+
+        If an item with the same name and price already exists, its quantity is increased.
+
+        :param name: the name of the item
+        :param price: the price of the item
+        :param quantity: the quantity of the item (default is 1)
+        :raises ValueError: If name is empty, price <= 0, quantity < 1, or item with same name but different price exists.
+        :raises TypeError: If inputs are of incorrect types.
+        :raises OverflowError: If the quantity does not fit in 64 bits.
+        """
+        self._validate_item(name, price, quantity)
+
+        row = self._index.get(name)
+        if row is None:
+            self._append_rows([name], self._check_columns([price], [quantity]), [quantity])
+            return
+        if self._prices[row] != price:
+            raise ValueError("Item with the same name but different price already exists.")
+        self._increase_row(row, quantity)
+
+    def add_items(self, items: Iterable[Union[Mapping[str, Any], tuple]]):
+        """
+        Adds several items to the order at once, as OrderCalculator.add_items does.
+
+        New items are appended to the columns in bulk; a batch of valid, distinct new names
+        goes straight from the input columns to the storage.
+
+        :param items: the items to add
+        :raises ValueError: As add_item, for the first invalid entry.
+        :raises TypeError: As add_item, for the first invalid entry, or if an entry is neither a mapping nor a tuple.
+        :raises OverflowError: If a quantity does not fit in 64 bits.
+        """
+        names, prices, quantities, malformed = self._item_columns(items)
+        if (not malformed and self._columns_valid(names, prices, quantities)
+                and self._index.keys().isdisjoint(names) and len(set(names)) == len(names)):
+            self._append_rows(names, self._check_columns(prices, quantities), quantities)
+            return
+
+        pending = self._pending_items(names, prices, quantities, malformed)
+        increases, names, prices, quantities = [], [], [], []
+        for name, line in pending.items():
+            row = self._index.get(name)
+            if row is not None:
+                increases.append((row, line["quantity"]))
+            else:
+                names.append(name)
+                prices.append(line["price"])
+                quantities.append(line["quantity"])
+
+        if any(self._quantities[row] + quantity > _MAX_QUANTITY for row, quantity in increases):
+            raise OverflowError("Quantity is too large for compact storage.")
+        prices = self._check_columns(prices, quantities)
+        self._append_rows(names, prices, quantities)
+        for row, quantity in increases:
+            self._increase_row(row, quantity)
+
+    @staticmethod
+    def _check_columns(prices: List[Any], quantities: List[int]) -> List[float]:
+        """
+        Checks that validated prices and quantities fit the storage columns.
+
+        :return: The prices as floats.
+        :raises OverflowError: If a price does not fit in a float or a quantity in 64 bits.
+        """
+        if quantities and max(quantities) > _MAX_QUANTITY:
+            raise OverflowError("Quantity is too large for compact storage.")
+        return [float(price) for price in prices]
+
+    def _append_rows(self, names: List[str], prices: List[float], quantities: List[int]):
+        """
+        Appends new items with distinct names and checked columns to the columns and the totals.
+        """
+        self._version += 1
+        first_row = len(self._names)
+        self._prices.extend(prices)
+        self._quantities.extend(quantities)
+        self._names.extend(map(_intern, names))
+        self._index.update(zip(self._names[first_row:], range(first_row, len(self._names))))
+        for price, quantity in zip(self._prices[first_row:], quantities):
+            self._add_to_totals(price, quantity)
+
+    def _increase_row(self, row: int, quantity: int):
+        """
+        Increases the quantity of an item already in the order.
+        """
+        old_quantity = self._quantities[row]
+        if old_quantity + quantity > _MAX_QUANTITY:
+            raise OverflowError("Quantity is too large for compact storage.")
+        self._version += 1
+        self._quantities[row] = old_quantity + quantity
+        self._add_to_totals(self._prices[row], old_quantity + quantity, old_quantity)
+
+    def _discard(self, names):
+        """
+        Marks the rows of items with validated names as removed and updates the totals.
+        """
+        self._version += 1
+        for name in names:
+            row = self._index.pop(name)
+            self._add_to_totals(self._prices[row], 0, self._quantities[row])
+            self._names[row] = None
+            self._removed += 1
+        if self._removed >= _MIN_COMPACT_ROWS and self._removed * 2 >= len(self._names):
+            self._compact()
+
+    def _compact(self):
+        """
+        Drops removed rows from the columns and re-numbers the index.
+        """
+        rows = [row for row, name in enumerate(self._names) if name is not None]
+        self._names = [self._names[row] for row in rows]
+        self._prices = array('d', [self._prices[row] for row in rows])
+        self._quantities = array('q', [self._quantities[row] for row in rows])
+        self._index = dict(zip(self._names, range(len(self._names))))
+        self._removed = 0
+
+    def clear_order(self):
+        """
+        Removes all items from the order, resetting it to an empty state.
+        """
+        super().clear_order()
+        self._names = []
+        self._prices = array('d')
+        self._quantities = array('q')
+        self._removed = 0
+
+    def list_items(self) -> List[str]:
+        """
+        Returns a list of all unique item names currently in the order.
+
+        :return: A list of unique item names (no duplicates).
+        """
+        names = self._memo_get("list_items")
+        if names is None:
+            names = list(set(self._index))
+            self._memo_put("list_items", names)
+        return list(names)
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the order is currently empty.
+
+        :return: True if no items are in the order, False otherwise.
+        """
+        return not self._index
@@ -0,0 +1,345 @@
+"""
+Thread-safe OrderCalculator with copy-on-write snapshots.
+
+ConcurrentOrderCalculator can be shared between threads. Mutating methods
+(add_item, add_items, remove_item, remove_items, clear_order, assigning items
+or a pricing setting) are serialized by a lock; each one publishes a new
+immutable OrderSnapshot by a single reference assignment. Read methods
+(get_subtotal, calculate_total, total_items, list_items, is_empty, items)
+answer from the current snapshot without taking the lock, so a reader never
+sees a half-applied change and never blocks on a writer.
+
+Snapshots share nothing mutable with the order. Their lines are an immutable
+name -> (price, quantity) base table shared between snapshots plus a small
+table of changes since the base, copied on every write (copy-on-write) and
+folded into a new base once it outgrows the square root of the base size,
+so a write costs O(sqrt(n)) amortized instead of O(n). Subtotal and quantity
+totals are taken from the maintained totals at publish time, so quotes never
+touch the lines. By default only added lines extend the maintained subtotal
+and updates or removals re-sum the lines at publish time; create the order
+with exact_subtotal=True to keep those writes O(sqrt(n)) as well. Group
+changes with add_items/remove_items to publish once per batch.
+
+Usage:
+    order = ConcurrentOrderCalculator()
+    order.add_item("book", 19.99, 3)          # from any thread
+    order.calculate_total(0.1)                # lock-free
+
+    snapshot = order.snapshot()               # consistent view for several reads
+    snapshot.get_subtotal(), snapshot.list_items()
+"""
+
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from order_calculator import Item, OrderCalculator
+
+# Changes since the base table are folded into a new base beyond max(_MIN_CHANGES, sqrt(base size))
+_MIN_CHANGES = 32
+
+_MISSING = object()
+
+
+def _merged(base: Dict[str, Tuple[Any, int]], changes: Dict[str, Optional[Tuple[Any, int]]]):
+    """
+    Applies changes (None for removed lines) to a base table of lines, keeping insertion order.
+    """
+    if not changes:
+        return base
+    lines = {}
+    for name, line in base.items():
+        line = changes.get(name, line)
+        if line is not None:
+            lines[name] = line
+    for name, line in changes.items():
+        if name not in base:
+            lines[name] = line
+    return lines
+
+
+class OrderSnapshot:
+    """
+    Immutable view of an order at one version, with OrderCalculator's read methods.
+
+    :ivar version: The order version the snapshot was taken at.
+    """
+    __slots__ = ("version", "tax_rate", "free_shipping_threshold", "shipping_cost", "_base", "_changes",
+                 "_lines", "_line_count", "_subtotal", "_quantity")
+
+    def __init__(self, version: int, tax_rate, free_shipping_threshold, shipping_cost,
+                 base: Dict[str, Tuple[Any, int]], changes: Dict[str, Optional[Tuple[Any, int]]],
+                 line_count: int, subtotal, quantity: int):
+        self.version = version
+        self.tax_rate = tax_rate
+        self.free_shipping_threshold = free_shipping_threshold
+        self.shipping_cost = shipping_cost
+        self._base = base
+        self._changes = changes
+        self._lines = None
+        self._line_count = line_count
+        self._subtotal = subtotal
+        self._quantity = quantity
+
+    apply_discount = OrderCalculator.apply_discount
+    calculate_shipping = OrderCalculator.calculate_shipping
+    calculate_tax = OrderCalculator.calculate_tax
+    _compute_total = OrderCalculator._compute_total
+
+    def lines(self) -> Dict[str, Tuple[Any, int]]:
+        """
+        Returns the name -> (price, quantity) table of the snapshot, in insertion order.
+        The table is shared and must not be modified.
+        """
+        if self._lines is None:
+            # Racing readers compute the same table; either result may be kept
+            self._lines = _merged(self._base, self._changes)
+        return self._lines
+
+    @property
+    def items(self) -> List[Item]:
+        """
+        The items of the snapshot, in insertion order, as new Item dicts.
+        """
+        return [{"name": name, "price": price, "quantity": quantity}
+                for name, (price, quantity) in self.lines().items()]
+
+    def get_subtotal(self) -> float:
+        """
+        Returns the subtotal of the snapshot.
+
+        :raises ValueError: If the order is empty.
+        """
+        if not self._line_count:
+            raise ValueError("Cannot calculate subtotal on empty order.")
+        return self._subtotal
+
+    def calculate_total(self, discount: float = 0.0) -> float:
+        """
+        Calculates the total of the snapshot, as OrderCalculator.calculate_total does.
+
+        :raises ValueError: If the discount is invalid or the order is empty.
+        :raises TypeError: If input is not a number.
+        """
+        if not isinstance(discount, (float, int)):
+            raise TypeError("Discount must be a number.")
+        return self._compute_total(discount)
+
+    def total_items(self) -> int:
+        """
+        Returns the total quantity of all items in the snapshot.
+        """
+        return self._quantity
+
+    def list_items(self) -> List[str]:
+        """
+        Returns the unique item names of the snapshot.
+        """
+        return list(self.lines())
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the snapshot has no items.
+        """
+        return not self._line_count
+
+
+def _published_setting(name: str) -> property:
+    """
+    A pricing setting whose assignment is serialized and published to readers.
+    """
+    private_name = "_" + name
+
+    def fget(self):
+        return getattr(self, private_name)
+
+    def fset(self, value):
+        with self._write_lock:
+            setattr(self, private_name, value)
+            self._publish(())
+
+    return property(fget, fset)
+
+
+class ConcurrentOrderCalculator(OrderCalculator):
+    tax_rate = _published_setting("tax_rate")
+    free_shipping_threshold = _published_setting("free_shipping_threshold")
+    shipping_cost = _published_setting("shipping_cost")
+
+    def __init__(self, tax_rate=0.23, free_shipping_threshold=100.0, shipping_cost=10.0,
+                 exact_subtotal: bool = False):
+        """
+        Initializes a new, empty ConcurrentOrderCalculator instance.
+
+        :param tax_rate: As for OrderCalculator.
+        :param free_shipping_threshold: As for OrderCalculator.
+        :param shipping_cost: As for OrderCalculator.
+        :param exact_subtotal: As for OrderCalculator.
+        :raises ValueError: As for OrderCalculator.
+        :raises TypeError: As for OrderCalculator.
+        """
+        self._write_lock = threading.RLock()
+        self._snapshot: Optional[OrderSnapshot] = None
+        # Settings assigned by OrderCalculator.__init__ are published once it is done
+        self._ready = False
+        super().__init__(tax_rate, free_shipping_threshold, shipping_cost, exact_subtotal)
+        self._ready = True
+        self._publish(None)
+
+    def _publish(self, names: Optional[Iterable[str]]):
+        """
+        Publishes a snapshot of the current state (called with the write lock held).
+
+        :param names: The names whose lines changed, or None to rebuild all lines.
+        """
+        if not self._ready:
+            return
+        if names is None:
+            base = {name: (item["price"], item["quantity"]) for name, item in self._index.items()}
+            changes = {}
+        else:
+            base, changes = self._snapshot._base, self._snapshot._changes
+            names = list(names)
+            if names:
+                changes = dict(changes)
+                for name in names:
+                    item = self._index.get(name)
+                    if item is None:
+                        if name in base:
+                            changes[name] = None
+                        else:
+                            changes.pop(name, None)
+                        continue
+                    if name in base and changes.get(name, _MISSING) is None:
+                        # Re-added after removal: fold so that the line moves to the end
+                        base, changes = _merged(base, changes), {}
+                    changes[name] = (item["price"], item["quantity"])
+                if len(changes) > max(_MIN_CHANGES, math.isqrt(len(base))):
+                    base, changes = _merged(base, changes), {}
+        subtotal = self._compute_subtotal() if self._index else None
+        self._snapshot = OrderSnapshot(self._version, self._tax_rate, self._free_shipping_threshold,
+                                       self._shipping_cost, base, changes, len(self._index), subtotal,
+                                       self._quantity)
+
+    def snapshot(self) -> OrderSnapshot:
+        """
+        Returns the current immutable snapshot, for several consistent reads.
+        """
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """
+        The version of the current snapshot.
+        """
+        return self._snapshot.version
+
+    @property
+    def items(self) -> List[Item]:
+        """
+        A snapshot of the items in the order, in insertion order.
+
+        Changes to the returned list do not affect the order.
+
+        :return: The list of items.
+        """
+        return self._snapshot.items
+
+    @items.setter
+    def items(self, items: List[Item]):
+        """
+        Replaces the contents of the order, adding the items as add_items does.
+        The order is left unchanged if an item is invalid.
+        """
+        with self._write_lock:
+            index, self._index = self._index, {}
+            try:
+                pending = self._pending_items(*self._item_columns(items))
+            finally:
+                self._index = index
+            OrderCalculator.clear_order(self)
+            for line in pending.values():
+                self._insert(line)
+            self._publish(None)
+
+    def _load_items(self, items: Iterable[Item]):
+        self.items = items
+
+    def add_item(self, name: str, price: float, quantity: int = 1):
+        """
+        As OrderCalculator.add_item, serialized with other writers.
+        """
+        with self._write_lock:
+            super().add_item(name, price, quantity)
+            self._publish((name,))
+
+    def add_items(self, items: Iterable[Union[Mapping[str, Any], tuple]]):
+        """
+        As OrderCalculator.add_items, serialized with other writers and published once.
+        """
+        with self._write_lock:
+            pending = self._pending_items(*self._item_columns(items))
+            self._apply_pending(pending)
+            self._publish(pending)
+
+    def remove_item(self, name: str):
+        """
+        As OrderCalculator.remove_item, serialized with other writers.
+        """
+        with self._write_lock:
+            super().remove_item(name)
+            self._publish((name,))
+
+    def remove_items(self, names: Iterable[str]):
+        """
+        As OrderCalculator.remove_items, serialized with other writers and published once.
+        """
+        names = list(names)
+        with self._write_lock:
+            super().remove_items(names)
+            self._publish(names)
+
+    def clear_order(self):
+        """
+        As OrderCalculator.clear_order, serialized with other writers.
+        """
+        with self._write_lock:
+            super().clear_order()
+            self._publish(None)
+
+    def check_consistency(self):
+        """
+        As OrderCalculator.check_consistency, serialized with writers.
+        """
+        with self._write_lock:
+            super().check_consistency()
+
+    def get_subtotal(self) -> float:
+        """
+        Returns the subtotal of the current snapshot (lock-free).
+        """
+        return self._snapshot.get_subtotal()
+
+    def calculate_total(self, discount: float = 0.0) -> float:
+        """
+        Calculates the total of the current snapshot (lock-free).
+        """
+        return self._snapshot.calculate_total(discount)
+
+    def total_items(self) -> int:
+        """
+        Returns the total quantity of the current snapshot (lock-free).
+        """
+        return self._snapshot.total_items()
+
+    def list_items(self) -> List[str]:
+        """
+        Returns the unique item names of the current snapshot (lock-free).
+        """
+        return self._snapshot.list_items()
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the current snapshot has no items (lock-free).
+        """
+        return self._snapshot.is_empty()
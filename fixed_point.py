@@ -0,0 +1,270 @@
+"""
+Integer fixed-point (minor units) pricing for OrderCalculator.
+
+FixedPointOrderCalculator keeps the subtotal as an exact integer number of
+minor units (cents by default, minor_units=100) and computes discount, shipping,
+tax and total with integer arithmetic only, so results are exact and can be
+compared with ==, including against batch_pricing.price_orders_minor.
+
+Rounding rule: prices, the free shipping threshold and the shipping cost must
+be whole numbers of minor units (19.99 is 1999 cents, 19.995 is rejected).
+Discount and tax rates are taken as the exact decimal fractions they are
+written as (0.23 is 23/100, not the nearest binary float). The discounted
+subtotal and the tax are each rounded to the nearest minor unit, halves
+rounded up (away from zero); subtotal, shipping and total need no rounding.
+Amounts passed to apply_discount, calculate_shipping and calculate_tax are
+first rounded to minor units by the same rule.
+
+The *_minor methods return integer minor units; the inherited methods keep
+their signatures and return the same values as floats in major units.
+
+Usage:
+    order = FixedPointOrderCalculator()
+    order.add_item("book", 19.99, 3)
+    order.calculate_total_minor(0.1)  # 7868 (cents)
+    order.calculate_total(0.1)        # 78.68
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Tuple
+
+from order_calculator import OrderCalculator
+
+
+@lru_cache(maxsize=4096)
+def decimal_ratio(value) -> Tuple[int, int]:
+    """
+    Returns a number as the exact fraction of its shortest decimal representation.
+
+    :param value: A float or int.
+    :return: Tuple of (numerator, denominator).
+    :raises ValueError: If the value is not finite.
+    """
+    if isinstance(value, float):
+        try:
+            return Decimal(repr(value)).as_integer_ratio()
+        except (ValueError, OverflowError):
+            raise ValueError("Amount must be finite.") from None
+    return int(value), 1
+
+
+def round_half_up(numerator: int, denominator: int) -> int:
+    """
+    Rounds the non-negative fraction numerator / denominator to the nearest integer, halves up.
+    """
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def to_minor_units(value, minor_units: int = 100, label: str = "Amount") -> int:
+    """
+    Converts an amount in major units to a whole number of minor units.
+
+    :param value: The amount, e.g. a price of 19.99.
+    :param minor_units: Minor units per major unit (default is 100).
+    :param label: What the amount is, for the error message.
+    :return: The amount in minor units, e.g. 1999.
+    :raises ValueError: If the amount is not a whole number of minor units.
+    """
+    numerator, denominator = decimal_ratio(value)
+    minor, remainder = divmod(numerator * minor_units, denominator)
+    if remainder:
+        raise ValueError(f"{label} must be a whole number of minor units (1/{minor_units}).")
+    return minor
+
+
+class FixedPointOrderCalculator(OrderCalculator):
+    def __init__(self, tax_rate=0.23, free_shipping_threshold=100.0, shipping_cost=10.0, minor_units=100):
+        """
+        Initializes a new OrderCalculator instance with integer minor-unit arithmetic.
+
+        :param tax_rate: As for OrderCalculator.
+        :param free_shipping_threshold: As for OrderCalculator; must be a whole number of minor units.
+        :param shipping_cost: As for OrderCalculator; must be a whole number of minor units.
+        :param minor_units: Minor units per major unit (default is 100, i.e. cents).
+        :raises ValueError: As for OrderCalculator, if minor_units < 1, or if the threshold or
+            shipping cost is not a whole number of minor units.
+        :raises TypeError: As for OrderCalculator, or if minor_units is not an integer.
+        """
+        super().__init__(tax_rate, free_shipping_threshold, shipping_cost)
+        if not isinstance(minor_units, int):
+            raise TypeError("Minor units must be an integer.")
+        if minor_units < 1:
+            raise ValueError("Minor units must be at least 1.")
+        self.minor_units = minor_units
+        to_minor_units(free_shipping_threshold, minor_units, "Free shipping threshold")
+        to_minor_units(shipping_cost, minor_units, "Shipping cost")
+        self._subtotal_minor = 0
+
+    def _validate_item(self, name, price, quantity):
+        """
+        Validates the arguments of add_item, including that the price is a whole number of minor units.
+        """
+        super()._validate_item(name, price, quantity)
+        to_minor_units(price, self.minor_units, "Price")
+
+    def _columns_valid(self, names, prices, quantities) -> bool:
+        if not super()._columns_valid(names, prices, quantities):
+            return False
+        try:
+            for price in set(prices):
+                to_minor_units(price, self.minor_units)
+        except ValueError:
+            return False
+        return True
+
+    def _add_to_totals(self, price, quantity, old_quantity: int = 0):
+        super()._add_to_totals(price, quantity, old_quantity)
+        self._subtotal_minor += to_minor_units(price, self.minor_units) * (quantity - old_quantity)
+
+    def _reset_totals(self):
+        super()._reset_totals()
+        self._subtotal_minor = 0
+
+    def check_consistency(self):
+        """
+        Verifies the maintained totals, including the minor-unit subtotal, against a fresh summation.
+
+        :raises AssertionError: If the maintained totals are out of sync with the items.
+        """
+        self._sync()
+        subtotal_minor = self._subtotal_minor
+        super().check_consistency()
+        if subtotal_minor != self._subtotal_minor:
+            raise AssertionError(
+                f"Order totals out of sync: maintained subtotal={subtotal_minor} minor units; "
+                f"expected {self._subtotal_minor}."
+            )
+
+    def _amount_minor(self, amount) -> int:
+        """
+        Rounds a non-negative amount in major units to minor units (halves up).
+        """
+        numerator, denominator = decimal_ratio(amount)
+        return round_half_up(numerator * self.minor_units, denominator)
+
+    def _to_major(self, minor: int) -> float:
+        return minor / self.minor_units
+
+    def get_subtotal_minor(self) -> int:
+        """
+        Returns the subtotal in minor units.
+
+        :return: The exact subtotal as an integer.
+        :raises ValueError: If the order is empty.
+        """
+        self._sync()
+        if self.is_empty():
+            raise ValueError("Cannot calculate subtotal on empty order.")
+        if self._direct:
+            # Changes to a list given directly are not tracked
+            self._recount()
+        return self._subtotal_minor
+
+    def get_subtotal(self) -> float:
+        """
+        Calculates the subtotal (sum of item prices times their quantities) for all items in the order.
+
+        :return: The subtotal as a float.
+        :raises ValueError: If the order is empty.
+        """
+        return self._to_major(self.get_subtotal_minor())
+
+    def apply_discount_minor(self, subtotal_minor: int, discount) -> int:
+        """
+        Applies a discount to a subtotal in minor units, rounding half up to a minor unit.
+
+        :param subtotal_minor: The subtotal in minor units (must be >= 0).
+        :param discount: The discount rate between 0.0 and 1.0.
+        :return: The discounted subtotal in minor units.
+        """
+        numerator, denominator = decimal_ratio(discount)
+        return round_half_up(subtotal_minor * (denominator - numerator), denominator)
+
+    def apply_discount(self, subtotal: float, discount: float) -> float:
+        """
+        Applies a percentage discount to the given subtotal, rounded to a minor unit.
+
+        :param subtotal: the subtotal amount (must be >= 0)
+        :param discount: the discount rate as a float between 0.0 and 1.0 (e.g. 0.2 = 20%).
+        :return: The discounted subtotal.
+        :raises ValueError: If subtotal < 0 or discount is outside the [0.0, 1.0] range.
+        :raises TypeError: If inputs are of incorrect types.
+        """
+        super().apply_discount(subtotal, discount)
+        return self._to_major(self.apply_discount_minor(self._amount_minor(subtotal), discount))
+
+    def calculate_shipping_minor(self, discounted_subtotal_minor: int) -> int:
+        """
+        Returns the shipping cost in minor units for a discounted subtotal in minor units.
+        """
+        if discounted_subtotal_minor >= to_minor_units(self.free_shipping_threshold, self.minor_units):
+            return 0
+        return to_minor_units(self.shipping_cost, self.minor_units)
+
+    def calculate_shipping(self, discounted_subtotal: float) -> float:
+        """
+        Calculates the shipping cost based on the discounted subtotal, rounded to a minor unit.
+
+        :param discounted_subtotal: The subtotal amount after applying discount (must be >= 0.0).
+        :return: The shipping cost as a float (0.0 or self.shipping_cost).
+        :raises TypeError: If input is not a number.
+        """
+        super().calculate_shipping(discounted_subtotal)
+        return self._to_major(self.calculate_shipping_minor(self._amount_minor(discounted_subtotal)))
+
+    def calculate_tax_minor(self, amount_minor: int) -> int:
+        """
+        Returns the tax in minor units on an amount in minor units, rounding half up to a minor unit.
+        """
+        numerator, denominator = decimal_ratio(self.tax_rate)
+        return round_half_up(amount_minor * numerator, denominator)
+
+    def calculate_tax(self, amount: float) -> float:
+        """
+        Calculates the tax based on the provided amount, rounded to a minor unit.
+
+        :param amount: The amount on which to calculate the tax (must be >= 0.0).
+        :return: The tax as a float.
+        :raises ValueError: If the amount is negative.
+        :raises TypeError: If input is not a number.
+        """
+        super().calculate_tax(amount)
+        return self._to_major(self.calculate_tax_minor(self._amount_minor(amount)))
+
+    def calculate_total_minor(self, discount: float = 0.0) -> int:
+        """
+        Calculates the total cost of the order in minor units, after discount, shipping and tax.
+
+        :param discount: Discount rate between 0.0 and 1.0 (e.g. 0.2 = 20%).
+        :return: The exact total as an integer.
+        :raises ValueError: If the discount is invalid or the order is empty.
+        :raises TypeError: If input is not a number.
+        """
+        if not isinstance(discount, (float, int)):
+            raise TypeError("Discount must be a number.")
+        subtotal = self.get_subtotal_minor()
+        if not 0.0 <= discount <= 1.0:
+            raise ValueError("Discount must be between 0.0 and 1.0.")
+
+        key = ("total_minor", decimal_ratio(discount), self.tax_rate, self.free_shipping_threshold,
+               self.shipping_cost, self.minor_units)
+        total = self._memo_get(key)
+        if total is None:
+            discounted_subtotal = self.apply_discount_minor(subtotal, discount)
+            shipping_cost = self.calculate_shipping_minor(discounted_subtotal)
+            tax = self.calculate_tax_minor(discounted_subtotal + shipping_cost)
+            total = discounted_subtotal + shipping_cost + tax
+            self._memo_put(key, total)
+        return total
+
+    def calculate_total(self, discount: float = 0.0) -> float:
+        """
+        Calculates the total cost of the order after applying discount, shipping, and tax.
+
+        :param discount: Discount rate between 0.0 and 1.0 (e.g. 0.2 = 20%).
+        :return: The final total as a float.
+        :raises ValueError: If the discount is invalid or the order is empty.
+        :raises TypeError: If input is not a number.
+        """
+        return self._to_major(self.calculate_total_minor(discount))
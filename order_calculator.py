@@ -1,4 +1,16 @@
-from typing import TypedDict, List
+import math
+from typing import TypedDict, Any, Dict, Iterable, List, Mapping, Optional, Union
+
+# Exact subtotals are accumulated in units of the smallest positive float (2 ** -1074),
+# so incremental updates never drift from a fresh summation.
+_SUBTOTAL_SCALE = 2 ** 1074
+
+# Whether sum() adds floats one at a time, left to right, so that a running total of appended
+# lines equals a fresh summation (Python 3.12+ compensates rounding errors in sum() instead)
+_SEQUENTIAL_SUM = sum([0.1, 0.2, 0.3]) == 0.1 + 0.2 + 0.3
+
+# Maximum number of derived values (subtotal, item names, totals per discount) memoized per order
+_MEMO_SIZE = 32
 
 
 class Item(TypedDict):
@@ -14,16 +26,96 @@ class Item(TypedDict):
     quantity: int
 
 
+def _marks_order(method):
+    """
+    Wraps a mutating list or dict method so that calling it marks the owning order as edited,
+    if the list or dict is still part of the order.
+    """
+    def marking(self, *args, **kwargs):
+        if self._in_order():
+            self._order._edited = True
+        return method(self, *args, **kwargs)
+
+    marking.__name__ = method.__name__
+    marking.__doc__ = method.__doc__
+    return marking
+
+
+class _ItemDict(dict):
+    """
+    An item dict owned by an order; changes made to it in place are picked up by the order's next operation.
+    """
+    __slots__ = ("_order",)
+
+    def __init__(self, order: 'OrderCalculator', item: Mapping[str, Any]):
+        super().__init__(item)
+        self._order = order
+
+    def __reduce__(self):
+        return _ItemDict, (self._order, dict(self))
+
+    def _in_order(self) -> bool:
+        name = dict.get(self, "name")
+        return isinstance(name, str) and self._order._index.get(name) is self
+
+    __setitem__ = _marks_order(dict.__setitem__)
+    __delitem__ = _marks_order(dict.__delitem__)
+    __ior__ = _marks_order(dict.__ior__)
+    clear = _marks_order(dict.clear)
+    pop = _marks_order(dict.pop)
+    popitem = _marks_order(dict.popitem)
+    setdefault = _marks_order(dict.setdefault)
+    update = _marks_order(dict.update)
+
+
+class _ItemList(list):
+    """
+    The items list of an order; changes made to it in place are picked up by the order's next operation.
+    """
+    __slots__ = ("_order",)
+
+    def __init__(self, order: 'OrderCalculator', items: Iterable[Item] = ()):
+        super().__init__(items)
+        self._order = order
+
+    def __reduce__(self):
+        return _ItemList, (self._order, list(self))
+
+    def _in_order(self) -> bool:
+        return self._order._items is self
+
+    __setitem__ = _marks_order(list.__setitem__)
+    __delitem__ = _marks_order(list.__delitem__)
+    __iadd__ = _marks_order(list.__iadd__)
+    __imul__ = _marks_order(list.__imul__)
+    append = _marks_order(list.append)
+    clear = _marks_order(list.clear)
+    extend = _marks_order(list.extend)
+    insert = _marks_order(list.insert)
+    pop = _marks_order(list.pop)
+    remove = _marks_order(list.remove)
+    reverse = _marks_order(list.reverse)
+    sort = _marks_order(list.sort)
+
+
 class OrderCalculator:
-    def __init__(self, tax_rate=0.23, free_shipping_threshold=100.0, shipping_cost=10.0):
+    def __init__(self, tax_rate=0.23, free_shipping_threshold=100.0, shipping_cost=10.0,
+                 exact_subtotal: bool = False):
         """
         Initializes a new OrderCalculator instance.
-        Initializes an empty list of items (each represented as a TypedDict 'Item')
-        and stores the configured tax and shipping parameters.
+        Initializes an empty collection of items (each represented as a TypedDict 'Item'),
+        indexed by item name, and stores the configured tax and shipping parameters.
 
         :param tax_rate: The percentage of tax applied to the final amount, expressed as a float between 0.0 and 1.0 (default is 0.23 for 23%).
         :param free_shipping_threshold: The minimum order value (after discount) that qualifies for free shipping (default is 100.0).
         :param shipping_cost: The cost of shipping applied if the order does not meet the free shipping threshold (default is 10.0).
+        :param exact_subtotal: Whether get_subtotal returns the correctly rounded sum of the line totals
+            (as math.fsum) instead of the plain sum() in insertion order (default is False). The exact
+            subtotal is maintained incrementally, so it stays O(1) after updates and removals too,
+            but may differ from the default in the last bit (e.g. 0.6 instead of 0.6000000000000001
+            for lines of 0.1, 0.2 and 0.3), and every change pays for exact integer arithmetic.
+            The default subtotal is kept as a running sum of the lines added; the first read
+            after an update or removal re-sums all lines (O(n)).
 
         :raises ValueError:
             - If tax_rate is not in the range [0.0, 1.0].
@@ -43,12 +135,233 @@ class OrderCalculator:
             raise ValueError("Free shipping threshold cannot be negative.")
         if shipping_cost < 0.0:
             raise ValueError("Shipping cost cannot be negative.")
-
-        self.items: List[Item] = []
+        if not isinstance(exact_subtotal, bool):
+            raise TypeError("Exact subtotal must be a bool.")
+
+        self._exact_subtotal = exact_subtotal
+        self._index: Dict[str, Item] = {}
+        self._items: Optional[List[Item]] = None
+        self._edited = False
+        self._direct = False
+        self._quantity = 0
+        self._subtotal_exact: Optional[int] = 0
+        self._subtotal_sum: Union[float, int, None] = 0 if _SEQUENTIAL_SUM and not exact_subtotal else None
+        self._float_lines = 0
+        self._version = 0
+        self._memo: Dict[Any, Any] = {}
+        self._memo_version = 0
         self.tax_rate = tax_rate
         self.free_shipping_threshold = free_shipping_threshold
         self.shipping_cost = shipping_cost
 
+    @property
+    def items(self) -> List[Item]:
+        """
+        The items in the order, in insertion order.
+
+        The list is kept in sync by add_item and replaced by remove_item and clear_order.
+        It may also be changed directly, as may its item dicts (appending or replacing
+        items, e.g. items[0]["quantity"] = 5), or a new list may be assigned. The order
+        then works on that list as given, like a plain list of dicts: every read scans
+        it again (O(n)) and nothing is memoized, until clear_order.
+
+        :return: The list of items.
+        """
+        if self._items is None:
+            self._index = {name: self._tracked(item) for name, item in self._index.items()}
+            self._items = _ItemList(self, self._index.values())
+        return self._items
+
+    @items.setter
+    def items(self, items: List[Item]):
+        """
+        Replaces the contents of the order with the list, which the order then works on as given (see above).
+        """
+        self._work_on(items)
+
+    def _work_on(self, items: List[Item]):
+        """
+        Makes the order work on the list as given, without maintained totals or memoized values.
+        """
+        self._version += 1
+        self._direct = True
+        self._edited = False
+        self._items = items
+        self._index = {}
+
+    def _load_items(self, items: Iterable[Item]):
+        """
+        Replaces the contents of the order with copies of valid items, e.g. as read back from storage.
+        """
+        tracked = _ItemList(self, (_ItemDict(self, item) for item in items))
+        index = {item["name"]: item for item in tracked}
+        if len(index) != len(tracked):
+            # Several lines with one name, as only a list given directly can have
+            self._work_on(tracked)
+            return
+        self._version += 1
+        self._direct = False
+        self._edited = False
+        self._items = tracked
+        self._index = index
+        self._recount()
+
+    def _tracked(self, item: Item) -> Item:
+        """
+        Returns the item as an item dict of this order, copying it if it is not one already.
+        """
+        if type(item) is _ItemDict and item._order is self:
+            return item
+        return _ItemDict(self, item)
+
+    @property
+    def exact_subtotal(self) -> bool:
+        """
+        Whether get_subtotal sums the line totals exactly (see __init__).
+        """
+        return self._exact_subtotal
+
+    @property
+    def version(self) -> int:
+        """
+        A counter increased by every change to the order's items.
+
+        Derived values are memoized against it. Changes made directly to the items list
+        or its item dicts increase it once, when the order starts working on the list
+        as given; later changes to that list are not counted (see items).
+
+        :return: The current version.
+        """
+        self._sync()
+        return self._version
+
+    def _memo_get(self, key):
+        """
+        Returns a memoized derived value for the current version, or None.
+        """
+        if self._direct:
+            return None
+        if self._memo_version != self._version:
+            self._memo.clear()
+            self._memo_version = self._version
+        return self._memo.get(key)
+
+    def _memo_put(self, key, value):
+        """
+        Memoizes a derived value for the current version, evicting the oldest beyond _MEMO_SIZE.
+        """
+        if self._direct:
+            return
+        if len(self._memo) >= _MEMO_SIZE:
+            del self._memo[next(iter(self._memo))]
+        self._memo[key] = value
+
+    def _sync(self):
+        """
+        Starts working on the items list as given if it or an item dict was changed directly.
+        """
+        if self._edited and not self._direct:
+            self._work_on(self.items)
+        self._edited = False
+
+    @staticmethod
+    def _exact_line_total(price, quantity) -> Optional[int]:
+        """
+        Returns price * quantity as an exact multiple of 2 ** -1074, or None if it is not finite.
+        """
+        line_total = price * quantity
+        if isinstance(line_total, float) and not math.isfinite(line_total):
+            return None
+        numerator, denominator = line_total.as_integer_ratio()
+        return numerator * (_SUBTOTAL_SCALE // denominator)
+
+    def _reset_totals(self):
+        """
+        Resets the maintained quantity and subtotal totals to those of an empty order.
+        """
+        self._quantity = 0
+        self._subtotal_exact = 0
+        self._subtotal_sum = 0 if _SEQUENTIAL_SUM and not self._exact_subtotal else None
+        self._float_lines = 0
+
+    def _recount(self):
+        """
+        Recomputes the maintained quantity and subtotal totals from the items.
+        """
+        self._reset_totals()
+        for item in self._rows():
+            self._add_to_totals(item["price"], item["quantity"])
+
+    def _add_to_totals(self, price, quantity, old_quantity: int = 0):
+        """
+        Updates the maintained totals for a line whose quantity changes from old_quantity to quantity
+        (from 0 for an appended line, to 0 for a removed one).
+        """
+        self._quantity += quantity - old_quantity
+        if not self._exact_subtotal:
+            if self._subtotal_sum is not None:
+                if quantity and not old_quantity:
+                    self._subtotal_sum += price * quantity
+                else:
+                    # Only appended lines extend the running sum; it is re-summed on the next read
+                    self._subtotal_sum = None
+            return
+
+        if quantity and not old_quantity:
+            if not isinstance(price * quantity, int):
+                self._float_lines += 1
+        elif old_quantity and not quantity:
+            if not isinstance(price * old_quantity, int):
+                self._float_lines -= 1
+        if self._subtotal_exact is None:
+            return
+        line_total = self._exact_line_total(price, quantity)
+        if line_total is None:
+            self._subtotal_exact = None
+            return
+        if old_quantity:
+            line_total -= self._exact_line_total(price, old_quantity)
+        self._subtotal_exact += line_total
+
+    @staticmethod
+    def _same_sum(a, b) -> bool:
+        """
+        Compares two running sums by type and value, treating NaN as equal to itself.
+        """
+        return type(a) is type(b) and (a == b or (a != a and b != b))
+
+    def check_consistency(self):
+        """
+        Verifies that the maintained subtotal and quantity totals match a fresh summation over the items.
+        Intended as a hook for tests. Nothing is maintained while the order works on a list as given.
+
+        :raises AssertionError: If the maintained totals are out of sync with the items.
+        """
+        self._sync()
+        if self._direct:
+            return
+        quantity = self._quantity
+        subtotal_exact = self._subtotal_exact
+        subtotal_sum = self._subtotal_sum
+        float_lines = self._float_lines
+        self._recount()
+        if subtotal_sum is None:
+            subtotal_sum = self._subtotal_sum
+        if ((quantity, subtotal_exact, float_lines) != (self._quantity, self._subtotal_exact, self._float_lines)
+                or not self._same_sum(subtotal_sum, self._subtotal_sum)):
+            raise AssertionError(
+                f"Order totals out of sync: maintained quantity={quantity}, subtotal={subtotal_exact}; "
+                f"expected quantity={self._quantity}, subtotal={self._subtotal_exact}."
+            )
+
+    def _rows(self) -> Iterable[Item]:
+        """
+        Returns the items to aggregate over: the items list if it has been handed out, otherwise the index.
+        """
+        if self._items is None:
+            return self._index.values()
+        return self._items
+
     def add_item(self, name: str, price: float, quantity: int = 1):
         """
         Add an item to the order.
@@ -61,6 +374,141 @@ class OrderCalculator:
         :raises ValueError: If name is empty, price <= 0, quantity < 1, or item with same name but different price exists.
         :raises TypeError: If inputs are of incorrect types.
         """
+        self._validate_item(name, price, quantity)
+
+        self._sync()
+        if self._direct:
+            self._add_to_list(name, price, quantity)
+            return
+        item = self._index.get(name)
+        if item is not None:
+            if item["price"] != price:
+                raise ValueError("Item with the same name but different price already exists.")
+            self._increase_quantity(item, quantity)
+            return
+
+        self._insert({
+            "name": name,
+            "price": price,
+            "quantity": quantity
+        })
+
+    def add_items(self, items: Iterable[Union[Mapping[str, Any], tuple]]):
+        """
+        Adds several items to the order at once.
+
+        Each entry is either an Item-like mapping (quantity optional, default 1) or a
+        (name, price) / (name, price, quantity) tuple. Entries with the same name are merged,
+        and entries for items already in the order increase their quantity, as with add_item.
+        The whole batch is validated before the order is changed: if any entry is invalid,
+        the error of the first invalid entry is raised and the order is left unchanged.
+
+        :param items: the items to add
+        :raises ValueError: As add_item, for the first invalid entry.
+        :raises TypeError: As add_item, for the first invalid entry, or if an entry is neither a mapping nor a tuple.
+        """
+        self._apply_pending(self._pending_items(*self._item_columns(items)))
+
+    def _apply_pending(self, pending: Dict[str, Item]):
+        """
+        Adds the validated, merged lines of add_items (see _pending_items) to the order.
+        """
+        if self._direct:
+            for line in pending.values():
+                self._add_to_list(line["name"], line["price"], line["quantity"])
+            return
+        for name, line in pending.items():
+            item = self._index.get(name)
+            if item is not None:
+                self._increase_quantity(item, line["quantity"])
+            else:
+                self._insert(line)
+
+    @staticmethod
+    def _item_columns(items: Iterable[Union[Mapping[str, Any], tuple]]) -> tuple:
+        """
+        Splits the entries of add_items into columns, up to the first malformed entry.
+
+        :return: Tuple of (names, prices, quantities, malformed).
+        """
+        names, prices, quantities = [], [], []
+        malformed = False
+        for entry in items:
+            if type(entry) is tuple and len(entry) == 3:
+                name, price, quantity = entry
+            elif isinstance(entry, Mapping):
+                name, price, quantity = entry.get("name"), entry.get("price"), entry.get("quantity", 1)
+            elif isinstance(entry, tuple) and 2 <= len(entry) <= 3:
+                name, price, quantity = (entry + (1,))[:3]
+            else:
+                malformed = True
+                break
+            names.append(name)
+            prices.append(price)
+            quantities.append(quantity)
+        return names, prices, quantities, malformed
+
+    def _pending_items(self, names: List[Any], prices: List[Any], quantities: List[Any],
+                       malformed: bool = False) -> Dict[str, Item]:
+        """
+        Validates columns of add_items entries and merges them by name, without changing the order.
+
+        :return: One line per name with the total quantity to add.
+        :raises ValueError: As add_item, for the first invalid entry.
+        :raises TypeError: As add_item, for the first invalid entry, or if the entries were malformed.
+        """
+        # Validate whole columns at once; check row by row only to report the first invalid entry
+        validated = self._columns_valid(names, prices, quantities)
+        self._sync()
+        pending: Dict[str, Item] = {}
+        for name, price, quantity in zip(names, prices, quantities):
+            if not validated:
+                self._validate_item(name, price, quantity)
+            line = pending.get(name)
+            if line is None:
+                existing_price = self._price_of(name)
+                if existing_price is not None and existing_price != price:
+                    raise ValueError("Item with the same name but different price already exists.")
+                pending[name] = {"name": name, "price": price, "quantity": quantity}
+            elif line["price"] != price:
+                raise ValueError("Item with the same name but different price already exists.")
+            else:
+                line["quantity"] += quantity
+        if malformed:
+            raise TypeError("Item must be a mapping or a (name, price[, quantity]) tuple.")
+        return pending
+
+    def _price_of(self, name: str):
+        """
+        Returns the price of the item with the given name, or None if it is not in the order.
+        """
+        if self._direct:
+            return next((item["price"] for item in self._items if item["name"] == name), None)
+        item = self._index.get(name)
+        return None if item is None else item["price"]
+
+    @staticmethod
+    def _columns_valid(names: List[Any], prices: List[Any], quantities: List[Any]) -> bool:
+        """
+        Checks columns of add_item arguments in bulk.
+
+        Only exact str/float/int types qualify, so a False result may still be valid input
+        (e.g. str subclasses) and must be re-checked row by row.
+        """
+        if not names:
+            return True
+        return (set(map(type, names)) <= {str} and set(map(type, prices)) <= {float, int}
+                and set(map(type, quantities)) <= {int} and all(names)
+                and min(quantities) >= 1 and min(prices) > 0)
+
+    @staticmethod
+    def _validate_item(name, price, quantity):
+        """
+        Validates the arguments of add_item.
+
+        :raises ValueError: If name is empty, quantity < 1 or price <= 0.
+        :raises TypeError: If inputs are of incorrect types.
+        """
         if not isinstance(name, str):
             raise TypeError("Item name must be a string.")
         if not isinstance(price, (float, int)):
@@ -74,19 +522,48 @@ class OrderCalculator:
         if price <= 0:
             raise ValueError("Price must be greater than 0.")
 
-        for item in self.items:
+    def _insert(self, item: Item):
+        """
+        Adds a new, validated item to the index, the items list and the totals.
+        """
+        self._version += 1
+        if self._items is not None:
+            item = self._tracked(item)
+            # Appended internally, so that the list is not marked as edited
+            list.append(self._items, item)
+        self._index[item["name"]] = item
+        self._add_to_totals(item["price"], item["quantity"])
+
+    def _add_to_list(self, name: str, price, quantity: int):
+        """
+        Adds a validated item to a list the order works on as given: the quantity of the
+        first line with the name is increased, otherwise a new item dict is appended.
+        """
+        self._version += 1
+        for item in self._items:
             if item["name"] == name:
                 if item["price"] != price:
                     raise ValueError("Item with the same name but different price already exists.")
                 item["quantity"] += quantity
                 return
+        self._items.append({"name": name, "price": price, "quantity": quantity})
 
+    def _has_item(self, name: str) -> bool:
+        """
+        Checks whether an item with the given name is in the order.
+        """
+        if self._direct:
+            return any(item["name"] == name for item in self._items)
+        return name in self._index
 
-        self.items.append({
-            "name": name,
-            "price": price,
-            "quantity": quantity
-        })
+    def _increase_quantity(self, item: Item, quantity: int):
+        """
+        Increases the quantity of an item already in the order.
+        """
+        self._version += 1
+        self._add_to_totals(item["price"], item["quantity"] + quantity, item["quantity"])
+        # Set internally, so that the item is not marked as edited
+        dict.__setitem__(item, "quantity", item["quantity"] + quantity)
 
     def remove_item(self, name: str):
         """
@@ -98,10 +575,50 @@ class OrderCalculator:
         """
         if not isinstance(name, str):
             raise TypeError("Item name must be a string.")
-        if not any(item["name"] == name for item in self.items):
+        self._sync()
+        if not self._has_item(name):
             raise ValueError(f"Item with name '{name}' does not exist in the order.")
 
-        self.items = [item for item in self.items if item["name"] != name]
+        self._discard((name,))
+
+    def remove_items(self, names: Iterable[str]):
+        """
+        Removes several items from the order at once.
+
+        All names are validated before the order is changed: if any name is invalid, missing
+        from the order or listed twice, the error remove_item would raise for it is raised
+        and the order is left unchanged.
+
+        :param names: The names of the items to remove.
+        :raises ValueError: If an item does not exist in the order (or is listed more than once).
+        :raises TypeError: If a name is not a string.
+        """
+        self._sync()
+        removing = set()
+        for name in names:
+            if not isinstance(name, str):
+                raise TypeError("Item name must be a string.")
+            if name in removing or not self._has_item(name):
+                raise ValueError(f"Item with name '{name}' does not exist in the order.")
+            removing.add(name)
+
+        if removing:
+            self._discard(removing)
+
+    def _discard(self, names):
+        """
+        Removes items with validated names from the index, the items list and the totals.
+        """
+        self._version += 1
+        if self._direct:
+            # Lists given directly may hold several lines with one name
+            self._items = [item for item in self._items if item["name"] not in names]
+            return
+
+        self._items = None
+        for name in names:
+            item = self._index.pop(name)
+            self._add_to_totals(item["price"], 0, item["quantity"])
 
     def get_subtotal(self) -> float:
         """
@@ -110,9 +627,42 @@ class OrderCalculator:
         :return: The subtotal as a float.
         :raises ValueError: If the order is empty.
         """
-        if not self.items:
+        self._sync()
+        if self.is_empty():
             raise ValueError("Cannot calculate subtotal on empty order.")
-        return sum(item["price"] * item["quantity"] for item in self.items)
+        subtotal = self._memo_get("subtotal")
+        if subtotal is None:
+            subtotal = self._compute_subtotal()
+            self._memo_put("subtotal", subtotal)
+        return subtotal
+
+    def _compute_subtotal(self) -> float:
+        """
+        Computes the subtotal from the maintained totals, re-summing the items if they are stale.
+        """
+        if self._direct:
+            if not self._exact_subtotal:
+                return sum(self._line_totals())
+            self._recount()
+        if self._exact_subtotal and self._subtotal_exact is not None:
+            try:
+                if self._float_lines:
+                    return self._subtotal_exact / _SUBTOTAL_SCALE
+                return self._subtotal_exact // _SUBTOTAL_SCALE
+            except OverflowError:
+                pass
+        subtotal = self._subtotal_sum
+        if subtotal is None:
+            subtotal = sum(self._line_totals())
+            if _SEQUENTIAL_SUM and not self._exact_subtotal:
+                self._subtotal_sum = subtotal
+        return subtotal
+
+    def _line_totals(self) -> Iterable:
+        """
+        Returns price * quantity of every line, in insertion order.
+        """
+        return (item["price"] * item["quantity"] for item in self._rows())
 
     def apply_discount(self, subtotal: float, discount: float) -> float:
         """
@@ -187,6 +737,21 @@ class OrderCalculator:
         if not isinstance(discount, (float, int)):
             raise TypeError("Discount must be a number.")
 
+        self._sync()
+        # Results depend on the configuration, and on the types as well as the values (0 vs 0.0)
+        key = ("total", type(discount), discount, type(self.tax_rate), self.tax_rate,
+               type(self.free_shipping_threshold), self.free_shipping_threshold,
+               type(self.shipping_cost), self.shipping_cost)
+        total = self._memo_get(key)
+        if total is None:
+            total = self._compute_total(discount)
+            self._memo_put(key, total)
+        return total
+
+    def _compute_total(self, discount) -> float:
+        """
+        Computes the total for a discount of a valid type (see calculate_total).
+        """
         subtotal = self.get_subtotal()
         if subtotal < 0.0:
             raise ValueError("Cannot calculate total on negative subtotal.")
@@ -202,13 +767,21 @@ class OrderCalculator:
         :return: The sum of the quantities of all items.
         :return:
         """
-        return sum(item["quantity"] for item in self.items)
+        self._sync()
+        if self._direct:
+            return sum(item["quantity"] for item in self._items)
+        return self._quantity
 
     def clear_order(self):
         """
         Removes all items from the order, resetting it to an empty state.
         """
-        self.items = []
+        self._version += 1
+        self._direct = False
+        self._edited = False
+        self._index = {}
+        self._items = None
+        self._reset_totals()
 
     def list_items(self) -> List[str]:
         """
@@ -216,7 +789,12 @@ class OrderCalculator:
 
         :return: A list of unique item names (no duplicates).
         """
-        return list(set(item["name"] for item in self.items))
+        self._sync()
+        names = self._memo_get("list_items")
+        if names is None:
+            names = list(set(item["name"] for item in self._rows()))
+            self._memo_put("list_items", names)
+        return list(names)
 
     def is_empty(self) -> bool:
         """
@@ -224,4 +802,4 @@ class OrderCalculator:
 
         :return: True if no items are in the order, False otherwise.
         """
-        return len(self.items) == 0
\ No newline at end of file
+        return len(self._rows()) == 0
\ No newline at end of file
@@ -0,0 +1,504 @@
+"""
+Append-only change journal and binary snapshots for orders.
+
+JournaledOrderCalculator persists an order to a directory at O(change) cost:
+every successful add_item, add_items, remove_item, remove_items, clear_order,
+items assignment or pricing setting change appends one record to the journal,
+instead of re-serializing the whole order. checkpoint() writes a compact
+binary snapshot of the full order and starts an empty journal; restoring an
+order loads the last snapshot and replays the journal tail.
+
+Files in the order directory:
+    snapshot.bin  Full order at the last checkpoint: settings, then columns of
+                  name lengths, UTF-8 names, prices and quantities (raw
+                  float64/int64 arrays when all values fit, tagged values
+                  otherwise), CRC-checked.
+    journal.bin   Changes since that checkpoint, one length + CRC framed
+                  record per change.
+
+Snapshot and journal share a random ID, and both are replaced atomically
+(temp file + os.replace), so an interrupted checkpoint leaves either the old
+pair or a new snapshot whose journal is ignored. A torn record at the end of
+the journal (crash mid-append) is dropped on restore. Records are written
+after the change is applied in memory; with sync=True each one is also
+fsynced. Changes made to the items list or its item dicts directly are
+journaled (as a full items record) by the next operation, checkpoint() or
+close(), which then compare the items with the last journaled state (O(n)).
+
+Usage:
+    order = JournaledOrderCalculator.open("carts/cart-42")
+    order.add_item("book", 19.99, 3)    # appends one journal record
+    order.checkpoint()                  # snapshot, empty journal
+    order.close()
+
+    order = JournaledOrderCalculator.open("carts/cart-42")   # snapshot + journal tail
+"""
+
+import os
+import sys
+import zlib
+import struct
+import secrets
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from order_calculator import Item, OrderCalculator
+
+SNAPSHOT_MAGIC = b"OCSNAP1\n"
+JOURNAL_MAGIC = b"OCJRNL1\n"
+SNAPSHOT_FILE = "snapshot.bin"
+JOURNAL_FILE = "journal.bin"
+
+SETTINGS = ("tax_rate", "free_shipping_threshold", "shipping_cost")
+
+_ID_SIZE = 16
+_FRAME = struct.Struct("<II")
+_UINT32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+
+# Journal record types
+OP_ADD = b"A"
+OP_ADD_MANY = b"B"
+OP_REMOVE = b"R"
+OP_REMOVE_MANY = b"M"
+OP_CLEAR = b"C"
+OP_SET_ITEMS = b"S"
+OP_SETTING = b"T"
+
+
+def _pack_number(value) -> bytes:
+    if isinstance(value, float):
+        return b"d" + struct.pack("<d", value)
+    value = int(value)
+    if -2 ** 63 <= value < 2 ** 63:
+        return b"q" + struct.pack("<q", value)
+    text = str(value).encode("ascii")
+    return b"n" + _UINT32.pack(len(text)) + text
+
+
+def _pack_name(name: str) -> bytes:
+    data = name.encode("utf-8", "surrogatepass")
+    return _UINT32.pack(len(data)) + data
+
+
+def _pack_rows(rows: Iterable[Tuple[str, Any, int]]) -> List[bytes]:
+    return [_pack_name(name) + _pack_number(price) + _pack_number(quantity) for name, price, quantity in rows]
+
+
+def _pack_items(items: List[Item]) -> bytes:
+    return _UINT32.pack(len(items)) + b"".join(
+        _pack_rows((item["name"], item["price"], item["quantity"]) for item in items))
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _pack_column(values: List[Any], typecode: str, value_type: type) -> bytes:
+    """
+    Packs a column as a raw little-endian array if every value has the exact type and fits,
+    otherwise as tagged values.
+    """
+    if all(type(value) is value_type for value in values):
+        try:
+            return b"a" + _little_endian(array(typecode, values))
+        except OverflowError:
+            pass
+    return b"v" + b"".join(_pack_number(value) for value in values)
+
+
+class _Reader:
+    """
+    Sequential decoder over a bytes buffer.
+    """
+
+    def __init__(self, data: bytes, position: int = 0):
+        self.data = data
+        self.position = position
+
+    def take(self, size: int) -> bytes:
+        end = self.position + size
+        if end > len(self.data):
+            raise ValueError("Truncated order data.")
+        chunk = self.data[self.position:end]
+        self.position = end
+        return chunk
+
+    def uint32(self) -> int:
+        return _UINT32.unpack(self.take(4))[0]
+
+    def uint64(self) -> int:
+        return _UINT64.unpack(self.take(8))[0]
+
+    def number(self):
+        tag = self.take(1)
+        if tag == b"d":
+            return struct.unpack("<d", self.take(8))[0]
+        if tag == b"q":
+            return struct.unpack("<q", self.take(8))[0]
+        if tag == b"n":
+            return int(self.take(self.uint32()).decode("ascii"))
+        raise ValueError(f"Unknown number tag {tag!r} in order data.")
+
+    def name(self) -> str:
+        return self.take(self.uint32()).decode("utf-8", "surrogatepass")
+
+    def rows(self) -> List[Tuple[str, Any, int]]:
+        return [(self.name(), self.number(), self.number()) for _ in range(self.uint32())]
+
+    def column(self, count: int, typecode: str) -> List[Any]:
+        if self.take(1) == b"v":
+            return [self.number() for _ in range(count)]
+        values = array(typecode)
+        values.frombytes(self.take(count * values.itemsize))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+
+
+def _frame(payload: bytes) -> bytes:
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def encode_snapshot(order: OrderCalculator, journal_id: bytes = bytes(_ID_SIZE)) -> bytes:
+    """
+    Encodes the settings and items of an order as a compact binary snapshot.
+
+    :param order: The order to encode.
+    :param journal_id: ID of the journal that continues from this snapshot.
+    :return: The snapshot bytes.
+    """
+    items = order.items
+    names = [item["name"].encode("utf-8", "surrogatepass") for item in items]
+    body = [
+        journal_id,
+        b"".join(_pack_number(getattr(order, setting)) for setting in SETTINGS),
+        _UINT64.pack(len(items)),
+        _little_endian(array("I", map(len, names))),
+        b"".join(names),
+        _pack_column([item["price"] for item in items], "d", float),
+        _pack_column([item["quantity"] for item in items], "q", int),
+    ]
+    return SNAPSHOT_MAGIC + _frame(b"".join(body))
+
+
+def decode_snapshot(data: bytes) -> Tuple[bytes, Dict[str, Any], List[Item]]:
+    """
+    Decodes a snapshot produced by encode_snapshot.
+
+    :param data: The snapshot bytes.
+    :return: Tuple of (journal ID, settings, items).
+    :raises ValueError: If the data is not a valid snapshot.
+    """
+    if not data.startswith(SNAPSHOT_MAGIC):
+        raise ValueError("Not an order snapshot.")
+    length, crc = _FRAME.unpack_from(data, len(SNAPSHOT_MAGIC))
+    body = data[len(SNAPSHOT_MAGIC) + _FRAME.size:]
+    if len(body) != length or zlib.crc32(body) != crc:
+        raise ValueError("Order snapshot is corrupt.")
+
+    reader = _Reader(body)
+    journal_id = reader.take(_ID_SIZE)
+    settings = {setting: reader.number() for setting in SETTINGS}
+    count = reader.uint64()
+    lengths = array("I")
+    lengths.frombytes(reader.take(count * lengths.itemsize))
+    if sys.byteorder == "big":
+        lengths.byteswap()
+    blob = reader.take(sum(lengths))
+    names, start = [], 0
+    for size in lengths:
+        names.append(blob[start:start + size].decode("utf-8", "surrogatepass"))
+        start += size
+    prices = reader.column(count, "d")
+    quantities = reader.column(count, "q")
+    items = [{"name": name, "price": price, "quantity": quantity}
+             for name, price, quantity in zip(names, prices, quantities)]
+    return journal_id, settings, items
+
+
+def _apply(order: OrderCalculator, record: bytes):
+    """
+    Applies one journal record to an order.
+    """
+    reader = _Reader(record)
+    op = reader.take(1)
+    if op == OP_ADD:
+        order.add_item(reader.name(), reader.number(), reader.number())
+    elif op == OP_ADD_MANY:
+        order.add_items(reader.rows())
+    elif op == OP_REMOVE:
+        order.remove_item(reader.name())
+    elif op == OP_REMOVE_MANY:
+        order.remove_items([reader.name() for _ in range(reader.uint32())])
+    elif op == OP_CLEAR:
+        order.clear_order()
+    elif op == OP_SET_ITEMS:
+        order._load_items({"name": name, "price": price, "quantity": quantity}
+                          for name, price, quantity in reader.rows())
+    elif op == OP_SETTING:
+        setattr(order, reader.name(), reader.number())
+    else:
+        raise ValueError(f"Unknown journal record {op!r}.")
+
+
+class OrderJournal:
+    """
+    The snapshot and journal files of one order directory.
+    """
+
+    def __init__(self, directory, sync: bool = False):
+        self.directory = Path(directory)
+        self.snapshot_path = self.directory / SNAPSHOT_FILE
+        self.journal_path = self.directory / JOURNAL_FILE
+        self.sync = sync
+        self._file = None
+
+    def exists(self) -> bool:
+        return self.snapshot_path.exists()
+
+    def _write_atomic(self, path: Path, data: bytes):
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            if self.sync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _open_for_append(self):
+        self.close()
+        self._file = open(self.journal_path, "ab")
+
+    def append(self, record: bytes):
+        """
+        Appends one framed record to the journal.
+        """
+        self._file.write(_frame(record))
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    def checkpoint(self, order: OrderCalculator):
+        """
+        Writes a snapshot of the order and starts an empty journal after it.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        journal_id = secrets.token_bytes(_ID_SIZE)
+        self._write_atomic(self.snapshot_path, encode_snapshot(order, journal_id))
+        self._write_atomic(self.journal_path, JOURNAL_MAGIC + journal_id)
+        self._open_for_append()
+
+    def load(self, order_class) -> Tuple[OrderCalculator, int]:
+        """
+        Restores an order from the last snapshot and the journal tail.
+
+        :param order_class: OrderCalculator or a subclass to restore into.
+        :return: Tuple of (order, number of journal records replayed).
+        :raises ValueError: If the snapshot is missing or corrupt.
+        """
+        if not self.exists():
+            raise ValueError(f"No order snapshot in {self.directory}.")
+        journal_id, settings, items = decode_snapshot(self.snapshot_path.read_bytes())
+        order = order_class(**settings)
+        order._load_items(items)
+
+        header = JOURNAL_MAGIC + journal_id
+        data = self.journal_path.read_bytes() if self.journal_path.exists() else b""
+        replayed = 0
+        if data.startswith(header):
+            position = len(header)
+            while position + _FRAME.size <= len(data):
+                length, crc = _FRAME.unpack_from(data, position)
+                record = data[position + _FRAME.size:position + _FRAME.size + length]
+                if len(record) != length or zlib.crc32(record) != crc:
+                    break
+                _apply(order, record)
+                position += _FRAME.size + length
+                replayed += 1
+            if position < len(data):
+                # Drop a torn record left by an interrupted append
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(position)
+        else:
+            # Missing journal, or one from before an interrupted checkpoint
+            self._write_atomic(self.journal_path, header)
+        self._open_for_append()
+        return order, replayed
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _journaled_setting(name: str) -> property:
+    """
+    A pricing setting whose assignment is journaled.
+    """
+    private_name = "_" + name
+
+    def fget(self):
+        return getattr(self, private_name)
+
+    def fset(self, value):
+        setattr(self, private_name, value)
+        self._record(OP_SETTING + _pack_name(name) + _pack_number(value))
+
+    return property(fget, fset)
+
+
+class JournaledOrderCalculator(OrderCalculator):
+    tax_rate = _journaled_setting("tax_rate")
+    free_shipping_threshold = _journaled_setting("free_shipping_threshold")
+    shipping_cost = _journaled_setting("shipping_cost")
+
+    def __init__(self, tax_rate=0.23, free_shipping_threshold=100.0, shipping_cost=10.0,
+                 journal: Optional[OrderJournal] = None):
+        """
+        Initializes a new OrderCalculator instance that records its changes to a journal.
+
+        :param tax_rate: As for OrderCalculator.
+        :param free_shipping_threshold: As for OrderCalculator.
+        :param shipping_cost: As for OrderCalculator.
+        :param journal: The journal to record to; None records nothing until one is attached by open().
+        :raises ValueError: As for OrderCalculator.
+        :raises TypeError: As for OrderCalculator.
+        """
+        self._journal = None
+        # Packed items as last journaled, while the order works on a list as given
+        self._journaled_items: Optional[bytes] = None
+        super().__init__(tax_rate, free_shipping_threshold, shipping_cost)
+        self._journal = journal
+
+    @classmethod
+    def open(cls, directory, tax_rate=0.23, free_shipping_threshold=100.0, shipping_cost=10.0,
+             sync: bool = False) -> 'JournaledOrderCalculator':
+        """
+        Restores the order persisted in a directory, or starts a new one there.
+
+        :param directory: The order directory.
+        :param tax_rate: As for OrderCalculator; only used for a new order.
+        :param free_shipping_threshold: As for OrderCalculator; only used for a new order.
+        :param shipping_cost: As for OrderCalculator; only used for a new order.
+        :param sync: Whether to fsync every journal record and snapshot.
+        :return: The order, recording to the directory's journal.
+        :raises ValueError: If the snapshot is corrupt.
+        """
+        journal = OrderJournal(directory, sync)
+        if journal.exists():
+            order, _ = journal.load(cls)
+        else:
+            order = cls(tax_rate, free_shipping_threshold, shipping_cost)
+            journal.checkpoint(order)
+        order._journal = journal
+        return order
+
+    def _record(self, record: bytes):
+        if self._journal is not None:
+            self._journal.append(record)
+            self._journaled_items = _pack_items(self._items) if self._direct else None
+
+    def _journal_items(self):
+        """
+        Journals a full items record if the order works on a list as given that changed since it was last journaled.
+        """
+        if self._journal is None or not self._direct:
+            return
+        packed = _pack_items(self._items)
+        if packed != self._journaled_items:
+            self._journal.append(OP_SET_ITEMS + packed)
+            self._journaled_items = packed
+
+    @contextmanager
+    def _operation(self):
+        """
+        Runs one journaled operation; items changed directly beforehand are journaled first.
+        """
+        self._sync()
+        self._journal_items()
+        yield
+
+    def checkpoint(self):
+        """
+        Writes a snapshot of the order and empties the journal.
+
+        :raises ValueError: If no journal is attached.
+        """
+        if self._journal is None:
+            raise ValueError("Order has no journal.")
+        self._sync()
+        self._journal.checkpoint(self)
+        if self._direct:
+            self._journaled_items = _pack_items(self._items)
+
+    def close(self):
+        """
+        Journals changes made to the items directly, then closes the journal file;
+        the order stops recording changes.
+        """
+        if self._journal is not None:
+            self._sync()
+            self._journal_items()
+            self._journal.close()
+            self._journal = None
+
+    @property
+    def items(self) -> List[Item]:
+        """
+        The items in the order, as OrderCalculator.items; assigning a new list is journaled.
+        """
+        return OrderCalculator.items.fget(self)
+
+    @items.setter
+    def items(self, items: List[Item]):
+        OrderCalculator.items.fset(self, items)
+        self._journal_items()
+
+    def add_item(self, name: str, price: float, quantity: int = 1):
+        """
+        As OrderCalculator.add_item, journaled.
+        """
+        with self._operation():
+            super().add_item(name, price, quantity)
+        self._record(OP_ADD + b"".join(_pack_rows([(name, price, quantity)])))
+
+    def add_items(self, items: Iterable[Union[Mapping[str, Any], tuple]]):
+        """
+        As OrderCalculator.add_items, journaled as one record.
+        """
+        with self._operation():
+            pending = self._pending_items(*self._item_columns(items))
+            self._apply_pending(pending)
+        self._record(OP_ADD_MANY + _UINT32.pack(len(pending)) + b"".join(
+            _pack_rows((line["name"], line["price"], line["quantity"]) for line in pending.values())))
+
+    def remove_item(self, name: str):
+        """
+        As OrderCalculator.remove_item, journaled.
+        """
+        with self._operation():
+            super().remove_item(name)
+        self._record(OP_REMOVE + _pack_name(name))
+
+    def remove_items(self, names: Iterable[str]):
+        """
+        As OrderCalculator.remove_items, journaled as one record.
+        """
+        names = list(names)
+        with self._operation():
+            super().remove_items(names)
+        self._record(OP_REMOVE_MANY + _UINT32.pack(len(names)) + b"".join(map(_pack_name, names)))
+
+    def clear_order(self):
+        """
+        As OrderCalculator.clear_order, journaled.
+        """
+        with self._operation():
+            super().clear_order()
+        self._record(OP_CLEAR)
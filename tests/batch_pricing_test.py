@@ -0,0 +1,91 @@
+import math
+import random
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+import batch_pricing
+from batch_pricing import columns_from_orders, price_discounts, price_orders
+from order_calculator import OrderCalculator
+
+
+def random_orders(seed, n_orders=2000, max_lines=12, exact_subtotal=False):
+    rng = random.Random(seed)
+    catalog = [rng.choice([0.1, 0.2, 0.3, 0.7, 19.99, 1e-3, 3e5]) for _ in range(max_lines)]
+    orders = []
+    for _ in range(n_orders):
+        calc = OrderCalculator(exact_subtotal=exact_subtotal)
+        for line in range(rng.randint(1, max_lines)):
+            sku = rng.randrange(max_lines)
+            calc.add_item(f"sku-{sku}", catalog[sku], rng.randint(1, 5))
+        if len(calc.items) > 1 and rng.random() < 0.3:
+            calc.remove_item(calc.items[0]["name"])
+        orders.append(calc)
+    discounts = np.array([rng.choice([0.0, 0.05, 0.1, 0.25]) for _ in orders])
+    return orders, discounts
+
+
+def compensated_sum(values):
+    """The compensated sum() of Python 3.12+ for floats."""
+    total, compensation = 0.0, 0.0
+    for value in values:
+        partial = total + value
+        if abs(total) >= abs(value):
+            compensation += (total - partial) + value
+        else:
+            compensation += (value - partial) + total
+        total = partial
+    if compensation and math.isfinite(compensation):
+        total += compensation
+    return total
+
+
+class TestPriceOrders(unittest.TestCase):
+
+    def test_totals_match_default_orders(self):
+        orders, discounts = random_orders(seed=1)
+        result = price_orders(*columns_from_orders(orders), discounts)
+        for i, (order, discount) in enumerate(zip(orders, discounts)):
+            self.assertEqual(result.subtotal[i], order.get_subtotal())
+            self.assertEqual(result.total[i], order.calculate_total(float(discount)))
+
+    def test_threshold_decision_matches_order_sum(self):
+        calc = OrderCalculator(free_shipping_threshold=0.6000000000000001)
+        for name, price in (("a", 0.1), ("b", 0.2), ("c", 0.3)):
+            calc.add_item(name, price)
+        result = price_orders(*columns_from_orders([calc]), free_shipping_threshold=0.6000000000000001)
+        # sum() gives exactly the threshold here, while the correctly rounded subtotal is 0.6
+        self.assertEqual(result.shipping[0], 0.0)
+        self.assertEqual(result.total[0], calc.calculate_total())
+
+    def test_long_orders_match_default_orders(self):
+        orders, discounts = random_orders(seed=2, n_orders=20, max_lines=600)
+        self.assertGreater(max(len(order.items) for order in orders), batch_pricing._MAX_VECTORIZED_LINES)
+        result = price_orders(*columns_from_orders(orders), discounts)
+        self.assertEqual(result.total.tolist(), [o.calculate_total(float(d)) for o, d in zip(orders, discounts)])
+
+    def test_compensated_summation(self):
+        orders, _ = random_orders(seed=3)
+        prices, quantities, offsets = columns_from_orders(orders)
+        with mock.patch.object(batch_pricing, "_SEQUENTIAL_SUM", False):
+            result = price_orders(prices, quantities, offsets)
+        line_totals = (prices * quantities).tolist()
+        expected = [compensated_sum(line_totals[offsets[i]:offsets[i + 1]]) for i in range(len(orders))]
+        self.assertEqual(result.subtotal.tolist(), expected)
+
+    def test_exact_matches_exact_subtotal_orders(self):
+        orders, discounts = random_orders(seed=4, exact_subtotal=True)
+        result = price_orders(*columns_from_orders(orders), discounts, exact=True)
+        self.assertEqual(result.total.tolist(), [o.calculate_total(float(d)) for o, d in zip(orders, discounts)])
+
+    def test_discount_grid_matches_calculate_total(self):
+        orders, _ = random_orders(seed=5, n_orders=1)
+        grid = np.linspace(0.0, 1.0, 101)
+        result = price_discounts(orders[0], grid)
+        self.assertEqual(result.total.tolist(), [orders[0].calculate_total(float(d)) for d in grid])
+
+
+if __name__ == '__main__':
+    unittest.main()
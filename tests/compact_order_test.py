@@ -0,0 +1,81 @@
+import random
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import compact_order
+from compact_order import CompactOrderCalculator
+from order_calculator import OrderCalculator
+
+
+def random_operations(seed, steps=3000):
+    """Returns a list of (method name, args) of adds, bulk adds and removals of existing items."""
+    rng = random.Random(seed)
+    prices = {}
+    live = set()
+    operations = []
+    for step in range(steps):
+        roll = rng.random()
+        if roll < 0.55 or not live:
+            name = f"item-{rng.randrange(400)}"
+            price = prices.setdefault(name, rng.choice([0.1, 0.2, 0.3, 19.99, round(rng.uniform(0.01, 50.0), 2)]))
+            operations.append(("add_item", (name, price, rng.randint(1, 4))))
+            live.add(name)
+        elif roll < 0.9:
+            name = rng.choice(sorted(live))
+            operations.append(("remove_item", (name,)))
+            live.discard(name)
+        else:
+            batch = [(f"bulk-{step}-{i}", 0.1 * (i + 1), i + 1) for i in range(3)]
+            operations.append(("add_items", (batch,)))
+            live.update(name for name, _, _ in batch)
+    return operations
+
+
+class TestCompactOrder(unittest.TestCase):
+
+    def assert_same_results(self, compact, reference):
+        self.assertEqual(compact.items, reference.items)
+        self.assertEqual(compact.total_items(), reference.total_items())
+        self.assertEqual(sorted(compact.list_items()), sorted(reference.list_items()))
+        self.assertEqual(compact.is_empty(), reference.is_empty())
+        if not reference.is_empty():
+            self.assertEqual(compact.get_subtotal(), reference.get_subtotal())
+            for discount in (0.0, 0.1, 0.5):
+                self.assertEqual(compact.calculate_total(discount), reference.calculate_total(discount))
+
+    def test_results_match_default_order(self):
+        compact, reference = CompactOrderCalculator(), OrderCalculator()
+        for step, (method, args) in enumerate(random_operations(seed=1)):
+            getattr(compact, method)(*args)
+            getattr(reference, method)(*args)
+            if step % 50 == 0:
+                self.assert_same_results(compact, reference)
+                compact.check_consistency()
+        self.assert_same_results(compact, reference)
+
+    def test_results_match_after_compaction(self):
+        compact, reference = CompactOrderCalculator(), OrderCalculator()
+        with mock.patch.object(compact_order, "_MIN_COMPACT_ROWS", 8):
+            for method, args in random_operations(seed=2):
+                getattr(compact, method)(*args)
+                getattr(reference, method)(*args)
+        compact.check_consistency()
+        self.assert_same_results(compact, reference)
+
+    def test_subtotal_after_removal_reads_columns(self):
+        compact = CompactOrderCalculator()
+        compact.add_items((f"sku-{i}", 0.1 * (i + 1), 1) for i in range(100))
+        compact.remove_item("sku-3")
+        expected = sum(0.1 * (i + 1) for i in range(100) if i != 3)
+
+        def items(order):
+            raise AssertionError("get_subtotal built the items list")
+
+        with mock.patch.object(CompactOrderCalculator, "items", property(items)):
+            self.assertEqual(compact.get_subtotal(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from compact_order_test import random_operations
+from concurrent_order import ConcurrentOrderCalculator
+from order_calculator import OrderCalculator
+
+
+class TestConcurrentOrder(unittest.TestCase):
+
+    def assert_same_results(self, snapshot, reference):
+        self.assertEqual(snapshot.items, reference.items)
+        self.assertEqual(snapshot.total_items(), reference.total_items())
+        self.assertEqual(sorted(snapshot.list_items()), sorted(reference.list_items()))
+        self.assertEqual(snapshot.is_empty(), reference.is_empty())
+        if not reference.is_empty():
+            self.assertEqual(snapshot.get_subtotal(), reference.get_subtotal())
+            for discount in (0.0, 0.1, 0.5):
+                self.assertEqual(snapshot.calculate_total(discount), reference.calculate_total(discount))
+
+    def test_snapshots_match_default_order(self):
+        for exact in (False, True):
+            order, reference = ConcurrentOrderCalculator(exact_subtotal=exact), OrderCalculator(exact_subtotal=exact)
+            for step, (method, args) in enumerate(random_operations(seed=3)):
+                getattr(order, method)(*args)
+                getattr(reference, method)(*args)
+                if step % 50 == 0:
+                    self.assert_same_results(order.snapshot(), reference)
+                    order.check_consistency()
+            self.assert_same_results(order, reference)
+
+    def test_snapshot_is_not_changed_by_later_writes(self):
+        order, reference = ConcurrentOrderCalculator(), OrderCalculator()
+        order.add_items([("a", 0.1, 2), ("b", 0.2)])
+        reference.add_items([("a", 0.1, 2), ("b", 0.2)])
+        snapshot = order.snapshot()
+        order.add_item("a", 0.1)
+        order.remove_item("b")
+        order.tax_rate = 0.5
+        self.assert_same_results(snapshot, reference)
+
+    def test_initial_snapshot_has_settings(self):
+        order = ConcurrentOrderCalculator(tax_rate=0.1, free_shipping_threshold=50.0, shipping_cost=5.0)
+        snapshot = order.snapshot()
+        self.assertEqual((snapshot.tax_rate, snapshot.free_shipping_threshold, snapshot.shipping_cost),
+                         (0.1, 50.0, 5.0))
+        self.assertTrue(order.is_empty())
+        with self.assertRaises(ValueError):
+            order.get_subtotal()
+
+
+if __name__ == '__main__':
+    unittest.main()
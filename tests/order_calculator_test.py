@@ -0,0 +1,169 @@
+import math
+import random
+import unittest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from order_calculator import OrderCalculator
+
+
+def random_changes(calc, seed, steps=2000):
+    """Adds, increases and removes random lines; returns the expected lines as name -> [price, quantity]."""
+    rng = random.Random(seed)
+    lines = {}
+    for step in range(steps):
+        roll = rng.random()
+        if roll < 0.5 or not lines:
+            name = f"item-{rng.randrange(300)}"
+            price = lines[name][0] if name in lines else round(rng.uniform(0.01, 50.0), 2)
+            quantity = rng.randint(1, 4)
+            calc.add_item(name, price, quantity)
+            lines.setdefault(name, [price, 0])[1] += quantity
+        elif roll < 0.8:
+            name = rng.choice(list(lines))
+            calc.remove_item(name)
+            del lines[name]
+        elif roll < 0.9:
+            calc.add_items((f"bulk-{step}-{i}", 0.1 * (i + 1), i + 1) for i in range(3))
+            for i in range(3):
+                lines[f"bulk-{step}-{i}"] = [0.1 * (i + 1), i + 1]
+        else:
+            yield lines
+    yield lines
+
+
+class TestOrderTotals(unittest.TestCase):
+
+    def test_default_subtotal_is_plain_sum(self):
+        calc = OrderCalculator()
+        for name, price in (("a", 0.1), ("b", 0.2), ("c", 0.3)):
+            calc.add_item(name, price)
+        self.assertEqual(calc.get_subtotal(), 0.1 + 0.2 + 0.3)
+
+    def test_exact_subtotal_is_correctly_rounded(self):
+        calc = OrderCalculator(exact_subtotal=True)
+        for name, price in (("a", 0.1), ("b", 0.2), ("c", 0.3)):
+            calc.add_item(name, price)
+        self.assertTrue(calc.exact_subtotal)
+        self.assertEqual(calc.get_subtotal(), 0.6)
+
+    def test_exact_subtotal_must_be_bool(self):
+        with self.assertRaises(TypeError):
+            OrderCalculator(exact_subtotal=1)
+
+    def test_default_totals_match_fresh_summation(self):
+        calc = OrderCalculator()
+        for lines in random_changes(calc, seed=1):
+            if not lines:
+                continue
+            self.assertEqual(calc.get_subtotal(), sum(price * quantity for price, quantity in lines.values()))
+            self.assertEqual(calc.total_items(), sum(quantity for _, quantity in lines.values()))
+            calc.check_consistency()
+
+    def test_exact_totals_match_fsum(self):
+        calc = OrderCalculator(exact_subtotal=True)
+        for lines in random_changes(calc, seed=2):
+            if not lines:
+                continue
+            self.assertEqual(calc.get_subtotal(), math.fsum(price * quantity for price, quantity in lines.values()))
+            calc.check_consistency()
+
+    def test_integer_prices_give_integer_subtotal(self):
+        for exact in (False, True):
+            calc = OrderCalculator(exact_subtotal=exact)
+            calc.add_item("a", 3, 2)
+            calc.add_item("b", 4)
+            calc.add_item("a", 3)
+            self.assertEqual(calc.get_subtotal(), 13)
+            self.assertIsInstance(calc.get_subtotal(), int)
+
+    def test_check_consistency_detects_drift(self):
+        for exact in (False, True):
+            calc = OrderCalculator(exact_subtotal=exact)
+            calc.add_item("a", 1.5, 2)
+            calc.check_consistency()
+            calc._quantity += 1
+            with self.assertRaises(AssertionError):
+                calc.check_consistency()
+
+    def test_calculate_total_matches_scalar_steps(self):
+        calc = OrderCalculator()
+        calc.add_items([("a", 19.99, 3), ("b", 0.1, 7), ("c", 5.25)])
+        calc.remove_item("b")
+        calc.add_item("c", 5.25, 2)
+        subtotal = 19.99 * 3 + 5.25 * 3
+        discounted = subtotal * (1 - 0.1)
+        shipping = 0.0 if discounted >= 100.0 else 10.0
+        self.assertEqual(calc.calculate_total(0.1), discounted + shipping + (discounted + shipping) * 0.23)
+
+
+class TestDirectChanges(unittest.TestCase):
+
+    def test_appended_dict_is_kept(self):
+        calc = OrderCalculator()
+        calc.add_item("a", 2.0)
+        item = {"name": "b", "price": 2.0, "quantity": 1}
+        calc.items.append(item)
+        item["quantity"] = 4
+        self.assertEqual((calc.total_items(), calc.get_subtotal()), (5, 10.0))
+        self.assertIs(calc.items[1], item)
+
+    def test_item_dict_changes_are_seen(self):
+        calc = OrderCalculator()
+        calc.add_item("a", 10.0)
+        self.assertEqual(calc.calculate_total(), 24.6)
+        calc.items[0]["quantity"] = 5
+        self.assertEqual((calc.total_items(), calc.get_subtotal()), (5, 50.0))
+        calc.items[0]["price"] = -50
+        with self.assertRaises(ValueError):
+            calc.calculate_total()
+        calc.items[0] = {"name": "b", "price": 1.5, "quantity": 2}
+        self.assertEqual((calc.list_items(), calc.get_subtotal()), (["b"], 3.0))
+
+    def test_partial_items_do_not_break_reads(self):
+        calc = OrderCalculator()
+        calc.items.append({"name": "x"})
+        self.assertEqual(calc.list_items(), ["x"])
+        self.assertFalse(calc.is_empty())
+        calc.items = [{"quantity": "2"}]
+        self.assertFalse(calc.is_empty())
+        with self.assertRaises(KeyError):
+            calc.get_subtotal()
+
+    def test_assigned_list_is_used_as_given(self):
+        items = [{"name": "a", "price": 1.5, "quantity": 2}, {"name": "a", "price": 1.5, "quantity": 1}]
+        calc = OrderCalculator()
+        calc.items = items
+        self.assertIs(calc.items, items)
+        items.append({"name": "b", "price": 0.1, "quantity": 3})
+        calc.add_item("a", 1.5)
+        self.assertEqual([item["quantity"] for item in items], [3, 1, 3])
+        self.assertEqual(calc.get_subtotal(), 1.5 * 3 + 1.5 + 0.1 * 3)
+        calc.remove_item("a")
+        self.assertEqual(calc.items, [{"name": "b", "price": 0.1, "quantity": 3}])
+
+    def test_clear_order_stops_using_the_list(self):
+        calc = OrderCalculator()
+        items = calc.items
+        items.append({"name": "a", "price": 1.0, "quantity": 1})
+        calc.clear_order()
+        items.append({"name": "b", "price": 1.0, "quantity": 1})
+        self.assertTrue(calc.is_empty())
+        calc.add_item("c", 2.0)
+        self.assertEqual(calc.items, [{"name": "c", "price": 2.0, "quantity": 1}])
+        calc.check_consistency()
+
+    def test_removed_items_are_not_tracked(self):
+        calc = OrderCalculator()
+        calc.add_items([("a", 1.0), ("b", 2.0)])
+        items = calc.items
+        removed = items[0]
+        calc.remove_item("a")
+        removed["quantity"] = 10
+        items.append({"name": "c", "price": 3.0, "quantity": 1})
+        self.assertEqual((calc.total_items(), calc.get_subtotal()), (1, 2.0))
+        calc.check_consistency()
+
+
+if __name__ == '__main__':
+    unittest.main()
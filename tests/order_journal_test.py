@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from compact_order_test import random_operations
+from order_calculator import OrderCalculator
+from order_journal import JOURNAL_FILE, JournaledOrderCalculator, OrderJournal
+
+
+class TestOrderJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name) / "order"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assert_restored(self, order, reference):
+        order.close()
+        restored = JournaledOrderCalculator.open(self.directory)
+        try:
+            for expected in (order, reference):
+                self.assertEqual(restored.items, expected.items)
+                self.assertEqual(restored.total_items(), expected.total_items())
+                self.assertEqual(restored.is_empty(), expected.is_empty())
+                if not expected.is_empty():
+                    self.assertEqual(restored.get_subtotal(), expected.get_subtotal())
+                    self.assertEqual(restored.calculate_total(0.1), expected.calculate_total(0.1))
+            restored.check_consistency()
+        finally:
+            restored.close()
+
+    def test_replay_rebuilds_the_order(self):
+        order, reference = JournaledOrderCalculator.open(self.directory), OrderCalculator()
+        for step, (method, args) in enumerate(random_operations(seed=4, steps=1500)):
+            getattr(order, method)(*args)
+            getattr(reference, method)(*args)
+            if step == 700:
+                order.checkpoint()
+        order.tax_rate = reference.tax_rate = 0.08
+        self.assert_restored(order, reference)
+
+    def test_replay_after_clear(self):
+        order, reference = JournaledOrderCalculator.open(self.directory), OrderCalculator()
+        for calc in (order, reference):
+            calc.add_items([("a", 0.1, 3), ("b", 0.2)])
+            calc.clear_order()
+            calc.add_item("c", 0.3)
+        self.assert_restored(order, reference)
+
+    def test_direct_changes_are_journaled(self):
+        order, reference = JournaledOrderCalculator.open(self.directory), OrderCalculator()
+        for calc in (order, reference):
+            calc.add_items([("a", 0.1, 3), ("b", 0.2)])
+            item = {"name": "c", "price": 0.3, "quantity": 1}
+            calc.items.append(item)
+            calc.add_item("d", 0.7)
+            item["quantity"] = 4
+            calc.remove_item("a")
+            calc.items[0]["quantity"] = 2
+        self.assert_restored(order, reference)
+
+    def test_assigned_list_is_journaled(self):
+        order, reference = JournaledOrderCalculator.open(self.directory), OrderCalculator()
+        for calc in (order, reference):
+            calc.items = [{"name": "a", "price": 0.1, "quantity": 1}, {"name": "a", "price": 0.1, "quantity": 2}]
+            calc.add_item("a", 0.1)
+        order.checkpoint()
+        self.assert_restored(order, reference)
+
+    def test_torn_record_is_dropped(self):
+        order = JournaledOrderCalculator.open(self.directory)
+        order.add_item("a", 1.5, 2)
+        order.add_item("b", 2.5)
+        order.close()
+        journal_path = self.directory / JOURNAL_FILE
+        journal_path.write_bytes(journal_path.read_bytes()[:-3])
+        journal = OrderJournal(self.directory)
+        restored, replayed = journal.load(OrderCalculator)
+        journal.close()
+        self.assertEqual(replayed, 1)
+        self.assertEqual(restored.items, [{"name": "a", "price": 1.5, "quantity": 2}])
+
+
+if __name__ == '__main__':
+    unittest.main()